@@ -8,7 +8,25 @@ from .label import Label
 from .divider import Divider
 from .textinput import TextInput
 from .image import ImageBox
-from .dialog import Dialog, MessageButtons, MessageIcon
-from .notify import NotifyIcon
+from .dialog import Dialog, DialogFuture, MessageButtons, MessageIcon
+from .notify import NotifyIcon, NotificationQueue, TrayIconRenderer
 from .color import Color
-from .font import Font, Style
\ No newline at end of file
+from .font import Font, Style
+from .theme import Theme
+from .tooltip import ToolTipManager
+from .icons import IconCache
+from .bundle import AssetBundle, AssetRef, build_bundle
+from .warmup import Warmup
+from .loader import UI, UILoader, load_ui, register_widget
+from .hotreload import HotReloader
+from .binding import Observable
+from .scheduler import Scheduler, ScheduledTask
+from .animation import Animator, Animation, animate
+from .events import EventRegistry, weak
+from .disposal import Disposable, dispose_tree
+from .leaks import LeakDetector
+from .threads import UIThread
+from .prebuild import Prebuilder
+from .idle import IdleRunner, IdleTask
+from .channel import UpdateChannel
+from .latest import LatestExecutor, CancelToken
@@ -0,0 +1,258 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+clr.AddReference('System.Drawing')
+
+import System.Drawing as Drawing
+import System.Windows.Forms as Forms
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from .batch import suspended
+from .color import Color
+
+
+def linear(t: float) -> float:
+    return t
+
+def ease_in(t: float) -> float:
+    return t * t * t
+
+def ease_out(t: float) -> float:
+    t = 1 - t
+    return 1 - t * t * t
+
+def ease_in_out(t: float) -> float:
+    if t < 0.5:
+        return 4 * t * t * t
+    t = -2 * t + 2
+    return 1 - t * t * t / 2
+
+
+EASINGS: Dict[str, Callable[[float], float]] = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+}
+
+
+def _interpolator(start: Any, end: Any, color: bool = False) -> Callable[[float], Any]:
+    """
+    Build the function that maps progress (0..1) to a value between `start` and `end`.
+    Supports numbers, (x, y) / (width, height) tuples and colors (anything `Color.parse` accepts).
+    """
+    if color or isinstance(start, Drawing.Color) or isinstance(end, Drawing.Color):
+        a = Color.to_argb(Color.parse(start))
+        b = Color.to_argb(Color.parse(end))
+        channels = [((a >> shift) & 0xFF, (b >> shift) & 0xFF) for shift in (24, 16, 8, 0)]
+
+        def blend(t: float) -> Drawing.Color:
+            packed = 0
+            for low, high in channels:
+                packed = (packed << 8) | int(round(low + (high - low) * t))
+            return Color.from_argb(packed)
+        return blend
+
+    if isinstance(start, (tuple, list)):
+        if len(start) != len(end):
+            raise ValueError("Start and end values must have the same length.")
+        pairs = list(zip(start, end))
+        return lambda t: tuple(int(round(low + (high - low) * t)) for low, high in pairs)
+
+    if isinstance(start, int) and isinstance(end, int):
+        return lambda t: int(round(start + (end - start) * t))
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        return lambda t: start + (end - start) * t
+    raise TypeError(f"Can't animate values of type {type(start).__name__}.")
+
+
+
+class Animation:
+    """
+    A running tween of one widget property. Returned by `Animator.animate`.
+    """
+    __slots__ = ("widget", "prop", "duration", "easing", "on_done", "started", "done", "_value_at", "_last")
+
+    def __init__(
+        self,
+        widget: Forms.Control,
+        prop: str,
+        value_at: Callable[[float], Any],
+        duration: float,
+        easing: Callable[[float], float],
+        on_done: Optional[Callable[[], None]],
+        started: float
+    ):
+        self.widget = widget
+        self.prop = prop
+        self.duration = duration
+        self.easing = easing
+        self.on_done = on_done
+        self.started = started
+        self.done = False
+        self._value_at = value_at
+        self._last = None
+
+
+    def _step(self, now: float) -> bool:
+        """
+        Write the value for `now`. Returns whether a write happened.
+        """
+        progress = 1.0 if self.duration <= 0 else min(1.0, (now - self.started) / self.duration)
+        if progress >= 1.0:
+            self.done = True
+        value = self._value_at(self.easing(progress))
+        if value == self._last:
+            return False
+        self._last = value
+        setattr(self.widget, self.prop, value)
+        return True
+
+
+
+class Animator:
+    """
+    Advances every running animation from a single frame timer.
+
+    Each frame computes the values from the elapsed time and writes them grouped by top-level
+    window with layout suspended, so a window lays out once per frame however many widgets move.
+    Painting is left to the widgets, which only invalidate what changed. A frame that fires late
+    jumps straight to where the animations should be instead of replaying the frames it missed.
+    An animation whose property can't be written is dropped.
+
+    Args:
+        - fps (int): The target frame rate.
+        - clock (Callable[[], float]): The time source in seconds, for tests.
+    """
+    def __init__(self, fps: int = 60, clock: Callable[[], float] = time.perf_counter):
+        self._frame = 1.0 / fps
+        self._clock = clock
+        self._animations: Dict[Tuple[int, str], Animation] = {}
+        self._last_frame: Optional[float] = None
+        self._timer = Forms.Timer()
+        self._timer.Interval = max(1, int(1000 / fps))
+        self._timer.Tick += self._on_frame
+        self.stats = {"frames": 0, "skipped_frames": 0, "writes": 0, "completed": 0}
+
+
+    def animate(
+        self,
+        widget: Forms.Control,
+        prop: str,
+        end: Any,
+        duration: int = 300,
+        easing: Union[str, Callable[[float], float]] = "ease_out",
+        start: Any = None,
+        on_done: Optional[Callable[[], None]] = None
+    ) -> Animation:
+        """
+        Animate a widget property from its current value (or `start`) to `end`.
+
+        An animation already running on the same property is replaced.
+
+        Args:
+            - widget (Forms.Control): The widget to animate.
+            - prop (str): The property, e.g. "location", "size", "background_color" or "text_color".
+            - end (Any): The final value: a number, a tuple or a color.
+            - duration (int): The length of the animation, in milliseconds.
+            - easing (Union[str, Callable[[float], float]]): The name of an easing in `EASINGS`, or a function of progress.
+            - start (Any): The first value. If None, the current value of the property.
+            - on_done (Optional[Callable[[], None]]): Called once the final value has been written.
+        """
+        if isinstance(easing, str):
+            try:
+                easing = EASINGS[easing]
+            except KeyError:
+                raise ValueError(f"Unknown easing: {easing}") from None
+        if start is None:
+            start = getattr(widget, prop)
+            if start is None:
+                raise ValueError(f"'{prop}' has no current value, pass a start value.")
+
+        value_at = _interpolator(start, end, prop.endswith("color"))
+        animation = Animation(widget, prop, value_at, duration / 1000, easing, on_done, self._clock())
+        self._animations[(id(widget), prop)] = animation
+        if not self._timer.Enabled:
+            self._last_frame = None
+            self._timer.Start()
+        return animation
+
+
+    def cancel(self, widget: Forms.Control, prop: Optional[str] = None):
+        """
+        Stop animating a property of a widget, or all of its properties if `prop` is None. Values are left as they are.
+        """
+        for key in [key for key in self._animations if key[0] == id(widget) and (prop is None or key[1] == prop)]:
+            del self._animations[key]
+
+
+    def _on_frame(self, sender, event):
+        now = self._clock()
+        stats = self.stats
+        stats["frames"] += 1
+        if self._last_frame is not None:
+            missed = int((now - self._last_frame) / self._frame) - 1
+            if missed > 0:
+                stats["skipped_frames"] += missed
+        self._last_frame = now
+
+        by_window: Dict[int, Tuple[Forms.Control, List[Animation]]] = {}
+        for key, animation in list(self._animations.items()):
+            widget = animation.widget
+            if widget.IsDisposed:
+                del self._animations[key]
+                continue
+            window = widget.TopLevelControl or widget
+            by_window.setdefault(id(window), (window, []))[1].append(animation)
+
+        finished = []
+        failed = []
+        for window, animations in by_window.values():
+            # Layout only: suspending redraw would end with a full repaint of the window every frame.
+            with suspended(window, redraw=False):
+                for animation in animations:
+                    try:
+                        if animation._step(now):
+                            stats["writes"] += 1
+                    except Exception as e:
+                        print(f"Error animating '{animation.prop}': {e}")
+                        animation.done = True
+                        failed.append(animation)
+                        continue
+                    if animation.done:
+                        finished.append(animation)
+
+        for animation in failed:
+            key = (id(animation.widget), animation.prop)
+            if self._animations.get(key) is animation:
+                del self._animations[key]
+
+        for animation in finished:
+            key = (id(animation.widget), animation.prop)
+            if self._animations.get(key) is animation:
+                del self._animations[key]
+            stats["completed"] += 1
+            if animation.on_done:
+                animation.on_done()
+
+        if not self._animations:
+            self._timer.Stop()
+
+
+    def __len__(self) -> int:
+        return len(self._animations)
+
+
+
+_local = threading.local()
+
+
+def animate(widget: Forms.Control, prop: str, end: Any, **kwargs) -> Animation:
+    """
+    Animate a widget property with the default animator of the calling UI thread. See `Animator.animate`.
+    """
+    animator = getattr(_local, "animator", None)
+    if animator is None:
+        animator = _local.animator = Animator()
+    return animator.animate(widget, prop, end, **kwargs)
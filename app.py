@@ -7,31 +7,49 @@ import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 import System as Sys
 
-from typing import Callable, Optional, Type, Tuple
+import threading
+from typing import Callable, Dict, Optional, Type, Tuple
 from pathlib import Path
 from .color import Color
+from .theme import Theme
+from .cache import PropertyCache
+from .disposal import Disposable, dispose_tree, own, release_tree
+from .icons import IconCache
+from .scheduler import Scheduler
+from . import dispatch
 
 
 class App:
     _icon = None
+    _icon_path = None
 
     @classmethod
-    def set_icon(cls, icon_path: Optional[Path]):
+    def set_icon(cls, icon_path: Optional[Path], size: Optional[Tuple[int, int]] = None):
         if icon_path:
             try:
-                cls._icon = Drawing.Icon(str(icon_path))
+                cls._icon = IconCache.get(icon_path, size)
+                cls._icon_path = icon_path
             except Exception as e:
                 print(f"Error setting icon: {e}")
         else:
             cls._icon = None
+            cls._icon_path = None
 
     @classmethod
-    def get_icon(cls) -> Optional[Drawing.Icon]:
+    def get_icon(cls, size: Optional[Tuple[int, int]] = None) -> Optional[Drawing.Icon]:
+        """
+        Get the application icon, optionally the frame closest to `size` from the same file.
+        """
+        if size is not None and cls._icon_path:
+            try:
+                return IconCache.get(cls._icon_path, size)
+            except Exception as e:
+                print(f"Error loading icon: {e}")
         return cls._icon
 
 
 
-class MainWindow(Forms.Form):
+class MainWindow(Disposable, Forms.Form):
     """
     Args:
         - title (str): The title of the window.
@@ -53,14 +71,17 @@ class MainWindow(Forms.Form):
     Methods:
         run: Starts the application and displays the window.
     """
-    _instance = None
+    # One MainWindow per UI thread, so windows launched with UIThread can have their own.
+    _instances = threading.local()
 
     def __new__(cls, *args, **kwargs):
-        if cls._instance:
-            print("Warning: An instance of MainWindow already exists")
-            return cls._instance
-        cls._instance = super(MainWindow, cls).__new__(cls)
-        return cls._instance
+        instance = getattr(cls._instances, "instance", None)
+        if instance:
+            print("Warning: An instance of MainWindow already exists on this thread")
+            return instance
+        instance = super(MainWindow, cls).__new__(cls)
+        cls._instances.instance = instance
+        return instance
     
 
     def __init__(
@@ -105,6 +126,9 @@ class MainWindow(Forms.Form):
             - run: Starts the application and displays the window.
         """
         super().__init__()
+        # Creating the form installed this thread's WindowsFormsSynchronizationContext.
+        # The first MainWindow's thread is the one worker threads post to.
+        dispatch.capture(replace=False)
         self._title = title
         self._size = Drawing.Size(size[0], size[1])
         self._content = content
@@ -124,6 +148,11 @@ class MainWindow(Forms.Form):
 
         self._dragging = False
         self._drag_start = Drawing.Point(0, 0)
+        self._theme = None
+        self._cache = PropertyCache()
+        self._scheduler = None
+        self._minimized = False
+        self._disposal_report = None
 
         self.Text = self._title
         self.Size = self._size
@@ -157,7 +186,10 @@ class MainWindow(Forms.Form):
             self._update_draggable()
 
         self.FormClosing += self._handle_form_closing
+        self.FormClosed += self._handle_form_closed
         self.Resize += self._handle_minimize_window
+        self.Resize += self._handle_resize
+        self.Move += self._handle_move
 
         self._initialized = True
 
@@ -187,7 +219,7 @@ class MainWindow(Forms.Form):
         """
         Get the window's size as a tuple.
         """
-        return (self.Size.Width, self.Size.Height)
+        return self._cache.get("size", self._read_size)
     
 
     @size.setter
@@ -198,8 +230,7 @@ class MainWindow(Forms.Form):
         Args:
             new_size (tuple[int, int]): The new size of the window (width, height).
         """
-        self._size = Drawing.Size(new_size[0], new_size[1])
-        self.Size = self._size
+        self._cache.set("size", (new_size[0], new_size[1]), self._write_size, self._read_size)
 
 
     @property
@@ -226,7 +257,7 @@ class MainWindow(Forms.Form):
         Returns:
             tuple[int, int]: The location of the window (x, y).
         """
-        return (self.Location.X, self.Location.Y)
+        return self._cache.get("location", self._read_location)
 
     @location.setter
     def location(self, new_location: tuple[int, int]):
@@ -247,7 +278,22 @@ class MainWindow(Forms.Form):
         """
         self._location = location  # Update internal location state
         if not self._center_screen:
-            self.Location = Drawing.Point(location[0], location[1])
+            self._cache.set("location", (location[0], location[1]), self._write_location, self._read_location)
+
+
+    def _read_size(self) -> Tuple[int, int]:
+        size = self.Size
+        return (size.Width, size.Height)
+
+    def _write_size(self, size: Tuple[int, int]):
+        self.Size = Drawing.Size(size[0], size[1])
+
+    def _read_location(self) -> Tuple[int, int]:
+        location = self.Location
+        return (location.X, location.Y)
+
+    def _write_location(self, location: Tuple[int, int]):
+        self.Location = Drawing.Point(location[0], location[1])
 
 
     @property
@@ -491,23 +537,89 @@ class MainWindow(Forms.Form):
                 e.Cancel = True 
 
 
+    def _handle_form_closed(self, sender, e: Forms.FormClosedEventArgs):
+        """
+        Release the resources owned by the window's controls as soon as it is closed.
+        """
+        self._disposal_report = release_tree(self)
+
+
+    def _handle_resize(self, sender, e: Sys.EventArgs):
+        """
+        Mark the cached size as dirty when the native window is resized.
+        """
+        self._cache.invalidate("size")
+
+
+    def _handle_move(self, sender, e: Sys.EventArgs):
+        """
+        Mark the cached location as dirty when the native window moves.
+        """
+        self._cache.invalidate("location")
+
+
     def _handle_minimize_window(self, sender, e: Sys.EventArgs):
         """
-        Handle the Resize event to check if the window is minimized.
+        Handle the Resize event to check if the window is minimized or restored.
+
+        The scheduler is paused while the window is minimized.
         """
-        if self.WindowState == Forms.FormWindowState.Minimized:
-            if Callable(self._on_minimize):
+        minimized = self.WindowState == Forms.FormWindowState.Minimized
+        if minimized == self._minimized:
+            return
+        self._minimized = minimized
+        if minimized:
+            if self._scheduler is not None:
+                self._scheduler.pause()
+            if callable(self._on_minimize):
                 self._on_minimize()
+        elif self._scheduler is not None:
+            self._scheduler.resume()
+
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """
+        Get the app-wide scheduler, created on first use.
+
+        Periodic refreshes should be registered here rather than on their own Forms.Timer,
+        so the message loop wakes once for all of them. It is paused while the window is minimized.
+        """
+        if self._scheduler is None:
+            self._scheduler = own(self, "scheduler", Scheduler())
+            if self._minimized:
+                self._scheduler.pause()
+        return self._scheduler
+
+
+
+    def apply_theme(self, theme: Theme) -> int:
+        """
+        Restyle the window and all of its controls with a theme in a single batch.
+
+        Args:
+            theme (Theme): The theme to apply.
+
+        Returns:
+            int: The number of properties that changed.
+        """
+        self._theme = theme
+        return theme.apply(self)
 
 
+    @property
+    def theme(self) -> Optional[Theme]:
+        """
+        Get the theme last applied to the window.
+        """
+        return self._theme
+
 
     def minimize(self):
         """
-        Minimizes the window.
+        Minimizes the window. `on_minimize` is called by the Resize handler.
         """
         self.WindowState = Forms.FormWindowState.Minimized
-        if self._on_minimize:
-            self._on_minimize()
 
     
     def activate(self):
@@ -533,12 +645,35 @@ class MainWindow(Forms.Form):
     def run(self):
         """
         Starts the application and displays the window.
+        The window and its controls are disposed once the message loop ends.
         """
-        Forms.Application.Run(self)
+        try:
+            Forms.Application.Run(self)
+        finally:
+            self.dispose()
 
 
     def exit(self):
         """
         EXit the application.
         """
-        Forms.Application.Exit()
\ No newline at end of file
+        Forms.Application.Exit()
+
+
+    @property
+    def disposal_report(self) -> Optional[Dict[str, int]]:
+        """
+        Get what was released when the window closed: the number of "controls", detached "delegates"
+        and released resources by type name. None while the window is open.
+        """
+        return self._disposal_report
+
+
+    def dispose(self) -> Dict[str, int]:
+        """
+        Dispose the window, its controls and the resources they own.
+        """
+        report = dispose_tree(self)
+        if self._disposal_report is None:
+            self._disposal_report = report
+        return self._disposal_report
@@ -0,0 +1,87 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import ctypes
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+WM_SETREDRAW = 0x000B
+
+# Per UI thread: id(control) -> nesting depth of active redraw suspensions.
+_local = threading.local()
+
+
+def _redraw_depth() -> Dict[int, int]:
+    depths = getattr(_local, "redraw_depth", None)
+    if depths is None:
+        depths = _local.redraw_depth = {}
+    return depths
+
+
+def _set_redraw(control: Forms.Control, enabled: bool):
+    """Enable or disable painting of a control and its children through WM_SETREDRAW."""
+    handle = ctypes.c_void_p(control.Handle.ToInt64())
+    ctypes.windll.user32.SendMessageW(handle, WM_SETREDRAW, int(enabled), 0)
+
+
+def containers(root: Forms.Control) -> List[Forms.Control]:
+    """
+    Collect `root` and every descendant that has child controls, parents first.
+    """
+    result = []
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        children = control.Controls
+        if children.Count:
+            result.append(control)
+            stack.extend(children)
+    return result
+
+
+@contextmanager
+def suspended(
+    root: Forms.Control,
+    controls: Optional[Iterable[Forms.Control]] = None,
+    redraw: bool = True
+) -> Iterator[Forms.Control]:
+    """
+    Suspend layout on `root` (and `controls`) and painting on `root` while the block runs.
+
+    On exit layout is resumed innermost first and `root` is repainted once.
+    Nested blocks on the same root only repaint when the outermost one exits.
+
+    Args:
+        - root (Forms.Control): The control whose subtree is being updated.
+        - controls (Optional[Iterable[Forms.Control]]): Additional containers to suspend layout on.
+        - redraw (bool): Whether to also suspend painting of `root`.
+    """
+    suspended_controls = [root]
+    if controls is not None:
+        suspended_controls.extend(control for control in controls if control is not root)
+    for control in suspended_controls:
+        control.SuspendLayout()
+
+    key = id(root)
+    paint = redraw and root.IsHandleCreated
+    depths = _redraw_depth()
+    if paint:
+        depth = depths.get(key, 0)
+        if depth == 0:
+            _set_redraw(root, False)
+        depths[key] = depth + 1
+    try:
+        yield root
+    finally:
+        for control in reversed(suspended_controls):
+            control.ResumeLayout(True)
+        if paint:
+            depth = depths.pop(key) - 1
+            if depth:
+                depths[key] = depth
+            else:
+                _set_redraw(root, True)
+                root.Refresh()
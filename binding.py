@@ -0,0 +1,196 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+from System import Action
+
+import threading
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from . import dispatch
+
+
+class _Binding:
+    __slots__ = ("widget", "prop", "convert")
+
+    def __init__(self, widget: Forms.Control, prop: str, convert: Optional[Callable[[Any], Any]]):
+        self.widget = widget
+        self.prop = prop
+        self.convert = convert
+
+
+
+class _UpdateBatch:
+    """
+    Pending widget writes of one UI thread, flushed once per tick of its message loop.
+
+    Writes are keyed by (widget, property), so a property changed several times
+    before the flush is written once, with its last value.
+    """
+    def __init__(self):
+        self._pending: Dict[Tuple[int, str], Tuple[Forms.Control, str, Any]] = {}
+        self._scheduled = False
+        self._lock = RLock()
+        self.stats = {"queued": 0, "merged": 0, "written": 0, "flushes": 0}
+
+
+    def queue(self, widget: Forms.Control, prop: str, value: Any):
+        key = (id(widget), prop)
+        with self._lock:
+            self.stats["queued"] += 1
+            if key in self._pending:
+                self.stats["merged"] += 1
+            self._pending[key] = (widget, prop, value)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        dispatch.post(self.flush)
+
+
+    def flush(self) -> int:
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._scheduled = False
+        written = 0
+        for widget, prop, value in pending:
+            if widget.IsDisposed:
+                continue
+            try:
+                setattr(widget, prop, value)
+                written += 1
+            except Exception as e:
+                print(f"Error writing bound property '{prop}': {e}")
+        with self._lock:
+            self.stats["written"] += written
+            self.stats["flushes"] += 1
+        return written
+
+
+_local = threading.local()
+
+
+def _batch() -> _UpdateBatch:
+    """
+    Get the update batch of the calling UI thread.
+    """
+    batch = getattr(_local, "batch", None)
+    if batch is None:
+        batch = _local.batch = _UpdateBatch()
+    return batch
+
+
+def _queue_write(widget: Forms.Control, prop: str, value: Any):
+    if widget.InvokeRequired:
+        # The widget belongs to another UI thread: queue the write in that thread's batch.
+        widget.BeginInvoke(Action(lambda: _batch().queue(widget, prop, value)))
+    else:
+        _batch().queue(widget, prop, value)
+
+
+def flush() -> int:
+    """
+    Write the pending bound values of the calling UI thread now instead of waiting for the next tick.
+
+    Returns:
+        int: The number of properties written.
+    """
+    return _batch().flush()
+
+
+def stats() -> Dict[str, int]:
+    """
+    Get the number of queued, merged (superseded before the flush) and written updates, and of flushes,
+    on the calling UI thread.
+    """
+    return dict(_batch().stats)
+
+
+
+class Observable:
+    """
+    Base class for models whose fields can be bound to widget properties.
+
+    Fields are declared as class attributes holding their default value. Assigning a field
+    queues a write to every bound property; the writes are applied once per UI tick, and a
+    property that changes several times in the same tick is only written with its last value.
+
+        class Status(Observable):
+            message = "Ready"
+            busy = False
+
+        status = Status()
+        status.bind("message", label, "text")
+        status.bind("busy", box, "background_color", lambda busy: Color.RED if busy else Color.WHITE)
+        status.message = "Saving..."
+
+    Fields must be assigned on a UI thread. Writes to widgets of another UI thread are queued and flushed on that thread.
+
+    Args:
+        - **fields: Initial values, overriding the class defaults.
+    """
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+    def _bindings(self) -> Dict[str, List[_Binding]]:
+        bindings = self.__dict__.get("_bindings_by_field")
+        if bindings is None:
+            bindings = {}
+            object.__setattr__(self, "_bindings_by_field", bindings)
+        return bindings
+
+
+    def __setattr__(self, name: str, value: Any):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        missing = object()
+        old = getattr(self, name, missing)
+        object.__setattr__(self, name, value)
+        if old is missing or old != value:
+            for binding in self._bindings().get(name, ()):
+                self._queue(binding, value)
+
+
+    @staticmethod
+    def _queue(binding: _Binding, value: Any):
+        if binding.convert is not None:
+            value = binding.convert(value)
+        _queue_write(binding.widget, binding.prop, value)
+
+
+    def bind(
+        self,
+        field: str,
+        widget: Forms.Control,
+        prop: str = "text",
+        convert: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Keep a widget property in sync with a field. The current value is written on the next tick.
+
+        Args:
+            - field (str): The name of the field.
+            - widget (Forms.Control): The widget to update.
+            - prop (str): The widget property, e.g. "text", "value" or "background_color".
+            - convert (Optional[Callable[[Any], Any]]): Turns the field value into the property value.
+        """
+        if not hasattr(self, field):
+            raise AttributeError(f"{type(self).__name__} has no field '{field}'.")
+        binding = _Binding(widget, prop, convert)
+        self._bindings().setdefault(field, []).append(binding)
+        self._queue(binding, getattr(self, field))
+
+
+    def unbind(self, field: str, widget: Forms.Control, prop: Optional[str] = None):
+        """
+        Stop updating a widget from a field. If `prop` is None, every property of the widget bound to the field is released.
+        """
+        bindings = self._bindings().get(field)
+        if bindings:
+            bindings[:] = [
+                binding for binding in bindings
+                if binding.widget is not widget or (prop is not None and binding.prop != prop)
+            ]
@@ -4,11 +4,43 @@ clr.AddReference('System.Drawing')
 
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
+from System import Array
 
-from typing import Optional, Union, List, Tuple
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Union, List, Tuple
+from .batch import suspended
 from .color import Color
+from .disposal import Disposable, dispose_tree
 
-class Box(Forms.Panel):
+
+def _longest_increasing(sequence: List[int]) -> set:
+    """
+    Get the positions in `sequence` that form a longest strictly increasing subsequence, ignoring -1 entries.
+    """
+    tails: List[int] = []
+    tail_positions: List[int] = []
+    previous = [-1] * len(sequence)
+    for position, value in enumerate(sequence):
+        if value < 0:
+            continue
+        index = bisect_left(tails, value)
+        if index:
+            previous[position] = tail_positions[index - 1]
+        if index == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[index] = value
+            tail_positions[index] = position
+    result = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        result.add(position)
+        position = previous[position]
+    return result
+
+
+class Box(Disposable, Forms.Panel):
     """
     Args:
         - size (Tuple[int, int]): The size of the box (width, height).
@@ -32,6 +64,7 @@ class Box(Forms.Panel):
         self._size = size
         self._location = location
         self._background_color = background_color
+        self._keyed: Dict[Hashable, Forms.Control] = {}
         
         self.Size = Drawing.Size(*self._size)
         self.Location = Drawing.Point(*self._location)
@@ -108,10 +141,14 @@ class Box(Forms.Panel):
             self.Controls.Add(controls)
         elif isinstance(controls, list):
             for control in controls:
-                if isinstance(control, Forms.Control):
-                    self.Controls.Add(control)
-                else:
+                if not isinstance(control, Forms.Control):
                     raise TypeError("All items in the list must be instances of Forms.Control.")
+            # Add the whole list in one native call with a single layout pass.
+            self.SuspendLayout()
+            try:
+                self.Controls.AddRange(Array[Forms.Control](controls))
+            finally:
+                self.ResumeLayout(True)
         else:
             raise TypeError("controls must be a Forms.Control or a list of Forms.Control.")
         
@@ -134,3 +171,98 @@ class Box(Forms.Panel):
                     raise TypeError("All items in the list must be instances of Forms.Control.")
         else:
             raise TypeError("controls must be a Forms.Control or a list of Forms.Control.")
+
+
+
+    def reconcile(
+        self,
+        items: Iterable[Any],
+        key: Callable[[Any], Hashable],
+        create: Callable[[Any], Forms.Control],
+        update: Optional[Callable[[Forms.Control, Any], None]] = None,
+        dispose: bool = True
+    ) -> Dict[str, int]:
+        """
+        Make the children of the box match `items`, reusing the existing controls by key.
+
+        Controls whose key is still present are kept (with their handles, state and scroll position)
+        and passed to `update`; controls for new keys are built with `create`; the others are removed.
+        Children are then reordered to follow `items` with the fewest moves, keeping the longest run
+        of controls that are already in order in place. All changes happen with layout and painting suspended.
+
+        Children that were not added by `reconcile` are treated as stale and removed.
+
+        Args:
+            - items (Iterable[Any]): The data to display, in order.
+            - key (Callable[[Any], Hashable]): Returns the unique key of an item.
+            - create (Callable[[Any], Forms.Control]): Builds the control of a new item.
+            - update (Optional[Callable[[Forms.Control, Any], None]]): Refreshes a reused control from its item.
+            - dispose (bool): Whether removed controls are disposed.
+
+        Returns:
+            Dict[str, int]: The number of controls that were "reused", "created", "removed" and "moved".
+        """
+        items = list(items)
+        keys = [key(item) for item in items]
+        if len(set(keys)) != len(keys):
+            raise ValueError("reconcile keys must be unique.")
+
+        stats = {"reused": 0, "created": 0, "removed": 0, "moved": 0}
+        wanted = set(keys)
+        keyed = {k: control for k, control in self._keyed.items() if k in wanted and control.Parent == self}
+
+        with suspended(self):
+            # Children are matched by their index in the collection rather than by id(): pythonnet
+            # may return a new wrapper for the same .NET control on every access.
+            kept = {self.Controls.GetChildIndex(control) for control in keyed.values()}
+            for index in range(self.Controls.Count - 1, -1, -1):
+                if index not in kept:
+                    control = self.Controls[index]
+                    self.Controls.Remove(control)
+                    if dispose:
+                        dispose_tree(control)
+                    stats["removed"] += 1
+
+            # Position of every reused control among the remaining children, -1 for new ones.
+            order = list(self.Controls)
+            targets = []
+            created = []
+            sources = []
+            for k, item in zip(keys, items):
+                control = keyed.get(k)
+                if control is None:
+                    control = create(item)
+                    if not isinstance(control, Forms.Control):
+                        raise TypeError("create must return an instance of Forms.Control.")
+                    keyed[k] = control
+                    created.append(control)
+                    sources.append(-1)
+                    stats["created"] += 1
+                else:
+                    if update is not None:
+                        update(control, item)
+                    sources.append(self.Controls.GetChildIndex(control))
+                    stats["reused"] += 1
+                targets.append(control)
+
+            if created:
+                self.Controls.AddRange(Array[Forms.Control](created))
+                order.extend(created)
+
+            # Controls outside the longest increasing run are moved right before their successor,
+            # last to first, which leaves every control in its target position.
+            stable = _longest_increasing(sources)
+            for position in range(len(targets) - 1, -1, -1):
+                if position in stable:
+                    continue
+                control = targets[position]
+                order.remove(control)
+                index = order.index(targets[position + 1]) if position + 1 < len(targets) else len(order)
+                order.insert(index, control)
+                if self.Controls.GetChildIndex(control) != index:
+                    self.Controls.SetChildIndex(control, index)
+                    if sources[position] >= 0:
+                        stats["moved"] += 1
+
+        self._keyed = keyed
+        return stats
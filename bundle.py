@@ -0,0 +1,253 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# pythonnet is only imported when assets are opened, so `build_bundle` and the command line
+# tool work without .NET.
+
+# Header: magic, format version, reserved, index offset, index length.
+_HEADER = struct.Struct("<4sHHQQ")
+_MAGIC = b"WFZB"
+_VERSION = 1
+
+DEFAULT_EXTENSIONS = (".png", ".ico", ".bmp", ".jpg", ".jpeg", ".gif")
+
+
+def build_bundle(
+    output: Union[str, Path],
+    sources: Iterable[Union[str, Path]],
+    extensions: Optional[Iterable[str]] = DEFAULT_EXTENSIONS
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Pack asset files into a single indexed bundle file.
+
+    Files are named by their path relative to the source directory they were found in
+    (or by their file name when a file is given directly), using forward slashes.
+
+    Args:
+        - output (Union[str, Path]): The bundle file to write.
+        - sources (Iterable[Union[str, Path]]): Files and directories to pack. Directories are walked recursively.
+        - extensions (Optional[Iterable[str]]): File extensions to include from directories. None includes every file.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The bundle index, mapping each asset name to its (offset, length).
+    """
+    if extensions is not None:
+        extensions = {extension.lower() for extension in extensions}
+    files: List[Tuple[str, Path]] = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            for path in sorted(source.rglob("*")):
+                if path.is_file() and (extensions is None or path.suffix.lower() in extensions):
+                    files.append((path.relative_to(source).as_posix(), path))
+        else:
+            files.append((source.name, source))
+
+    index: Dict[str, Tuple[int, int]] = {}
+    with open(output, "wb") as bundle:
+        bundle.write(b"\0" * _HEADER.size)
+        for name, path in files:
+            if name in index:
+                raise ValueError(f"Duplicate asset name in bundle: {name}")
+            data = path.read_bytes()
+            index[name] = (bundle.tell(), len(data))
+            bundle.write(data)
+        index_offset = bundle.tell()
+        encoded = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        bundle.write(encoded)
+        bundle.seek(0)
+        bundle.write(_HEADER.pack(_MAGIC, _VERSION, 0, index_offset, len(encoded)))
+    return index
+
+
+
+class AssetRef:
+    """
+    A reference to an asset stored in an AssetBundle. Accepted in place of a file path by
+    ImageBox, Button, Splash and App.set_icon.
+    """
+    __slots__ = ("bundle", "name")
+
+    def __init__(self, bundle: "AssetBundle", name: str):
+        self.bundle = bundle
+        self.name = name
+
+    def open_stream(self) -> Any:
+        return self.bundle.open_stream(self.name)
+
+    def __repr__(self) -> str:
+        return f"AssetRef({self.bundle.path!r}, {self.name!r})"
+
+
+
+class AssetBundle:
+    """
+    Read-only access to a bundle built with `build_bundle`, through a memory-mapped file.
+
+    Args:
+        - path (Union[str, Path]): The bundle file.
+    """
+    _open: Dict[str, "AssetBundle"] = {}
+    _open_lock = RLock()
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = os.path.abspath(str(path))
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, index_offset, index_length = _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"Not an asset bundle: {self.path}")
+            if version != _VERSION:
+                raise ValueError(f"Unsupported asset bundle version {version}: {self.path}")
+            index = json.loads(self._map[index_offset:index_offset + index_length].decode("utf-8"))
+        except Exception:
+            self.close()
+            raise
+        self._index: Dict[str, Tuple[int, int]] = {name: tuple(entry) for name, entry in index.items()}
+        self._mapped_file = None
+        self.mtime = os.stat(self.path).st_mtime_ns
+
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "AssetBundle":
+        """
+        Get the shared bundle for a file, mapping it on first use.
+        """
+        key = os.path.abspath(str(path))
+        with cls._open_lock:
+            bundle = cls._open.get(key)
+            if bundle is None:
+                bundle = cls(key)
+                cls._open[key] = bundle
+            return bundle
+
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get the names of the assets in the bundle.
+        """
+        return list(self._index)
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+
+    def ref(self, name: str) -> AssetRef:
+        """
+        Get a reference to an asset, to pass where a file path is expected.
+        """
+        if name not in self._index:
+            raise KeyError(f"Asset not found in bundle: {name}")
+        return AssetRef(self, name)
+
+
+    __getitem__ = ref
+
+
+    def read(self, name: str) -> bytes:
+        """
+        Get the raw bytes of an asset.
+        """
+        offset, length = self._index[name]
+        return self._map[offset:offset + length]
+
+
+    def open_stream(self, name: str) -> Any:
+        """
+        Get a read-only stream over the asset's bytes in the mapped file, without copying them.
+
+        Returns:
+            MemoryMappedViewStream: An UnmanagedMemoryStream over a view of the mapping. The view keeps the
+            mapping alive until the stream is disposed, even if the bundle is closed first.
+        """
+        offset, length = self._index[name]
+        import clr
+        clr.AddReference('System.Core')
+        from System.IO.MemoryMappedFiles import MemoryMappedFileAccess
+        with AssetBundle._open_lock:
+            if self._mapped_file is None:
+                if self._map is None:
+                    raise ValueError(f"The asset bundle is closed: {self.path}")
+                self._mapped_file = self._map_view_file(MemoryMappedFileAccess.Read)
+            return self._mapped_file.CreateViewStream(offset, length, MemoryMappedFileAccess.Read)
+
+
+    def _map_view_file(self, access: Any) -> Any:
+        """
+        Map the bundle for .NET streams. The path overloads of CreateFromFile open the file without
+        sharing it, which fails while `_file` holds it open, so the map is made from a FileStream that
+        shares reads. The map owns the FileStream and closes it when disposed.
+        """
+        from System.IO import FileAccess, FileMode, FileShare, FileStream, HandleInheritability
+        from System.IO.MemoryMappedFiles import MemoryMappedFile
+        stream = FileStream(self.path, FileMode.Open, FileAccess.Read, FileShare.Read)
+        inheritability = getattr(HandleInheritability, "None")
+        try:
+            try:
+                return MemoryMappedFile.CreateFromFile(stream, None, 0, access, inheritability, False)
+            except TypeError:
+                # .NET Framework's overload also takes a MemoryMappedFileSecurity.
+                return MemoryMappedFile.CreateFromFile(stream, None, 0, access, None, inheritability, False)
+        except Exception:
+            stream.Dispose()
+            raise
+
+
+    def close(self):
+        """
+        Unmap the bundle and close its file.
+        """
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        if getattr(self, "_mapped_file", None) is not None:
+            # Streams already opened keep their views, and with them the mapping, until they are disposed.
+            self._mapped_file.Dispose()
+            self._mapped_file = None
+        self._file.close()
+        with AssetBundle._open_lock:
+            if AssetBundle._open.get(self.path) is self:
+                del AssetBundle._open[self.path]
+
+
+
+def load_image(source: Union[str, Path, AssetRef]) -> Any:
+    """
+    Load an image from a file path or a bundle reference.
+
+    Returns:
+        Drawing.Image: The image. One loaded from a bundle reads from its stream, which stays open with it.
+    """
+    import clr
+    clr.AddReference('System.Drawing')
+    import System.Drawing as Drawing
+    if isinstance(source, AssetRef):
+        return Drawing.Image.FromStream(source.open_stream())
+    return Drawing.Image.FromFile(str(source))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Pack image and icon files into a WinFormZ asset bundle.")
+    parser.add_argument("output", help="The bundle file to write.")
+    parser.add_argument("sources", nargs="+", help="Files or directories to pack.")
+    parser.add_argument(
+        "--ext", nargs="*", default=list(DEFAULT_EXTENSIONS),
+        help="File extensions to include from directories (default: %(default)s). Pass no value to include every file."
+    )
+    args = parser.parse_args(argv)
+    index = build_bundle(args.output, args.sources, args.ext or None)
+    size = sum(length for _, length in index.values())
+    print(f"Packed {len(index)} assets ({size} bytes) into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
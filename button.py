@@ -5,12 +5,16 @@ clr.AddReference('System.Drawing')
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 
-from typing import Optional, Callable, Tuple
+from typing import Any, Dict, Optional, Callable, Tuple
 from pathlib import Path
 from .color import Color
 from .font import Font, Style
+from .tooltip import ToolTipManager
+from .bundle import load_image
+from .events import EventRegistry
+from .disposal import Disposable, own
 
-class Button(Forms.Button):
+class Button(Disposable, Forms.Button):
     """
     Args:
         - text (str): The text displayed on the button.
@@ -21,7 +25,7 @@ class Button(Forms.Button):
         - text_size (Optional[int]): The font size of the text on the button.
         - text_font (Optional[Font]): The font of the text on the button.
         - text_style (Optional[Style]): The style of the font (e.g., regular, bold, italic).
-        - icon (Optional[str]): The path to the icon file (.ico, .png, .bmp), absolute path.
+        - icon (Optional[str]): The path to the icon file (.ico, .png, .bmp), absolute path, or an AssetRef from an asset bundle.
         - popup (Optional[str]): The text to display as a tooltip when hovering over the button.
         - on_click (Optional[Callable[[], None]]): Callback function to be executed when the button is clicked.
     """
@@ -49,7 +53,7 @@ class Button(Forms.Button):
             - text_color (Optional[Color]): The color of the text on the button.
             - text_size (Optional[int]): The font size of the text on the button.
             - text_style (Optional[Style]): The style of the font (e.g., regular, bold, italic).
-            - icon (Optional[str]): The path to the icon file (.ico, .png, .bmp), absolute path.
+            - icon (Optional[str]): The path to the icon file (.ico, .png, .bmp), absolute path, or an AssetRef from an asset bundle.
             - popup (Optional[str]): The text to display as a tooltip when hovering over the button.
             - on_click (Optional[Callable[[], None]]): Callback function to be executed when the button is clicked.
         """
@@ -64,10 +68,8 @@ class Button(Forms.Button):
         self._text_style = text_style
         self._icon = icon
         self._popup = popup
-        self._on_click = on_click
+        self._events = EventRegistry(self)
 
-        self._tooltip = Forms.ToolTip()
-        
         if self._text:
             self.Text = self._text
 
@@ -79,15 +81,14 @@ class Button(Forms.Button):
             self.ForeColor = self._text_color
 
         if self._icon:
-            self.Image = Drawing.Image.FromFile(self._icon)
+            self.Image = own(self, "image", load_image(self._icon))
 
         self._set_font()
 
-        if self._on_click:
-            self.Click += self._handle_click
+        self.on_click = on_click
 
         if self._popup:
-            self._tooltip.SetToolTip(self, self._popup)
+            ToolTipManager.set(self, self._popup)
 
 
     def _set_font(self):
@@ -96,7 +97,19 @@ class Button(Forms.Button):
         font_size = self._text_size or 10
         font_style = self._text_style or Style.REGULAR
         
-        self.Font = Drawing.Font(font_family, font_size, font_style)
+        font = Drawing.Font(font_family, font_size, font_style)
+        self.Font = font
+        own(self, "font", font)
+
+
+    def _apply_theme_font(self, values: Dict[str, Any]):
+        """
+        Set the "text_font", "text_style" and "text_size" properties found in `values` and rebuild the font once.
+        """
+        self._text_font = values.get("text_font", self._text_font)
+        self._text_style = values.get("text_style", self._text_style)
+        self._text_size = values.get("text_size", self._text_size)
+        self._set_font()
 
             
 
@@ -206,10 +219,50 @@ class Button(Forms.Button):
     def text_size(self, value: Optional[int]):
         self._text_size = value
         if value:
-            self.Font = Drawing.Font(self.Font.FontFamily, value)
+            font = Drawing.Font(self.Font.FontFamily, value)
         else:
             # Optionally, you can reset to a default font size if needed
-            self.Font = Drawing.Font(self.Font.FontFamily, 10)
+            font = Drawing.Font(self.Font.FontFamily, 10)
+        self.Font = font
+        own(self, "font", font)
+
+
+    @property
+    def text_font(self) -> Optional[Font]:
+        """
+        Gets or sets the font of the text on the button.
+        """
+        return self._text_font
+
+    @text_font.setter
+    def text_font(self, value: Optional[Font]):
+        """
+        Sets the font of the text on the button.
+
+        Args:
+            value (Optional[Font]): The font family. If None, Font.SERIF is used.
+        """
+        self._text_font = value
+        self._set_font()
+
+
+    @property
+    def text_style(self) -> Optional[Style]:
+        """
+        Gets or sets the style of the font on the button.
+        """
+        return self._text_style
+
+    @text_style.setter
+    def text_style(self, value: Optional[Style]):
+        """
+        Sets the style of the font on the button.
+
+        Args:
+            value (Optional[Style]): The font style. If None, Style.REGULAR is used.
+        """
+        self._text_style = value
+        self._set_font()
 
 
 
@@ -231,10 +284,9 @@ class Button(Forms.Button):
                                    If None, the icon will be removed.
         """
         self._icon = value
-        if value:
-            self.Image = Drawing.Image.FromFile(value)
-        else:
-            self.Image = None
+        image = load_image(value) if value else None
+        self.Image = image
+        own(self, "image", image)
 
 
     @property
@@ -246,10 +298,7 @@ class Button(Forms.Button):
     @popup.setter
     def popup(self, value: Optional[str]):
         self._popup = value
-        if value:
-            self._tooltip.SetToolTip(self, value)
-        else:
-            self._tooltip.RemoveAll()
+        ToolTipManager.set(self, value)
 
     
 
@@ -258,7 +307,7 @@ class Button(Forms.Button):
         """
         Gets or sets the callback function to be executed when the button is clicked.
         """
-        return self._on_click
+        return self._events.handler("on_click")
 
     @on_click.setter
     def on_click(self, value: Optional[Callable[[], None]]):
@@ -268,12 +317,13 @@ class Button(Forms.Button):
         Args:
             value (Optional[Callable[[], None]]): The callback function to be executed on click. 
                                                    If None, the event handler will be removed.
+                                                   Wrap it in `weak` to hold it by a weak reference.
         """
-        self._on_click = value
+        self._events.set_handler("on_click", value)
         if value:
-            self.Click += self._handle_click
+            self._events.connect("Click", self._handle_click)
         else:
-            self.Click -= self._handle_click
+            self._events.disconnect("Click", self._handle_click)
 
     def _handle_click(self, sender, event_args):
         """
@@ -283,5 +333,6 @@ class Button(Forms.Button):
             sender: The source of the event.
             event_args: The event data.
         """
-        if self._on_click:
-            self._on_click()
+        handler = self._events.handler("on_click")
+        if handler:
+            handler()
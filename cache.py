@@ -0,0 +1,67 @@
+from typing import Any, Callable, Dict, Optional
+
+_MISSING = object()
+
+
+class PropertyCache:
+    """
+    Write-through cache for values read from and written to .NET properties.
+
+    Reads return the cached value and only call `fetch` when the entry is missing
+    or has been invalidated. Writes of a value equal to the cached one are skipped.
+    Controls invalidate entries from their native change events (Move, Resize, ...).
+    """
+    __slots__ = ("_values", "hits", "misses", "skipped_writes")
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.skipped_writes = 0
+
+
+    def get(self, name: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, reading it with `fetch` if it is missing or dirty.
+        """
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            value = fetch()
+            self._values[name] = value
+        else:
+            self.hits += 1
+        return value
+
+
+    def set(self, name: str, value: Any, apply: Callable[[Any], None], fetch: Optional[Callable[[], Any]] = None) -> bool:
+        """
+        Write `value` through `apply` unless it equals the cached value.
+
+        The control may adjust the value (clamping it to its minimum or maximum size, for example)
+        without raising a change event, so the cached entry is the value read back with `fetch`.
+        Without `fetch` the entry is dropped and read on the next `get`.
+
+        Returns:
+            bool: True if the value was written.
+        """
+        if self._values.get(name, _MISSING) == value:
+            self.skipped_writes += 1
+            return False
+        apply(value)
+        if fetch is not None:
+            self._values[name] = fetch()
+        else:
+            self._values.pop(name, None)
+        return True
+
+
+    def invalidate(self, *names: str):
+        """
+        Mark entries dirty. With no names, every entry is invalidated.
+        """
+        if not names:
+            self._values.clear()
+            return
+        for name in names:
+            self._values.pop(name, None)
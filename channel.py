@@ -0,0 +1,166 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+from System import Action
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from .batch import suspended
+
+
+class UpdateChannel:
+    """
+    Carries widget updates from any thread to the UI thread, keeping only the latest value per property.
+
+    Producers call `put` with (widget, property, value). It never waits on the UI thread: the update
+    is stored under its (widget, property) key, replacing any value not applied yet. A Forms.Timer
+    drains the channel on the UI thread at most `max_rate` times per second and applies each pending
+    value once, grouped per window with layout and painting suspended. A few hundred labels updated
+    thousands of times per second then cost a few hundred writes per drain, and no Invoke per update.
+    The timer only runs while updates are pending. Updates for windows of another UI thread are
+    handed to that window's thread with BeginInvoke.
+
+    Must be created on the UI thread.
+
+    Args:
+        - max_rate (int): The maximum number of drains per second.
+        - max_pending (Optional[int]): The maximum number of distinct pending keys. Updates for new keys
+          beyond it are dropped (updates to keys already pending are still merged). None means no limit.
+    """
+    def __init__(self, max_rate: int = 30, max_pending: Optional[int] = None):
+        self._pending: Dict[Tuple[int, str], Tuple[Forms.Control, str, Any]] = {}
+        self._lock = threading.Lock()
+        self._max_pending = max_pending
+        self._stats = {"put": 0, "merged": 0, "dropped": 0, "applied": 0, "stale": 0, "drains": 0, "max_batch": 0}
+        self._timer = Forms.Timer()
+        self._timer.Interval = max(1, int(1000 / max_rate))
+        self._timer.Tick += self._on_tick
+        self._armed = False
+        self._closed = False
+        # Lets `put` start the timer on this thread from any thread.
+        self._invoker = Forms.Control()
+        self._invoker.Handle
+
+
+    def put(self, widget: Forms.Control, prop: str, value: Any) -> bool:
+        """
+        Queue `widget.prop = value` from any thread, replacing a pending value for the same property.
+
+        Returns:
+            bool: False if the update was dropped because the channel is full or closed.
+        """
+        key = (id(widget), prop)
+        with self._lock:
+            if self._closed:
+                return False
+            self._stats["put"] += 1
+            if key in self._pending:
+                self._stats["merged"] += 1
+            elif self._max_pending is not None and len(self._pending) >= self._max_pending:
+                self._stats["dropped"] += 1
+                return False
+            self._pending[key] = (widget, prop, value)
+            arm = not self._armed
+            self._armed = self._armed or arm
+        if arm:
+            self._invoker.BeginInvoke(Action(self._timer.Start))
+        return True
+
+
+    def _on_tick(self, sender, event):
+        self.drain()
+
+
+    def drain(self) -> int:
+        """
+        Apply every pending update now. Must be called on the UI thread.
+
+        Returns:
+            int: The number of properties written on this thread. Updates for windows of other
+            UI threads are applied later on their own threads.
+        """
+        with self._lock:
+            if not self._pending:
+                # Nothing to do until the next `put` starts the timer again.
+                self._armed = False
+                self._timer.Stop()
+                return 0
+            pending = self._pending
+            self._pending = {}
+
+        by_window: Dict[int, Tuple[Forms.Control, List[Tuple[Forms.Control, str, Any]]]] = {}
+        stale = 0
+        for widget, prop, value in pending.values():
+            if widget.IsDisposed:
+                stale += 1
+                continue
+            window = widget.TopLevelControl or widget
+            by_window.setdefault(id(window), (window, []))[1].append((widget, prop, value))
+
+        applied = 0
+        for window, updates in by_window.values():
+            if window.InvokeRequired:
+                try:
+                    window.BeginInvoke(Action(lambda window=window, updates=updates: self._apply(window, updates)))
+                except Exception:
+                    # The window's handle was destroyed in between.
+                    stale += len(updates)
+            else:
+                applied += self._apply(window, updates)
+
+        with self._lock:
+            stats = self._stats
+            stats["stale"] += stale
+            stats["drains"] += 1
+            stats["max_batch"] = max(stats["max_batch"], len(pending))
+        return applied
+
+
+    def _apply(self, window: Forms.Control, updates: List[Tuple[Forms.Control, str, Any]]) -> int:
+        applied = 0
+        # Written controls invalidate themselves; a full Refresh of the window per drain isn't needed.
+        with suspended(window, redraw=False):
+            for widget, prop, value in updates:
+                if widget.IsDisposed:
+                    continue
+                try:
+                    setattr(widget, prop, value)
+                    applied += 1
+                except Exception as e:
+                    print(f"Error applying update to '{prop}': {e}")
+        with self._lock:
+            self._stats["applied"] += applied
+        return applied
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the channel counters.
+
+        Returns:
+            Dict[str, int]: The number of updates "put", "merged" into a pending one, "dropped" because the
+            channel was full, "applied" to widgets and skipped as "stale" (widget disposed), the number of
+            "drains", the largest batch drained at once ("max_batch") and the updates still "pending".
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        return stats
+
+
+    def close(self):
+        """
+        Apply the pending updates and stop draining.
+        """
+        with self._lock:
+            self._closed = True
+        self.drain()
+        self._timer.Stop()
+        self._timer.Dispose()
+        self._invoker.Dispose()
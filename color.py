@@ -3,7 +3,93 @@ clr.AddReference('System.Drawing')
 
 from System.Drawing import Color as DrawingColor
 
-class Color:
+import numbers
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for vectorized color operations.")
+
+
+# CSS color names -> packed 0xAARRGGBB, resolved to .NET colors only when used.
+_NAMED_COLORS: Dict[str, int] = {
+    "aliceblue": 0xFFF0F8FF, "antiquewhite": 0xFFFAEBD7, "aqua": 0xFF00FFFF,
+    "aquamarine": 0xFF7FFFD4, "azure": 0xFFF0FFFF, "beige": 0xFFF5F5DC, "bisque": 0xFFFFE4C4,
+    "black": 0xFF000000, "blanchedalmond": 0xFFFFEBCD, "blue": 0xFF0000FF, "blueviolet": 0xFF8A2BE2,
+    "brown": 0xFFA52A2A, "burlywood": 0xFFDEB887, "cadetblue": 0xFF5F9EA0, "chartreuse": 0xFF7FFF00,
+    "chocolate": 0xFFD2691E, "coral": 0xFFFF7F50, "cornflowerblue": 0xFF6495ED,
+    "cornsilk": 0xFFFFF8DC, "crimson": 0xFFDC143C, "cyan": 0xFF00FFFF, "darkblue": 0xFF00008B,
+    "darkcyan": 0xFF008B8B, "darkgoldenrod": 0xFFB8860B, "darkgray": 0xFFA9A9A9,
+    "darkgreen": 0xFF006400, "darkgrey": 0xFFA9A9A9, "darkkhaki": 0xFFBDB76B,
+    "darkmagenta": 0xFF8B008B, "darkolivegreen": 0xFF556B2F, "darkorange": 0xFFFF8C00,
+    "darkorchid": 0xFF9932CC, "darkred": 0xFF8B0000, "darksalmon": 0xFFE9967A,
+    "darkseagreen": 0xFF8FBC8F, "darkslateblue": 0xFF483D8B, "darkslategray": 0xFF2F4F4F,
+    "darkslategrey": 0xFF2F4F4F, "darkturquoise": 0xFF00CED1, "darkviolet": 0xFF9400D3,
+    "deeppink": 0xFFFF1493, "deepskyblue": 0xFF00BFFF, "dimgray": 0xFF696969, "dimgrey": 0xFF696969,
+    "dodgerblue": 0xFF1E90FF, "firebrick": 0xFFB22222, "floralwhite": 0xFFFFFAF0,
+    "forestgreen": 0xFF228B22, "fuchsia": 0xFFFF00FF, "gainsboro": 0xFFDCDCDC,
+    "ghostwhite": 0xFFF8F8FF, "gold": 0xFFFFD700, "goldenrod": 0xFFDAA520, "gray": 0xFF808080,
+    "grey": 0xFF808080, "green": 0xFF008000, "greenyellow": 0xFFADFF2F, "honeydew": 0xFFF0FFF0,
+    "hotpink": 0xFFFF69B4, "indianred": 0xFFCD5C5C, "indigo": 0xFF4B0082, "ivory": 0xFFFFFFF0,
+    "khaki": 0xFFF0E68C, "lavender": 0xFFE6E6FA, "lavenderblush": 0xFFFFF0F5,
+    "lawngreen": 0xFF7CFC00, "lemonchiffon": 0xFFFFFACD, "lightblue": 0xFFADD8E6,
+    "lightcoral": 0xFFF08080, "lightcyan": 0xFFE0FFFF, "lightgoldenrodyellow": 0xFFFAFAD2,
+    "lightgray": 0xFFD3D3D3, "lightgreen": 0xFF90EE90, "lightgrey": 0xFFD3D3D3,
+    "lightpink": 0xFFFFB6C1, "lightsalmon": 0xFFFFA07A, "lightseagreen": 0xFF20B2AA,
+    "lightskyblue": 0xFF87CEFA, "lightslategray": 0xFF778899, "lightslategrey": 0xFF778899,
+    "lightsteelblue": 0xFFB0C4DE, "lightyellow": 0xFFFFFFE0, "lime": 0xFF00FF00,
+    "limegreen": 0xFF32CD32, "linen": 0xFFFAF0E6, "magenta": 0xFFFF00FF, "maroon": 0xFF800000,
+    "mediumaquamarine": 0xFF66CDAA, "mediumblue": 0xFF0000CD, "mediumorchid": 0xFFBA55D3,
+    "mediumpurple": 0xFF9370DB, "mediumseagreen": 0xFF3CB371, "mediumslateblue": 0xFF7B68EE,
+    "mediumspringgreen": 0xFF00FA9A, "mediumturquoise": 0xFF48D1CC, "mediumvioletred": 0xFFC71585,
+    "midnightblue": 0xFF191970, "mintcream": 0xFFF5FFFA, "mistyrose": 0xFFFFE4E1,
+    "moccasin": 0xFFFFE4B5, "navajowhite": 0xFFFFDEAD, "navy": 0xFF000080, "oldlace": 0xFFFDF5E6,
+    "olive": 0xFF808000, "olivedrab": 0xFF6B8E23, "orange": 0xFFFFA500, "orangered": 0xFFFF4500,
+    "orchid": 0xFFDA70D6, "palegoldenrod": 0xFFEEE8AA, "palegreen": 0xFF98FB98,
+    "paleturquoise": 0xFFAFEEEE, "palevioletred": 0xFFDB7093, "papayawhip": 0xFFFFEFD5,
+    "peachpuff": 0xFFFFDAB9, "peru": 0xFFCD853F, "pink": 0xFFFFC0CB, "plum": 0xFFDDA0DD,
+    "powderblue": 0xFFB0E0E6, "purple": 0xFF800080, "rebeccapurple": 0xFF663399, "red": 0xFFFF0000,
+    "rosybrown": 0xFFBC8F8F, "royalblue": 0xFF4169E1, "saddlebrown": 0xFF8B4513,
+    "salmon": 0xFFFA8072, "sandybrown": 0xFFF4A460, "seagreen": 0xFF2E8B57, "seashell": 0xFFFFF5EE,
+    "sienna": 0xFFA0522D, "silver": 0xFFC0C0C0, "skyblue": 0xFF87CEEB, "slateblue": 0xFF6A5ACD,
+    "slategray": 0xFF708090, "slategrey": 0xFF708090, "snow": 0xFFFFFAFA, "springgreen": 0xFF00FF7F,
+    "steelblue": 0xFF4682B4, "tan": 0xFFD2B48C, "teal": 0xFF008080, "thistle": 0xFFD8BFD8,
+    "tomato": 0xFFFF6347, "turquoise": 0xFF40E0D0, "violet": 0xFFEE82EE, "wheat": 0xFFF5DEB3,
+    "white": 0xFFFFFFFF, "whitesmoke": 0xFFF5F5F5, "yellow": 0xFFFFFF00, "yellowgreen": 0xFF9ACD32,
+    "transparent": 0x00FFFFFF,
+}
+
+
+@lru_cache(maxsize=4096)
+def _drawing_color(value: int) -> DrawingColor:
+    # Bounded, so images with many distinct colors don't keep every boxed .NET color alive.
+    return DrawingColor.FromArgb((value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+
+class _ColorType(type):
+    """
+    Resolves CSS color names that are not declared on `Color` (e.g. `Color.NAVY`) on first access.
+    """
+    def __getattr__(cls, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = _NAMED_COLORS.get(name.replace("_", "").lower())
+        if value is None:
+            raise AttributeError(f"type object 'Color' has no attribute '{name}'")
+        color = cls.from_argb(value)
+        setattr(cls, name, color)
+        return color
+
+
+class Color(metaclass=_ColorType):
     """
     A class containing commonly used colors.
     """
@@ -37,6 +123,18 @@ class Color:
     PINK = DrawingColor.Pink
     TRANSPARENT = DrawingColor.Transparent
 
+    # Colormap name -> color stops (position 0..1, packed ARGB).
+    _colormaps: Dict[str, List[Tuple[float, int]]] = {
+        "gray": [(0.0, 0xFF000000), (1.0, 0xFFFFFFFF)],
+        "heat": [(0.0, 0xFF000000), (0.4, 0xFFFF0000), (0.8, 0xFFFFFF00), (1.0, 0xFFFFFFFF)],
+        "cool": [(0.0, 0xFF00FFFF), (1.0, 0xFFFF00FF)],
+        "viridis": [
+            (0.0, 0xFF440154), (0.25, 0xFF3B528B), (0.5, 0xFF21918C),
+            (0.75, 0xFF5EC962), (1.0, 0xFFFDE725)
+        ],
+    }
+    _lut_cache: Dict[Tuple[str, int], "np.ndarray"] = {}
+
     @staticmethod
     def rgb(r, g, b):
         """
@@ -50,8 +148,290 @@ class Color:
         Returns:
             System.Drawing.Color: A custom color based on the given RGB values.
         """
-        # Ensure RGB values are within the valid range
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        return DrawingColor.FromArgb(r, g, b)
\ No newline at end of file
+        # Ensure RGB values are within the valid range, as Python ints (numpy components overflow when shifted)
+        r = max(0, min(255, int(r)))
+        g = max(0, min(255, int(g)))
+        b = max(0, min(255, int(b)))
+        return Color.from_argb(0xFF000000 | (r << 16) | (g << 8) | b)
+
+
+    @classmethod
+    def from_argb(cls, value: int) -> DrawingColor:
+        """
+        Get the System.Drawing.Color for a packed 0xAARRGGBB value.
+
+        The .NET color is only created the first time a value is requested, later calls
+        with the same value return the cached instance while it is among the 4096 most recently used.
+
+        Args:
+            value (int): The packed ARGB value.
+
+        Returns:
+            System.Drawing.Color: The color for the given value.
+        """
+        return _drawing_color(int(value) & 0xFFFFFFFF)
+
+
+    @staticmethod
+    def to_argb(color) -> int:
+        """
+        Pack a System.Drawing.Color (or an already packed int) into a 0xAARRGGBB value.
+        """
+        if isinstance(color, numbers.Integral):
+            return int(color) & 0xFFFFFFFF
+        return (color.A << 24) | (color.R << 16) | (color.G << 8) | color.B
+
+
+    @classmethod
+    def parse(cls, value: Union[str, int, Tuple[int, ...], DrawingColor]) -> DrawingColor:
+        """
+        Parse a color from a hex string, a CSS color name, an RGB(A) tuple or a packed ARGB int.
+
+        Results are interned: equal inputs, and inputs describing the same ARGB value,
+        return the same System.Drawing.Color instance. The 1024 most recently parsed inputs are cached.
+
+        Args:
+            value: "#RGB", "#RRGGBB", "#AARRGGBB", a CSS name such as "cornflowerblue",
+                   a (r, g, b) or (r, g, b, a) tuple, a packed ARGB int,
+                   or a System.Drawing.Color which is returned unchanged.
+
+        Returns:
+            System.Drawing.Color: The parsed color.
+        """
+        if isinstance(value, list):
+            value = tuple(value)
+        try:
+            hash(value)
+        except TypeError:
+            return value
+        argb = cls._parse_argb(value)
+        return value if argb is None else cls.from_argb(argb)
+
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_argb(value: object) -> Optional[int]:
+        """
+        Get the packed ARGB value of a `parse` input, or None for inputs returned unchanged.
+        """
+        if isinstance(value, str):
+            argb = Color._parse_string(value)
+        elif isinstance(value, tuple):
+            if len(value) not in (3, 4):
+                raise ValueError(f"Color tuples must have 3 or 4 components, got {len(value)}.")
+            r, g, b, a = (tuple(max(0, min(255, int(c))) for c in value) + (255,))[:4]
+            argb = (a << 24) | (r << 16) | (g << 8) | b
+        elif isinstance(value, numbers.Integral):
+            argb = int(value) & 0xFFFFFFFF
+        else:
+            return None
+        return argb
+
+
+    @staticmethod
+    def _parse_string(value: str) -> int:
+        text = value.strip()
+        if text.startswith("#"):
+            digits = text[1:]
+            # int(..., 16) alone would also accept "0x" and "_". Surrounding whitespace is stripped, as for names.
+            if not all(c in string.hexdigits for c in digits):
+                raise ValueError(f"Invalid hex color: {value}")
+            if len(digits) == 3:
+                digits = "".join(c * 2 for c in digits)
+            if len(digits) == 6:
+                return 0xFF000000 | int(digits, 16)
+            if len(digits) == 8:
+                return int(digits, 16)
+            raise ValueError(f"Invalid hex color: {value}")
+        argb = _NAMED_COLORS.get(text.replace("_", "").replace(" ", "").lower())
+        if argb is None:
+            raise ValueError(f"Unknown color name: {value}")
+        return argb
+
+
+    @staticmethod
+    def rgb_array(rgb, alpha: int = 255) -> "np.ndarray":
+        """
+        Pack an array of RGB values into ARGB values.
+
+        Args:
+            rgb (array-like): An array of shape (..., 3) with components in 0-255.
+            alpha (int): The alpha component applied to every color.
+
+        Returns:
+            numpy.ndarray: A uint32 array of shape (...) with packed ARGB values.
+        """
+        _require_numpy()
+        rgb = np.clip(np.asarray(rgb), 0, 255).astype(np.uint32)
+        if rgb.shape[-1] != 3:
+            raise ValueError("rgb must have a last dimension of size 3.")
+        alpha = np.uint32(max(0, min(255, alpha))) << np.uint32(24)
+        return alpha | (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+    @staticmethod
+    def hsv_array(hsv, alpha: int = 255) -> "np.ndarray":
+        """
+        Pack an array of HSV values into ARGB values.
+
+        Args:
+            hsv (array-like): An array of shape (..., 3) with hue in degrees and
+                              saturation and value in 0-1.
+            alpha (int): The alpha component applied to every color.
+
+        Returns:
+            numpy.ndarray: A uint32 array of shape (...) with packed ARGB values.
+        """
+        _require_numpy()
+        hsv = np.asarray(hsv, dtype=np.float64)
+        if hsv.shape[-1] != 3:
+            raise ValueError("hsv must have a last dimension of size 3.")
+        h = np.mod(hsv[..., 0], 360.0) / 60.0
+        s = np.clip(hsv[..., 1], 0.0, 1.0)
+        v = np.clip(hsv[..., 2], 0.0, 1.0)
+
+        sector = np.floor(h).astype(np.int64) % 6
+        f = h - np.floor(h)
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+
+        r = np.choose(sector, [v, q, p, p, t, v])
+        g = np.choose(sector, [t, v, v, q, p, p])
+        b = np.choose(sector, [p, p, t, v, v, q])
+        rgb = np.stack([r, g, b], axis=-1) * 255.0
+        return Color.rgb_array(np.rint(rgb), alpha)
+
+
+    @staticmethod
+    def hex_array(values: Iterable[str]) -> "np.ndarray":
+        """
+        Pack a sequence of "#RRGGBB" or "#AARRGGBB" strings into ARGB values.
+
+        Returns:
+            numpy.ndarray: A uint32 array with packed ARGB values.
+        """
+        _require_numpy()
+        digits = [value.lstrip("#") for value in values]
+        for value in digits:
+            if len(value) not in (6, 8) or not all(c in string.hexdigits for c in value):
+                raise ValueError(f"Invalid hex color: #{value}")
+        packed = np.fromiter((int(value, 16) for value in digits), dtype=np.uint32, count=len(digits))
+        opaque = np.fromiter((len(value) == 6 for value in digits), dtype=bool, count=len(digits))
+        packed[opaque] |= np.uint32(0xFF000000)
+        return packed
+
+
+    @staticmethod
+    def _channels(packed: "np.ndarray") -> "np.ndarray":
+        packed = np.asarray(packed, dtype=np.uint32)
+        shifts = np.array([24, 16, 8, 0], dtype=np.uint32)
+        return ((packed[..., None] >> shifts) & np.uint32(0xFF)).astype(np.float64)
+
+
+    @staticmethod
+    def _pack(channels: "np.ndarray") -> "np.ndarray":
+        channels = np.clip(np.rint(channels), 0, 255).astype(np.uint32)
+        return (channels[..., 0] << 24) | (channels[..., 1] << 16) | (channels[..., 2] << 8) | channels[..., 3]
+
+
+    @staticmethod
+    def gradient(start, end, steps: int) -> "np.ndarray":
+        """
+        Create a linear gradient between two colors.
+
+        Args:
+            start: The first color (System.Drawing.Color or packed ARGB int).
+            end: The last color (System.Drawing.Color or packed ARGB int).
+            steps (int): The number of colors in the gradient.
+
+        Returns:
+            numpy.ndarray: A uint32 array of `steps` packed ARGB values.
+        """
+        _require_numpy()
+        if steps < 1:
+            raise ValueError("steps must be a positive integer.")
+        first = Color._channels(np.uint32(Color.to_argb(start)))
+        last = Color._channels(np.uint32(Color.to_argb(end)))
+        weights = np.linspace(0.0, 1.0, steps)[:, None]
+        return Color._pack(first + (last - first) * weights)
+
+
+    @classmethod
+    def register_colormap(cls, name: str, stops: Sequence[Tuple[float, object]]):
+        """
+        Register a colormap from (position, color) stops with positions in 0-1.
+        """
+        stops = sorted((float(position), cls.to_argb(color)) for position, color in stops)
+        if len(stops) < 2:
+            raise ValueError("A colormap needs at least two stops.")
+        cls._colormaps[name] = stops
+        for key in [key for key in cls._lut_cache if key[0] == name]:
+            del cls._lut_cache[key]
+
+
+    @classmethod
+    def colormap_lut(cls, name: str = "viridis", size: int = 256) -> "np.ndarray":
+        """
+        Get the precomputed lookup table for a colormap.
+
+        Returns:
+            numpy.ndarray: A uint32 array of `size` packed ARGB values.
+        """
+        _require_numpy()
+        lut = cls._lut_cache.get((name, size))
+        if lut is None:
+            try:
+                stops = cls._colormaps[name]
+            except KeyError:
+                raise ValueError(f"Unknown colormap: {name}") from None
+            positions = np.array([position for position, _ in stops])
+            channels = cls._channels(np.array([color for _, color in stops], dtype=np.uint32))
+            samples = np.linspace(0.0, 1.0, size)
+            lut = cls._pack(np.stack(
+                [np.interp(samples, positions, channels[:, i]) for i in range(4)], axis=-1
+            ))
+            cls._lut_cache[(name, size)] = lut
+        return lut
+
+
+    @classmethod
+    def colormap(cls, values, name: str = "viridis", vmin: float = None, vmax: float = None) -> "np.ndarray":
+        """
+        Map an array of scalar values to colors through a colormap.
+
+        Args:
+            values (array-like): The values to map.
+            name (str): The colormap name ("viridis", "heat", "cool", "gray" or a registered one).
+            vmin (float): The value mapped to the first color. Defaults to the minimum of `values`.
+            vmax (float): The value mapped to the last color. Defaults to the maximum of `values`.
+
+        Returns:
+            numpy.ndarray: A uint32 array with the same shape as `values`.
+        """
+        lut = cls.colormap_lut(name)
+        values = np.asarray(values, dtype=np.float64)
+        vmin = values.min() if vmin is None else vmin
+        vmax = values.max() if vmax is None else vmax
+        scale = (len(lut) - 1) / (vmax - vmin) if vmax > vmin else 0.0
+        indices = np.clip((values - vmin) * scale, 0, len(lut) - 1).astype(np.intp)
+        return lut[indices]
+
+
+    @classmethod
+    def to_drawing(cls, packed) -> List[DrawingColor]:
+        """
+        Convert packed ARGB values to System.Drawing.Color objects.
+
+        Each distinct value is converted once and shared through the color cache.
+
+        Args:
+            packed (array-like): Packed ARGB values.
+
+        Returns:
+            List[System.Drawing.Color]: The colors, flattened in row-major order.
+        """
+        _require_numpy()
+        unique, inverse = np.unique(np.asarray(packed, dtype=np.uint32).ravel(), return_inverse=True)
+        colors = [cls.from_argb(value) for value in unique.tolist()]
+        return [colors[index] for index in inverse.tolist()]
\ No newline at end of file
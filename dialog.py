@@ -3,7 +3,20 @@ clr.AddReference('System.Windows.Forms')
 
 import System.Windows.Forms as Forms
 
+import asyncio
+from concurrent.futures import Future
 from typing import Callable, Type
+from . import dispatch
+
+
+class DialogFuture(Future):
+    """
+    A Future for the DialogResult of a dialog, that can also be awaited from asyncio code.
+    """
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+
 
 class Dialog(Forms.MessageBox):
     """
@@ -14,6 +27,9 @@ class Dialog(Forms.MessageBox):
         - icon (MessageIcon): The icon to display in the message box.
         - result (Callable[[DialogResult], None]): A function that takes a DialogResult and performs actions based on the result.
     """
+    # The class used to show the box. Replace it with a fake to test dialogs without a UI.
+    message_box = Forms.MessageBox
+
     def __init__(
         self,
         message: str = None,
@@ -41,12 +57,61 @@ class Dialog(Forms.MessageBox):
         else:
             self.icon = Forms.MessageBoxIcon(0)
         self.result = result
-        
-        result = self.Show(self.message, self.title, self.buttons, self.icon)
+
+        self.dialog_result = self._show(self.message, self.title, self.buttons, self.icon)
         if self.result:
-            self.result(result)
-            return result
-    
+            self.result(self.dialog_result)
+
+
+    @classmethod
+    def _show(cls, message, title, buttons, icon):
+        return cls.message_box.Show(message, title, buttons, icon)
+
+
+    @classmethod
+    def ask(
+        cls,
+        message: str = None,
+        title: str = None,
+        buttons: Type[any] = None,
+        icon: Type[any] = None,
+        result: Callable = None
+    ) -> DialogFuture:
+        """
+        Show the message box without blocking the caller.
+
+        The box is queued on the UI message loop and shown once the work already queued has run.
+        Its DialogResult is passed to `result` (if given) and set on the returned future.
+
+        Args:
+            - message (str): The message to display in the message box.
+            - title (str): The title of the message box.
+            - buttons (MessageButtons): The buttons to display in the message box.
+            - icon (MessageIcon): The icon to display in the message box.
+            - result (Callable[[DialogResult], None]): A function that takes a DialogResult and performs actions based on the result.
+
+        Returns:
+            DialogFuture: Resolves to the DialogResult. Can be awaited, or cancelled before the box is shown.
+        """
+        future = DialogFuture()
+        buttons = buttons or Forms.MessageBoxButtons.OK
+        icon = icon or Forms.MessageBoxIcon(0)
+
+        def show():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                dialog_result = cls._show(message, title, buttons, icon)
+                if result:
+                    result(dialog_result)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(dialog_result)
+
+        dispatch.post(show)
+        return future
+
 
 
 class MessageButtons:
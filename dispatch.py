@@ -0,0 +1,48 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+from System.Threading import SynchronizationContext, SendOrPostCallback
+
+from typing import Callable, Optional
+
+# The context of the application's UI thread, recorded when the MainWindow is created.
+_ui_context: Optional[SynchronizationContext] = None
+
+
+def capture(context: Optional[SynchronizationContext] = None, replace: bool = True) -> SynchronizationContext:
+    """
+    Record the UI thread that `post` falls back to when called from a thread without a message loop.
+
+    Args:
+        - context (Optional[SynchronizationContext]): The context to record. Defaults to the calling thread's.
+        - replace (bool): Replace a context recorded earlier. If False, the first one recorded is kept.
+
+    Raises:
+        RuntimeError: If no context is given and the calling thread has none.
+    """
+    global _ui_context
+    if not replace and _ui_context is not None:
+        return _ui_context
+    context = context or SynchronizationContext.Current
+    if context is None:
+        raise RuntimeError("The calling thread has no SynchronizationContext, create a control on it first.")
+    _ui_context = context
+    return context
+
+
+def post(callback: Callable, *args, context: Optional[SynchronizationContext] = None):
+    """
+    Queue `callback(*args)` on a UI message loop and return immediately.
+
+    The callback runs once the loop gets to it, after the work that is already queued. It goes to
+    `context` if given, else to the calling thread's loop, else to the UI thread recorded with `capture`.
+
+    Raises:
+        RuntimeError: If there is no UI thread to post to. A context is never created here: on a thread
+        without a message loop the callback would never run.
+    """
+    context = context or SynchronizationContext.Current or _ui_context
+    if context is None:
+        raise RuntimeError("No UI thread to post to: call from a UI thread or create the MainWindow first.")
+    context.Post(SendOrPostCallback(lambda state: callback(*args)), None)
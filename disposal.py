@@ -0,0 +1,117 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+from typing import Any, Dict, Optional
+from .leaks import LeakDetector
+
+
+def own(owner: Any, slot: str, resource: Any) -> Any:
+    """
+    Record that `owner` owns `resource` (a font, image, brush, menu, ...) under `slot`.
+
+    The resource previously stored in the slot is disposed, so replacing a widget's font or image
+    releases the old one immediately. Passing None just releases the slot. Assign the new resource
+    to the control before calling this, so the control never points at a disposed one.
+
+    Returns:
+        Any: `resource`, for chaining.
+    """
+    owned: Optional[Dict[str, Any]] = getattr(owner, "_owned", None)
+    if owned is None:
+        owned = {}
+        owner._owned = owned
+    previous = owned.pop(slot, None)
+    if resource is not None:
+        owned[slot] = resource
+    if previous is not None and previous is not resource:
+        _dispose(previous)
+    return resource
+
+
+def _dispose(resource: Any):
+    dispose = getattr(resource, "Dispose", None) or getattr(resource, "dispose", None)
+    if dispose is not None:
+        dispose()
+
+
+def release(owner: Any, report: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Dispose every resource `owner` owns and detach its event delegates, without disposing `owner` itself.
+
+    Returns:
+        Dict[str, int]: The number of released resources by type name, and of detached "delegates".
+    """
+    report = {} if report is None else report
+    owned = getattr(owner, "_owned", None)
+    if owned:
+        for resource in owned.values():
+            name = type(resource).__name__
+            _dispose(resource)
+            report[name] = report.get(name, 0) + 1
+        owned.clear()
+    events = getattr(owner, "_events", None)
+    if events is not None:
+        delegates = events.native_count
+        events.clear()
+        if delegates:
+            report["delegates"] = report.get("delegates", 0) + delegates
+    return report
+
+
+def release_tree(root: Forms.Control) -> Dict[str, int]:
+    """
+    Release the resources of `root` and of every control below it. The controls themselves are left alone.
+
+    Returns:
+        Dict[str, int]: The number of visited "controls", detached "delegates" and released resources by type name.
+    """
+    report = {"controls": 0}
+    owner = LeakDetector.tag(root.FindForm() or root) if LeakDetector.enabled else None
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        stack.extend(control.Controls)
+        release(control, report)
+        report["controls"] += 1
+        if owner is not None:
+            LeakDetector.track(control, owner)
+    return report
+
+
+def dispose_tree(root: Forms.Control) -> Dict[str, int]:
+    """
+    Release the resources of a control tree, then dispose its native controls.
+
+    Returns:
+        Dict[str, int]: What was released, see `release_tree`.
+    """
+    if root.IsDisposed:
+        return {"controls": 0}
+    report = release_tree(root)
+    root.Dispose()
+    return report
+
+
+
+class Disposable:
+    """
+    Adds `dispose` and the context manager protocol to a widget, e.g. `class Label(Disposable, Forms.Label)`.
+
+    List it before the .NET base class, so its methods take precedence over the ones of the control.
+    """
+    def dispose(self) -> Dict[str, int]:
+        """
+        Dispose the control, its children and the resources they own (fonts, images, brushes, event delegates).
+
+        Returns:
+            Dict[str, int]: The number of released controls, delegates and resources by type name.
+        """
+        return dispose_tree(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.dispose()
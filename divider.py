@@ -7,8 +7,9 @@ import System.Windows.Forms as Forms
 
 from typing import Optional, Tuple
 from .color import Color
+from .disposal import Disposable, own
 
-class Divider(Forms.Panel):
+class Divider(Disposable, Forms.Panel):
     """
     Args:
         - direction (str): The direction of the divider line ('horizontal' or 'vertical').
@@ -32,6 +33,7 @@ class Divider(Forms.Panel):
         self._color = color
         self._location = location
         self._size = size
+        self._brush = None
 
         self.Location = Drawing.Point(*self._location)
         self.Size = Drawing.Size(*self._size)
@@ -93,6 +95,8 @@ class Divider(Forms.Panel):
             value (Optional[Color]): The color of the divider line.
         """
         self._color = value
+        self._brush = None
+        own(self, "brush", None)
         self.Invalidate()  # Redraw the divider line
 
     @property
@@ -139,8 +143,13 @@ class Divider(Forms.Panel):
             sender: The source of the event.
             paint_args: The paint event arguments.
         """
+        if self._color is None:
+            return
+        # Reuse one brush until the color changes instead of allocating one per paint.
+        if self._brush is None:
+            self._brush = own(self, "brush", Drawing.SolidBrush(self._color))
         graphics = paint_args.Graphics
         if self._direction == 'horizontal':
-            graphics.FillRectangle(Drawing.SolidBrush(self._color), 0, (self.Height - self._width) // 2, self.Width, self._width)
+            graphics.FillRectangle(self._brush, 0, (self.Height - self._width) // 2, self.Width, self._width)
         elif self._direction == 'vertical':
-            graphics.FillRectangle(Drawing.SolidBrush(self._color), (self.Width - self._width) // 2, 0, self._width, self.Height)
+            graphics.FillRectangle(self._brush, (self.Width - self._width) // 2, 0, self._width, self.Height)
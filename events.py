@@ -0,0 +1,168 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+
+class weak:
+    """
+    Marks a handler to be held by a weak reference, e.g. `button.on_click = weak(self.save)`.
+
+    The widget then no longer keeps the handler's owner (and whatever its closure captured) alive.
+    Once the owner is collected the handler is skipped.
+
+    Raises:
+        TypeError: If `callback` is not a bound method. Nothing else holds a lambda or a closure,
+        so a weak reference to one would be collected right away.
+    """
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable):
+        if not (hasattr(callback, "__self__") and hasattr(callback, "__func__")):
+            raise TypeError("weak only accepts bound methods, e.g. weak(self.save).")
+        self.callback = callback
+
+
+
+def _reference(callback: Any) -> Callable[[], Optional[Callable]]:
+    """
+    Return a zero-argument function that gives back `callback`, or None once a weak one is gone.
+    """
+    if isinstance(callback, weak):
+        return weakref.WeakMethod(callback.callback)
+    return lambda: callback
+
+
+
+class EventRegistry:
+    """
+    Routes the .NET events of one control to Python subscribers.
+
+    Each event gets at most one native delegate, attached on the first subscriber and detached
+    with the last one. The delegate only holds a weak reference to the registry, so it can't keep
+    the Python side alive on its own. Named handlers (the widget's `on_*` properties) are kept in
+    a table, weakly when wrapped in `weak`. Everything is detached when the control is disposed.
+
+    Args:
+        control (Forms.Control): The control whose events are routed.
+    """
+    def __init__(self, control: Forms.Control):
+        self._control = control
+        self._subscribers: Dict[str, List[Callable[[], Optional[Callable]]]] = {}
+        self._natives: Dict[str, Callable] = {}
+        self._handlers: Dict[str, Callable[[], Optional[Callable]]] = {}
+        self.connect("Disposed", self._on_disposed)
+
+
+    def connect(self, event: str, callback: Any):
+        """
+        Call `callback(sender, args)` when `event` fires. Connecting the same callback twice has no effect.
+
+        Args:
+            - event (str): The name of the .NET event, e.g. "Click" or "TextChanged".
+            - callback (Any): The subscriber, optionally wrapped in `weak`.
+        """
+        target = callback.callback if isinstance(callback, weak) else callback
+        subscribers = self._subscribers.setdefault(event, [])
+        if any(reference() == target for reference in subscribers):
+            return
+        subscribers.append(_reference(callback))
+        if event not in self._natives:
+            self._attach(event)
+
+
+    def disconnect(self, event: str, callback: Callable):
+        """
+        Stop calling `callback` for `event`.
+        """
+        subscribers = self._subscribers.get(event)
+        if not subscribers:
+            return
+        subscribers[:] = [reference for reference in subscribers if reference() not in (None, callback)]
+        if not subscribers:
+            self._detach(event)
+
+
+    def _attach(self, event: str):
+        registry = weakref.ref(self)
+
+        def native(sender, args):
+            target = registry()
+            if target is not None:
+                target._dispatch(event, sender, args)
+
+        binding = getattr(self._control, event)
+        binding += native
+        self._natives[event] = native
+
+
+    def _detach(self, event: str):
+        native = self._natives.pop(event, None)
+        self._subscribers.pop(event, None)
+        if native is not None:
+            binding = getattr(self._control, event)
+            binding -= native
+
+
+    def _dispatch(self, event: str, sender, args):
+        subscribers = self._subscribers.get(event)
+        if not subscribers:
+            return
+        dead = False
+        for reference in list(subscribers):
+            callback = reference()
+            if callback is None:
+                dead = True
+            else:
+                # One failing subscriber must not keep the others from being called.
+                try:
+                    callback(sender, args)
+                except Exception as e:
+                    print(f"Error in {event} handler: {e}")
+        if dead:
+            subscribers[:] = [reference for reference in subscribers if reference() is not None]
+            if not subscribers:
+                self._detach(event)
+
+
+    def set_handler(self, name: str, callback: Any):
+        """
+        Store the handler behind an `on_*` property. None removes it.
+        """
+        if callback is None:
+            self._handlers.pop(name, None)
+        else:
+            self._handlers[name] = _reference(callback)
+
+
+    def handler(self, name: str) -> Optional[Callable]:
+        """
+        Get the handler behind an `on_*` property, or None if it is unset or has been collected.
+        """
+        reference = self._handlers.get(name)
+        return reference() if reference is not None else None
+
+
+    def clear(self):
+        """
+        Detach every native delegate and drop every subscriber and handler.
+        """
+        for event in list(self._natives):
+            self._detach(event)
+        self._subscribers.clear()
+        self._handlers.clear()
+
+
+    def _on_disposed(self, sender, args):
+        self.clear()
+
+
+    @property
+    def native_count(self) -> int:
+        """
+        The number of native delegates currently attached.
+        """
+        return len(self._natives)
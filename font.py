@@ -3,6 +3,11 @@ clr.AddReference('System.Drawing')
 
 from System.Drawing import FontFamily, FontStyle
 
+
+def _name_key(name: str) -> str:
+    return name.replace("_", "").replace("-", "").replace(" ", "").upper()
+
+
 class Font:
     """
     A class containing commonly used fonts and a method for custom font creation.
@@ -12,6 +17,16 @@ class Font:
     MONOSPACE = FontFamily.GenericMonospace
     SANSSERIF = FontFamily.GenericSansSerif
 
+    @classmethod
+    def by_name(cls, name: str) -> FontFamily:
+        """
+        Get a font from its name ("serif", "monospace" or "sansserif"), ignoring case, spaces and underscores.
+        """
+        key = _name_key(name)
+        if key not in ("SERIF", "MONOSPACE", "SANSSERIF"):
+            raise ValueError(f"Unknown font: {name}")
+        return getattr(cls, key)
+
 
 class Style:
     """
@@ -21,4 +36,14 @@ class Style:
 
     REGULAR = FontStyle.Regular
     BOLD = FontStyle.Bold
-    ITALIC = FontStyle.Italic
\ No newline at end of file
+    ITALIC = FontStyle.Italic
+
+    @classmethod
+    def by_name(cls, name: str) -> FontStyle:
+        """
+        Get a font style from its name ("regular", "bold" or "italic"), ignoring case.
+        """
+        key = _name_key(name)
+        if key not in ("REGULAR", "BOLD", "ITALIC"):
+            raise ValueError(f"Unknown font style: {name}")
+        return getattr(cls, key)
\ No newline at end of file
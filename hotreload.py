@@ -0,0 +1,245 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import inspect
+import os
+from typing import Any, Callable, Dict, List, Optional
+from .batch import suspended
+from .disposal import dispose_tree
+from .loader import UI, UILoader, build_node, convert_property
+
+# Per widget class, definition properties exposed under a different property name.
+_PROPERTY_ALIASES = {
+    "ImageBox": {"image": "image_path"},
+}
+
+
+def _property_name(cls: type, name: str) -> Optional[str]:
+    """
+    Get the name of the settable property for a definition property, or None if it is constructor-only.
+    """
+    for base in cls.__mro__:
+        aliases = _PROPERTY_ALIASES.get(base.__name__)
+        if aliases and name in aliases:
+            name = aliases[name]
+            break
+    attribute = getattr(cls, name, None)
+    if isinstance(attribute, property) and attribute.fset is not None:
+        return name
+    return None
+
+
+def _default(cls: type, name: str) -> Any:
+    parameter = inspect.signature(cls.__init__).parameters[name]
+    return None if parameter.default is inspect.Parameter.empty else parameter.default
+
+
+
+class HotReloader:
+    """
+    Watches the definition file of a live UI and applies changes to it in place.
+
+    Old and new trees are matched by node id. Only changed properties are written, new nodes are
+    built and inserted, and removed nodes are removed and disposed. Unchanged controls are kept
+    with their state (focus, scroll position, text typed into a TextInput). A node is rebuilt
+    only when its type changes or a changed property can't be set after construction.
+
+    Args:
+        - ui (UI): The live tree, as returned by `UILoader.load`.
+        - loader (Optional[UILoader]): The loader used to compile the file. Defaults to one without a disk cache.
+        - handlers (Optional[Dict[str, Callable]]): Handlers for "on_*" properties.
+        - interval (int): How often the file is checked for changes, in milliseconds.
+        - on_reload (Optional[Callable[[Dict[str, int]], None]]): Called with the report of each reload.
+    """
+    def __init__(
+        self,
+        ui: UI,
+        loader: Optional[UILoader] = None,
+        handlers: Optional[Dict[str, Callable]] = None,
+        interval: int = 500,
+        on_reload: Optional[Callable[[Dict[str, int]], None]] = None
+    ):
+        if ui.path is None:
+            raise ValueError("The UI has no definition file to watch.")
+        self.ui = ui
+        self.loader = loader or UILoader(cache_dir=False)
+        self.handlers = dict(self.loader.handlers, **(handlers or {}))
+        self.on_reload = on_reload
+        self._mtime = os.stat(ui.path).st_mtime_ns
+        self._timer = Forms.Timer()
+        self._timer.Interval = interval
+        self._timer.Tick += self._on_tick
+
+
+    def start(self):
+        """
+        Start watching the definition file.
+        """
+        self._timer.Start()
+
+
+    def stop(self):
+        """
+        Stop watching the definition file.
+        """
+        self._timer.Stop()
+
+
+    def _on_tick(self, sender, event):
+        try:
+            mtime = os.stat(self.ui.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self.reload()
+
+
+    def reload(self) -> Optional[Dict[str, int]]:
+        """
+        Compile the definition file again and apply the differences to the live tree.
+
+        Returns:
+            Optional[Dict[str, int]]: Counts of updated properties and inserted, removed, moved
+            and rebuilt nodes, or None if the new definition is invalid (the live tree is kept).
+        """
+        try:
+            new = self.loader.compile(self.ui.path)
+        except Exception as e:
+            print(f"Error reloading UI: {e}")
+            return None
+
+        report = {"updated": 0, "inserted": 0, "removed": 0, "moved": 0, "rebuilt": 0}
+        old = self.ui.definition
+        if old is not new:
+            root = self.ui.root
+            with suspended(root):
+                if old["id"] != new["id"] or old["t"] != new["t"]:
+                    self._rebuild(old, new, report)
+                else:
+                    self._remove_detached(old, new, report)
+                    self._diff(old, new, report)
+            self.ui.definition = new
+        if self.on_reload:
+            self.on_reload(report)
+        return report
+
+
+    @staticmethod
+    def _parents(root: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        parents = {root["id"]: None}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for child in node["c"]:
+                parents[child["id"]] = node["id"]
+                stack.append(child)
+        return parents
+
+
+    def _remove_detached(self, old: Dict[str, Any], new: Dict[str, Any], report: Dict[str, int]):
+        """
+        Remove, before anything is inserted, every node that is gone from the new tree or moved to
+        another parent. Moved nodes are built again under their new parent, so an id is never
+        claimed by two controls while the tree is diffed.
+        """
+        old_parents = self._parents(old)
+        new_parents = self._parents(new)
+        stack = list(old["c"])
+        while stack:
+            node = stack.pop()
+            node_id = node["id"]
+            if node_id in new_parents and new_parents[node_id] == old_parents[node_id]:
+                stack.extend(node["c"])
+                continue
+            control = self.ui.widgets[node_id]
+            if control.Parent is not None:
+                control.Parent.Controls.Remove(control)
+            self._forget(node)
+            dispose_tree(control)
+            report["removed"] += 1
+
+
+    def _diff(self, old: Dict[str, Any], new: Dict[str, Any], report: Dict[str, int]):
+        widget = self.ui.widgets[old["id"]]
+        cls = type(widget)
+
+        old_properties = {name: (kind, value) for name, kind, value in old["p"]}
+        new_properties = {name: (kind, value) for name, kind, value in new["p"]}
+        writes = []
+        for name in set(old_properties) | set(new_properties):
+            if old_properties.get(name) == new_properties.get(name):
+                continue
+            property_name = _property_name(cls, name)
+            if property_name is None:
+                self._rebuild(old, new, report)
+                return
+            if name in new_properties:
+                kind, value = new_properties[name]
+                writes.append((property_name, convert_property(kind, value, self.handlers, self.ui.path.parent)))
+            else:
+                writes.append((property_name, _default(cls, name)))
+        for property_name, value in writes:
+            setattr(widget, property_name, value)
+        report["updated"] += len(writes)
+
+        self._diff_children(widget, old["c"], new["c"], report)
+
+
+    def _diff_children(
+        self,
+        widget: Forms.Control,
+        old_children: List[Dict[str, Any]],
+        new_children: List[Dict[str, Any]],
+        report: Dict[str, int]
+    ):
+        if not old_children and not new_children:
+            return
+        # Children that left this parent were removed by `_remove_detached`.
+        old_by_id = {child["id"]: child for child in old_children}
+
+        for index, child in enumerate(new_children):
+            previous = old_by_id.get(child["id"])
+            if previous is None:
+                control = build_node(child, self.handlers, self.ui.widgets, self.ui.path.parent)
+                widget.insert(control)
+                report["inserted"] += 1
+            elif previous["t"] != child["t"]:
+                control = self._rebuild(previous, child, report)
+            else:
+                self._diff(previous, child, report)
+                control = self.ui.widgets[child["id"]]
+            if widget.Controls.GetChildIndex(control) != index:
+                widget.Controls.SetChildIndex(control, index)
+                report["moved"] += 1
+
+
+    def _rebuild(self, old: Dict[str, Any], new: Dict[str, Any], report: Dict[str, int]) -> Forms.Control:
+        """
+        Replace the control of `old` by a freshly built one for `new`, at the same position.
+        """
+        control = self.ui.widgets[old["id"]]
+        parent = control.Parent
+        self._forget(old)
+        replacement = build_node(new, self.handlers, self.ui.widgets, self.ui.path.parent)
+        if parent is not None:
+            if isinstance(getattr(type(parent), "content", None), property) and parent.content == control:
+                parent.content = replacement
+            else:
+                index = parent.Controls.GetChildIndex(control)
+                parent.Controls.Remove(control)
+                parent.Controls.Add(replacement)
+                parent.Controls.SetChildIndex(replacement, index)
+        if control == self.ui.root:
+            self.ui.root = replacement
+        dispose_tree(control)
+        report["rebuilt"] += 1
+        return replacement
+
+
+    def _forget(self, node: Dict[str, Any]):
+        self.ui.widgets.pop(node["id"], None)
+        for child in node["c"]:
+            self._forget(child)
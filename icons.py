@@ -0,0 +1,105 @@
+import clr
+clr.AddReference('System.Drawing')
+
+import System.Drawing as Drawing
+
+import os
+from pathlib import Path
+from threading import RLock
+from typing import Dict, Optional, Tuple, Union
+from .bundle import AssetRef
+
+
+class IconCache:
+    """
+    Process-wide cache of Drawing.Icon objects keyed by file path, modification time and requested size.
+
+    Each (path, size) pair is parsed once and the best-matching frame is shared by every window,
+    splash screen and tray icon that asks for it. When the file changes on disk its entries are
+    dropped and the icon is loaded again on the next request.
+    """
+    _icons: Dict[Tuple[str, int, Optional[Tuple[int, int]]], Drawing.Icon] = {}
+    _lock = RLock()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(
+        cls,
+        path: Union[str, Path, AssetRef],
+        size: Optional[Tuple[int, int]] = None
+    ) -> Drawing.Icon:
+        """
+        Get the icon stored at `path`.
+
+        Args:
+            path (Union[str, Path, AssetRef]): The path to the .ico file, or a reference to one in an asset bundle.
+            size (Optional[Tuple[int, int]]): The preferred frame size. If None, the default frame is used.
+
+        Returns:
+            Drawing.Icon: The shared icon. Do not dispose it.
+        """
+        if isinstance(path, AssetRef):
+            filename = f"{path.bundle.path}::{path.name}"
+            mtime = path.bundle.mtime
+        else:
+            filename = os.path.abspath(str(path))
+            mtime = os.stat(filename).st_mtime_ns
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (filename, mtime, size)
+
+        with cls._lock:
+            icon = cls._icons.get(key)
+            if icon is not None:
+                cls.hits += 1
+                return icon
+            cls.misses += 1
+            cls._drop_stale(filename, mtime)
+
+        source = path.open_stream() if isinstance(path, AssetRef) else filename
+        if size is None:
+            icon = Drawing.Icon(source)
+        else:
+            icon = Drawing.Icon(source, Drawing.Size(size[0], size[1]))
+
+        with cls._lock:
+            # Another thread may have loaded the same icon meanwhile, keep the first one.
+            return cls._icons.setdefault(key, icon)
+
+
+    @classmethod
+    def _drop_stale(cls, filename: str, mtime: int):
+        # Stale icons may still be shown by a window, so they are left to the GC rather than disposed.
+        stale = [key for key in cls._icons if key[0] == filename and key[1] != mtime]
+        for key in stale:
+            del cls._icons[key]
+
+
+    @classmethod
+    def memory_usage(cls) -> int:
+        """
+        Get an estimate of the memory held by the cached icons, in bytes (32-bit pixels per frame).
+        """
+        with cls._lock:
+            icons = list(cls._icons.values())
+        return sum(icon.Width * icon.Height * 4 for icon in icons)
+
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Get the number of cached icons, cache hits, misses and the estimated memory use.
+        """
+        with cls._lock:
+            entries = len(cls._icons)
+        return {"entries": entries, "hits": cls.hits, "misses": cls.misses, "bytes": cls.memory_usage()}
+
+
+    @classmethod
+    def clear(cls):
+        """
+        Drop every cached icon.
+        """
+        with cls._lock:
+            cls._icons.clear()
@@ -0,0 +1,232 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+from . import dispatch
+
+
+class IdleTask:
+    """
+    A generator task run by an `IdleRunner`. Returned by `IdleRunner.submit`.
+
+    Each `yield` in the generator is a point where the runner may pause the task and
+    give the message loop back to input and painting.
+    """
+    __slots__ = ("name", "priority", "done", "cancelled", "result", "error", "steps", "busy_time", "on_done", "_generator", "_runner")
+
+    def __init__(self, runner: "IdleRunner", generator: Generator, priority: int, name: str, on_done: Optional[Callable[[Any], None]]):
+        self._runner = runner
+        self._generator = generator
+        self.name = name
+        self.priority = priority
+        self.on_done = on_done
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.steps = 0
+        self.busy_time = 0.0
+
+
+    def cancel(self):
+        """
+        Stop the task. Its generator is closed, so `finally` blocks run.
+        """
+        self._runner.cancel(self)
+
+
+
+class IdleRunner:
+    """
+    Runs generator tasks on the UI thread while the application is idle, in time slices.
+
+    On each Application.Idle event the runner resumes tasks, highest priority (lowest value) first and
+    round-robin within a priority, until the slice budget is used up, then returns to the message loop.
+    Work that touches controls, such as filling thousands of rows, can then run without freezing the UI:
+
+        def fill(box, rows):
+            for row in rows:
+                box.insert(Label(text=row))
+                yield
+
+        runner.submit(fill(box, rows))
+
+    Args:
+        - slice_ms (float): The time budget per idle event, in milliseconds. At least one step runs per event.
+        - clock (Callable[[], float]): The time source in seconds, for tests.
+    """
+    def __init__(self, slice_ms: float = 8.0, clock: Callable[[], float] = time.perf_counter):
+        self._slice = slice_ms / 1000
+        self._clock = clock
+        self._queue: List[Tuple[int, int, IdleTask]] = []
+        self._sequence = itertools.count()
+        self._scheduled = False
+        self._current: Optional[IdleTask] = None
+        self._stats = {
+            "idle_events": 0, "steps": 0, "busy_time": 0.0, "max_slice": 0.0,
+            "completed": 0, "cancelled": 0, "failed": 0,
+        }
+
+
+    def submit(
+        self,
+        task: Union[Generator, Callable[[], Generator]],
+        priority: int = 0,
+        name: Optional[str] = None,
+        on_done: Optional[Callable[[Any], None]] = None
+    ) -> IdleTask:
+        """
+        Queue a generator task.
+
+        Args:
+            - task (Union[Generator, Callable[[], Generator]]): A generator, or a generator function called with no arguments.
+            - priority (int): Lower values run first.
+            - name (Optional[str]): A name for error messages.
+            - on_done (Optional[Callable[[Any], None]]): Called with the generator's return value when it finishes.
+        """
+        generator = task() if callable(task) else task
+        if name is None:
+            name = getattr(generator, "__name__", "task")
+        idle_task = IdleTask(self, generator, priority, name, on_done)
+        heapq.heappush(self._queue, (priority, next(self._sequence), idle_task))
+        self._schedule()
+        return idle_task
+
+
+    def cancel(self, task: IdleTask):
+        """
+        Stop a task. Cancelled entries are dropped from the queue lazily.
+        A task that cancels itself is closed once its current step returns.
+        """
+        if task.done:
+            return
+        task.done = True
+        task.cancelled = True
+        self._stats["cancelled"] += 1
+        if task is not self._current:
+            task._generator.close()
+
+
+    def _schedule(self):
+        if self._scheduled:
+            return
+        self._scheduled = True
+        Forms.Application.Idle += self._on_idle
+        # Make sure the loop goes idle again soon, even if no other message arrives.
+        dispatch.post(lambda: None)
+
+
+    def _on_idle(self, sender, event):
+        self._stats["idle_events"] += 1
+        self.run(self._slice)
+        if self._queue:
+            # Idle only fires again after a message arrives, so queue one to keep going.
+            dispatch.post(lambda: None)
+        else:
+            Forms.Application.Idle -= self._on_idle
+            self._scheduled = False
+
+
+    def run(self, budget: Optional[float] = None) -> int:
+        """
+        Resume queued tasks on the calling thread until `budget` seconds are used or no tasks remain.
+
+        Returns:
+            int: The number of steps run.
+        """
+        start = self._clock()
+        steps = 0
+        while self._queue:
+            if steps and budget is not None and self._clock() - start >= budget:
+                break
+            priority, _, task = heapq.heappop(self._queue)
+            if task.done:
+                continue
+            self._step(task)
+            steps += 1
+            if not task.done:
+                heapq.heappush(self._queue, (priority, next(self._sequence), task))
+
+        elapsed = self._clock() - start
+        if steps:
+            self._stats["busy_time"] += elapsed
+            self._stats["max_slice"] = max(self._stats["max_slice"], elapsed)
+        return steps
+
+
+    def _step(self, task: IdleTask):
+        start = self._clock()
+        self._current = task
+        try:
+            next(task._generator)
+        except StopIteration as stop:
+            if not task.cancelled:
+                task.done = True
+                task.result = stop.value
+                self._stats["completed"] += 1
+        except Exception as e:
+            print(f"Error in idle task '{task.name}': {e}")
+            if not task.cancelled:
+                task.done = True
+                task.error = e
+                self._stats["failed"] += 1
+        finally:
+            self._current = None
+        if task.cancelled:
+            # Cancelled during its own step, the generator can be closed now.
+            task._generator.close()
+        task.steps += 1
+        task.busy_time += self._clock() - start
+        self._stats["steps"] += 1
+        if task.done and not task.cancelled and task.error is None and task.on_done:
+            try:
+                task.on_done(task.result)
+            except Exception as e:
+                print(f"Error in on_done of idle task '{task.name}': {e}")
+
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._queue if not entry[2].done)
+
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get how much idle time the tasks used.
+
+        Returns:
+            Dict[str, Any]: The number of "idle_events" and "steps", the "busy_time" spent in tasks and the
+            longest slice ("max_slice") in seconds, "slice_usage" (the mean fraction of the slice budget used
+            per idle event), the number of "completed", "cancelled" and "failed" tasks and of "pending" ones.
+        """
+        stats = dict(self._stats)
+        events = stats["idle_events"]
+        stats["slice_usage"] = stats["busy_time"] / (events * self._slice) if events else 0.0
+        stats["pending"] = len(self)
+        return stats
+
+
+
+_local = threading.local()
+
+
+def default_runner() -> IdleRunner:
+    """
+    Get the shared idle runner of the calling UI thread, created on first use.
+    """
+    runner = getattr(_local, "runner", None)
+    if runner is None:
+        runner = _local.runner = IdleRunner()
+    return runner
+
+
+def submit(task: Union[Generator, Callable[[], Generator]], **kwargs) -> IdleTask:
+    """
+    Queue a generator task on the shared idle runner. See `IdleRunner.submit`.
+    """
+    return default_runner().submit(task, **kwargs)
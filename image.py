@@ -8,11 +8,14 @@ import System.Windows.Forms as Forms
 from typing import Optional, Tuple, Callable
 from pathlib import Path
 from .color import Color
+from .bundle import load_image
+from .events import EventRegistry
+from .disposal import Disposable, own
 
-class ImageBox(Forms.PictureBox):
+class ImageBox(Disposable, Forms.PictureBox):
     """
     Args:
-        - image (Path): The path to the image file (.jpg, .png, .bmp), absolute path.
+        - image (Path): The path to the image file (.jpg, .png, .bmp), absolute path, or an AssetRef from an asset bundle.
         - size (Tuple[int, int]): The size of the image control (width, height).
         - background_color (Optional[Color]): The background color of the image control.
         - location (Optional[Tuple[int, int]]): The location of the image control (x, y).
@@ -29,7 +32,7 @@ class ImageBox(Forms.PictureBox):
     ):
         """
         Args:
-            - image (Path): The path to the image file (.jpg, .png, .bmp), absolute path.
+            - image (Path): The path to the image file (.jpg, .png, .bmp), absolute path, or an AssetRef from an asset bundle.
             - size (Tuple[int, int]): The size of the image control (width, height).
             - background_color (Optional[Color]): The background color of the image control.
             - location (Optional[Tuple[int, int]]): The location of the image control (x, y).
@@ -40,7 +43,7 @@ class ImageBox(Forms.PictureBox):
         self._size = size
         self._background_color = background_color
         self._location = location
-        self._on_click = on_click
+        self._events = EventRegistry(self)
 
         self.BackColor = self._background_color
 
@@ -50,16 +53,15 @@ class ImageBox(Forms.PictureBox):
         if self._image_path:
             self._set_image(self._image_path)
 
-
-        if self._on_click:
-            self.Click += self._handle_click
+        self.on_click = on_click
 
 
     def _set_image(self, image_path: Path):
         """Sets the image for the PictureBox from the provided path and adjusts size if necessary."""
         try:
-            image = Drawing.Image.FromFile(str(image_path))
+            image = load_image(image_path)
             self.Image = image
+            own(self, "image", image)
             
             if self._size is None:
                 self._size = (image.Width, image.Height)
@@ -67,6 +69,7 @@ class ImageBox(Forms.PictureBox):
         except Exception as e:
             print(f"Error loading image: {e}")
             self.Image = None
+            own(self, "image", None)
 
 
 
@@ -83,6 +86,7 @@ class ImageBox(Forms.PictureBox):
             self._set_image(value)
         else:
             self.Image = None
+            own(self, "image", None)
 
 
 
@@ -132,22 +136,23 @@ class ImageBox(Forms.PictureBox):
 
     @property
     def on_click(self) -> Optional[Callable[[], None]]:
-        return self._on_click
+        return self._events.handler("on_click")
     
 
 
 
     @on_click.setter
     def on_click(self, value: Optional[Callable[[], None]]):
-        if self._on_click:
-            self.Click -= self._handle_click
-        self._on_click = value
-        if self._on_click:
-            self.Click += self._handle_click
+        self._events.set_handler("on_click", value)
+        if value:
+            self._events.connect("Click", self._handle_click)
+        else:
+            self._events.disconnect("Click", self._handle_click)
 
 
 
     def _handle_click(self, sender, event):
         """Handles the click event and executes the on_click callback if defined."""
-        if self._on_click:
-            self._on_click()
+        handler = self._events.handler("on_click")
+        if handler:
+            handler()
@@ -5,11 +5,13 @@ clr.AddReference('System.Drawing')
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from .color import Color
 from .font import Font, Style
+from .cache import PropertyCache
+from .disposal import Disposable, own
 
-class Label(Forms.Label):
+class Label(Disposable, Forms.Label):
     """
     Args:
         - text (str): The text to display.
@@ -41,6 +43,7 @@ class Label(Forms.Label):
             - size (Optional[int]): The font size. If None, a default size is used.
         """
         super().__init__()
+        self._cache = PropertyCache()
 
         # Initialize properties
         self._text = text
@@ -52,7 +55,7 @@ class Label(Forms.Label):
         self._size = size
 
         # Create font object
-        self._font_object = Drawing.Font(self._font, self._size, self._style)
+        self._font_object = own(self, "font", Drawing.Font(self._font, self._size, self._style))
 
         # Apply initial settings
         self.Text = self._text
@@ -64,6 +67,8 @@ class Label(Forms.Label):
 
         self._adjust_size()
 
+        self.Move += self._handle_move
+
 
     @property
     def text(self) -> str:
@@ -93,7 +98,7 @@ class Label(Forms.Label):
         Sets the font of the text and updates the label.
         """
         self._font = value
-        self.Font = value
+        self._update_font()
 
     @property
     def style(self) -> Style:
@@ -155,7 +160,7 @@ class Label(Forms.Label):
         """
         Gets or sets the (x, y) location of the label within the parent control.
         """
-        return (self.Location.X, self.Location.Y)
+        return self._cache.get("location", self._read_location)
     
 
 
@@ -165,7 +170,22 @@ class Label(Forms.Label):
         Sets the (x, y) location of the label within the parent control.
         """
         self._location = value
-        self.Location = Drawing.Point(value[0], value[1])
+        self._cache.set("location", (value[0], value[1]), self._write_location, self._read_location)
+
+
+    def _read_location(self) -> Tuple[int, int]:
+        location = self.Location
+        return (location.X, location.Y)
+
+    def _write_location(self, location: Tuple[int, int]):
+        self.Location = Drawing.Point(location[0], location[1])
+
+
+    def _handle_move(self, sender, event):
+        """
+        Mark the cached location as dirty when the native control moves.
+        """
+        self._cache.invalidate("location")
 
 
     
@@ -193,11 +213,25 @@ class Label(Forms.Label):
         """
         Updates the font of the label and adjusts the size of the control.
         """
-        self._font_object = Drawing.Font(self._font, self._size, self._style)
-        self.Font = self._font_object
+        font = Drawing.Font(self._font, self._size, self._style)
+        self.Font = font
+        self._font_object = own(self, "font", font)
         self._adjust_size()
 
 
+    def _apply_theme_font(self, values: Dict[str, Any]):
+        """
+        Set the "font", "style" and "size" properties found in `values` and rebuild the font once.
+        """
+        size = values.get("size", self._size)
+        if size <= 0:
+            raise ValueError("Font size must be a positive integer.")
+        self._font = values.get("font", self._font)
+        self._style = values.get("style", self._style)
+        self._size = size
+        self._update_font()
+
+
     def _adjust_size(self):
         """
         Adjust the size of the label to fit the text precisely with a small padding.
@@ -211,4 +245,4 @@ class Label(Forms.Label):
             int(text_size.Height) + padding
         )
 
-        graphics.Dispose()
\ No newline at end of file
+        graphics.Dispose()
@@ -0,0 +1,226 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+from System import Action
+
+import threading
+import traceback
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CancelToken:
+    """
+    Tells a running job that a newer one replaced it. Long jobs should check `cancelled` between steps.
+    """
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+
+
+
+class LatestExecutor:
+    """
+    Runs input-driven jobs off the UI thread and delivers only the newest result per key.
+
+    Each `submit` for a key supersedes the previous job for that key: a job that hasn't started is
+    cancelled, a running one has its `CancelToken` set, and a result that arrives late is discarded.
+    The newest result is delivered to `on_result` on the widget's UI thread with BeginInvoke.
+    Pending jobs are cancelled when the widget is disposed.
+
+        lookup = LatestExecutor(search_input)
+        search_input.on_change = lambda sender, text: lookup.submit(find, text, on_result=show_results)
+
+    Args:
+        - widget (Forms.Control): The widget whose thread receives the results.
+        - max_workers (int): The size of the worker pool, when `executor` is not given.
+        - executor (Optional[Executor]): A pool to run the jobs on instead of a private one.
+    """
+    def __init__(self, widget: Forms.Control, max_workers: int = 2, executor: Optional[Executor] = None):
+        self._widget = widget
+        self._own_pool = executor is None
+        self._pool = executor or ThreadPoolExecutor(max_workers, thread_name_prefix="winformz-latest")
+        self._lock = threading.Lock()
+        self._generations: Dict[Hashable, int] = {}
+        self._jobs: Dict[Hashable, Tuple[Future, CancelToken]] = {}
+        self._closed = False
+        self._stats = {"submitted": 0, "completed": 0, "cancelled": 0, "discarded": 0, "failed": 0}
+        widget.Disposed += self._on_disposed
+
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        key: Hashable = None,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        with_token: bool = False
+    ) -> Future:
+        """
+        Run `fn(*args)` on a worker thread, superseding the previous job with the same key.
+
+        Args:
+            - fn (Callable): The job.
+            - *args: Its arguments.
+            - key (Hashable): Jobs with different keys don't supersede each other.
+            - on_result (Optional[Callable[[Any], None]]): Called on the UI thread with the result, if the job is still the newest.
+            - on_error (Optional[Callable[[BaseException], None]]): Called on the UI thread with the exception, if the job is still the newest.
+            - with_token (bool): Pass a `CancelToken` as the first argument, so the job can stop early.
+
+        Returns:
+            Future: The job's future. It is cancelled, or resolves with the result even if the result is discarded.
+        """
+        token = CancelToken()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The executor is closed.")
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._jobs.get(key)
+            self._stats["submitted"] += 1
+        if previous is not None:
+            self._supersede(*previous)
+
+        call_args = (token,) + args if with_token else args
+        future = self._pool.submit(self._run, fn, call_args, key, generation, token, on_result, on_error)
+        with self._lock:
+            if self._generations.get(key) == generation:
+                self._jobs[key] = (future, token)
+        return future
+
+
+    def _supersede(self, future: Future, token: CancelToken):
+        token.cancel()
+        if future.cancel():
+            self._count("cancelled")
+
+
+    def _is_latest(self, key: Hashable, generation: int) -> bool:
+        with self._lock:
+            return not self._closed and self._generations.get(key) == generation
+
+
+    def _run(self, fn, args, key, generation, token, on_result, on_error):
+        if token.cancelled:
+            self._count("cancelled")
+            return None
+        try:
+            result = fn(*args)
+            error = None
+        except BaseException as e:
+            result = None
+            error = e
+
+        if token.cancelled or not self._is_latest(key, generation):
+            self._count("discarded")
+        else:
+            self._deliver(key, generation, result, error, on_result, on_error)
+        if error is not None:
+            raise error
+        return result
+
+
+    def _deliver(self, key, generation, result, error, on_result, on_error):
+        def deliver():
+            if not self._is_latest(key, generation):
+                self._count("discarded")
+                return
+            with self._lock:
+                self._jobs.pop(key, None)
+            if error is not None:
+                self._count("failed")
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    details = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+                    print(f"Error in background job: {error}\n{details}")
+            else:
+                self._count("completed")
+                if on_result is not None:
+                    on_result(result)
+
+        widget = self._widget
+        if widget.IsDisposed or not widget.IsHandleCreated:
+            self._discard(key, generation)
+            return
+        try:
+            widget.BeginInvoke(Action(deliver))
+        except Exception:
+            # The handle was destroyed in between.
+            self._discard(key, generation)
+
+
+    def _discard(self, key: Hashable, generation: int):
+        """
+        Drop the result of the newest job for `key`, which can't be delivered.
+        """
+        with self._lock:
+            if self._generations.get(key) == generation:
+                self._jobs.pop(key, None)
+            self._stats["discarded"] += 1
+
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+    def cancel(self, key: Hashable = None):
+        """
+        Supersede the job for `key` without starting a new one.
+        """
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            self._supersede(*job)
+
+
+    def cancel_all(self):
+        """
+        Supersede every pending job.
+        """
+        with self._lock:
+            keys = list(self._jobs)
+        for key in keys:
+            self.cancel(key)
+
+
+    def _on_disposed(self, sender, event):
+        self.shutdown()
+
+
+    def shutdown(self):
+        """
+        Cancel every job and stop the private worker pool. Results still in flight are discarded.
+        """
+        self.cancel_all()
+        with self._lock:
+            self._closed = True
+        if self._own_pool:
+            self._pool.shutdown(wait=False)
+
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the job counters.
+
+        Returns:
+            Dict[str, int]: The number of jobs "submitted", "completed" (result delivered), "cancelled"
+            (superseded before they ran), "discarded" (finished after being superseded) and "failed"
+            (exception delivered), and the jobs still "pending".
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._jobs)
+        return stats
@@ -0,0 +1,199 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System as Sys
+import System.Windows.Forms as Forms
+
+import gc
+import os
+import sys
+import types
+import weakref
+from threading import RLock
+from typing import Any, Dict, List, Optional
+
+
+def _describe(obj: Any) -> str:
+    if isinstance(obj, types.ModuleType):
+        return f"module {obj.__name__}"
+    if isinstance(obj, type):
+        return f"class {obj.__qualname__}"
+    if isinstance(obj, (types.FunctionType, types.MethodType)):
+        return f"{type(obj).__name__} {getattr(obj, '__qualname__', '?')}"
+    if isinstance(obj, dict):
+        for module in list(sys.modules.values()):
+            if getattr(module, "__dict__", None) is obj:
+                return f"globals of {module.__name__}"
+        return f"dict ({len(obj)} keys)"
+    if isinstance(obj, (list, tuple, set)):
+        return f"{type(obj).__name__} ({len(obj)} items)"
+    return type(obj).__name__
+
+
+def _is_root(obj: Any) -> bool:
+    return isinstance(obj, (types.ModuleType, type)) or (
+        isinstance(obj, dict) and _describe(obj).startswith("globals of ")
+    )
+
+
+
+class LeakDetector:
+    """
+    Debug helper that finds widgets which outlive the window they belonged to.
+
+    When enabled, every control of a window is added to a weak registry, tagged with the window,
+    as the window closes (see `disposal.release_tree`). After a garbage collection, any control still
+    in the registry is kept alive by something: `survivors` lists them with the chains of objects that
+    refer to them, and `check` fails when there are any, for use in CI.
+
+    Enable it with `LeakDetector.enable()` or by setting the WINFORMZ_TRACK_LEAKS=1 environment variable.
+    Tracking is off by default and costs nothing then.
+    """
+    enabled = os.environ.get("WINFORMZ_TRACK_LEAKS") == "1"
+    _tracked: "weakref.WeakKeyDictionary[Forms.Control, str]" = weakref.WeakKeyDictionary()
+    _lock = RLock()
+
+    @classmethod
+    def enable(cls):
+        """
+        Start tracking the controls of windows as they close.
+        """
+        cls.enabled = True
+
+
+    @classmethod
+    def disable(cls):
+        """
+        Stop tracking and forget every tracked control.
+        """
+        cls.enabled = False
+        with cls._lock:
+            cls._tracked.clear()
+
+
+    @staticmethod
+    def tag(window: Forms.Control) -> str:
+        """
+        Get the label used for the controls of a window, e.g. "Window('Settings')#1a2b3c".
+        """
+        return f"{type(window).__name__}('{window.Text}')#{id(window):x}"
+
+
+    @classmethod
+    def track(cls, control: Forms.Control, owner: str):
+        """
+        Expect `control` to be collected once its owner is gone.
+        """
+        if not cls.enabled:
+            return
+        with cls._lock:
+            cls._tracked[control] = owner
+
+
+    @classmethod
+    def _collect(cls):
+        # Python wrappers of .NET controls are only released once the .NET side lets go of them too.
+        gc.collect()
+        Sys.GC.Collect()
+        Sys.GC.WaitForPendingFinalizers()
+        gc.collect()
+
+
+    @classmethod
+    def survivors(
+        cls,
+        owner: Optional[str] = None,
+        collect: bool = True,
+        depth: int = 6,
+        chains: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        List the tracked controls that are still alive.
+
+        Args:
+            - owner (Optional[str]): Only report the controls of this window tag.
+            - collect (bool): Run the Python and .NET garbage collectors first.
+            - depth (int): How many referrers to follow in each chain.
+            - chains (int): How many chains to report per control, one per direct referrer.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per survivor with its "type", "text", "owner" and
+            "referrers": a list of chains, each a list of descriptions from the direct referrer outwards.
+        """
+        if collect:
+            cls._collect()
+        with cls._lock:
+            items = [(control, tag) for control, tag in cls._tracked.items() if owner is None or tag == owner]
+        controls = [control for control, _ in items]
+        tags = [tag for _, tag in items]
+        del items
+
+        result = []
+        ignore = {id(controls), id(result)}
+        for index in range(len(controls)):
+            control, tag = controls[index], tags[index]
+            result.append({
+                "type": type(control).__name__,
+                "text": str(getattr(control, "Text", "") or ""),
+                "owner": tag,
+                "referrers": cls._referrer_chains(control, depth, chains, ignore),
+            })
+        return result
+
+
+    @classmethod
+    def _referrer_chains(cls, obj: Any, depth: int, limit: int, ignore: set) -> List[List[str]]:
+        frame = sys._getframe()
+        ignore = ignore | {id(frame)}
+
+        def referrers(target: Any, seen: set) -> List[Any]:
+            found = gc.get_referrers(target)
+            ignore.add(id(found))
+            kept = [
+                referrer for referrer in found
+                if id(referrer) not in ignore and id(referrer) not in seen
+                and not isinstance(referrer, types.FrameType)
+            ]
+            ignore.add(id(kept))
+            return kept
+
+        result = []
+        for first in referrers(obj, {id(obj)})[:limit]:
+            chain = [_describe(first)]
+            seen = {id(obj), id(first)}
+            current = first
+            while len(chain) < depth and not _is_root(current):
+                parents = referrers(current, seen)
+                if not parents:
+                    break
+                current = parents[0]
+                seen.add(id(current))
+                chain.append(_describe(current))
+            result.append(chain)
+        return result
+
+
+    @classmethod
+    def format(cls, survivors: List[Dict[str, Any]]) -> str:
+        """
+        Format the result of `survivors` as readable text.
+        """
+        if not survivors:
+            return "No leaked widgets."
+        lines = [f"{len(survivors)} leaked widget(s):"]
+        for survivor in survivors:
+            text = f" '{survivor['text']}'" if survivor["text"] else ""
+            lines.append(f"  {survivor['type']}{text} of {survivor['owner']}")
+            for chain in survivor["referrers"]:
+                lines.append("    <- " + " <- ".join(chain))
+        return "\n".join(lines)
+
+
+    @classmethod
+    def check(cls, owner: Optional[str] = None):
+        """
+        Raise AssertionError listing the survivors if any tracked control is still alive.
+        """
+        survivors = cls.survivors(owner)
+        if survivors:
+            raise AssertionError(cls.format(survivors))
@@ -0,0 +1,346 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from .box import Box
+from .bundle import AssetBundle
+from .button import Button
+from .color import Color
+from .divider import Divider
+from .font import Font, Style
+from .image import ImageBox
+from .label import Label
+from .textinput import TextInput
+
+# Bump when the compiled form changes, so stale cache files are ignored.
+FORMAT_VERSION = 1
+
+_RESERVED = ("type", "id", "children")
+
+WIDGETS: Dict[str, type] = {
+    "Box": Box,
+    "Button": Button,
+    "Divider": Divider,
+    "ImageBox": ImageBox,
+    "Label": Label,
+    "TextInput": TextInput,
+}
+
+_parameters: Dict[type, Tuple[str, ...]] = {}
+
+
+def register_widget(name: str, cls: type):
+    """
+    Make a widget class available to UI definition files under `name`.
+    """
+    WIDGETS[name] = cls
+    _parameters.pop(cls, None)
+
+
+def _widget_parameters(cls: type) -> Tuple[str, ...]:
+    parameters = _parameters.get(cls)
+    if parameters is None:
+        signature = inspect.signature(cls.__init__)
+        parameters = tuple(name for name in signature.parameters if name != "self")
+        _parameters[cls] = parameters
+    return parameters
+
+
+def _schema_key() -> str:
+    """
+    Describe the registered widgets and their parameters, so compiled definitions are
+    recompiled when the widget set changes.
+    """
+    return ";".join(
+        f"{name}={cls.__module__}.{cls.__qualname__}({','.join(_widget_parameters(cls))})"
+        for name, cls in sorted(WIDGETS.items())
+    )
+
+
+def _default_cache_dir() -> Path:
+    base = os.environ.get("LOCALAPPDATA") or tempfile.gettempdir()
+    return Path(base) / "WinFormZ" / "ui-cache"
+
+
+
+def _compile_value(where: str, name: str, value: Any) -> List[Any]:
+    """
+    Validate one property and return its compiled [name, kind, value] entry.
+    """
+    if value is None:
+        return [name, "raw", None]
+    if name.startswith("on_"):
+        if not isinstance(value, str):
+            raise ValueError(f"{where}: '{name}' must be the name of a handler.")
+        return [name, "handler", value]
+    if name.endswith("color"):
+        if isinstance(value, list):
+            value = tuple(value)
+        return [name, "color", Color.to_argb(Color.parse(value))]
+    if name in ("font", "text_font"):
+        Font.by_name(value)
+        return [name, "font", value]
+    if name in ("style", "text_style"):
+        Style.by_name(value)
+        return [name, "style", value]
+    if name in ("image", "icon"):
+        if isinstance(value, dict):
+            if set(value) != {"bundle", "name"}:
+                raise ValueError(f"{where}: '{name}' bundle references need exactly 'bundle' and 'name'.")
+            return [name, "asset", [value["bundle"], value["name"]]]
+        return [name, "path", str(value)]
+    if isinstance(value, list):
+        return [name, "tuple", value]
+    return [name, "raw", value]
+
+
+def compile_definition(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a parsed UI definition and convert it to its compact compiled form.
+
+    Every node is a table with a "type", an optional "id", optional "children"
+    (for containers such as Box) and the widget's constructor arguments.
+    Nodes without an id get one from their position, e.g. "root/0/2".
+
+    Raises:
+        ValueError: If the definition is invalid.
+    """
+    ids = set()
+
+    def compile_node(node: Any, auto_id: str) -> Dict[str, Any]:
+        if not isinstance(node, dict):
+            raise ValueError(f"{auto_id}: a node must be a table.")
+        type_name = node.get("type")
+        cls = WIDGETS.get(type_name)
+        if cls is None:
+            raise ValueError(f"{auto_id}: unknown widget type '{type_name}'.")
+        node_id = str(node.get("id", auto_id))
+        if node_id in ids:
+            raise ValueError(f"{auto_id}: duplicate id '{node_id}'.")
+        ids.add(node_id)
+
+        where = f"{type_name} '{node_id}'"
+        parameters = _widget_parameters(cls)
+        properties = []
+        for name, value in node.items():
+            if name in _RESERVED:
+                continue
+            if name not in parameters:
+                raise ValueError(f"{where}: unknown property '{name}'.")
+            properties.append(_compile_value(where, name, value))
+
+        children = node.get("children", [])
+        if children and not hasattr(cls, "insert"):
+            raise ValueError(f"{where}: {type_name} can't have children.")
+        compiled_children = [
+            compile_node(child, f"{node_id}/{index}") for index, child in enumerate(children)
+        ]
+        return {"t": type_name, "id": node_id, "p": properties, "c": compiled_children}
+
+    return compile_node(data, "root")
+
+
+
+class UI:
+    """
+    A widget tree built from a UI definition.
+
+    Args:
+        - root (Forms.Control): The top widget.
+        - widgets (Dict[str, Forms.Control]): The widgets by id.
+        - definition (Dict[str, Any]): The compiled definition the tree was built from.
+        - path (Optional[Path]): The definition file.
+    """
+    def __init__(
+        self,
+        root: Forms.Control,
+        widgets: Dict[str, Forms.Control],
+        definition: Dict[str, Any],
+        path: Optional[Path] = None
+    ):
+        self.root = root
+        self.widgets = widgets
+        self.definition = definition
+        self.path = path
+
+    def __getitem__(self, widget_id: str) -> Forms.Control:
+        return self.widgets[widget_id]
+
+    def __contains__(self, widget_id: str) -> bool:
+        return widget_id in self.widgets
+
+
+
+class UILoader:
+    """
+    Loads UI definition files (.json, or .toml on Python 3.11+) into widget trees.
+
+    Compiled definitions are cached in memory and on disk under the hash of the file content
+    and of the registered widgets, so unchanged files skip parsing and validation on later loads
+    and later starts. Relative image, icon and bundle paths are resolved against the definition file.
+
+    Args:
+        - cache_dir (Optional[Union[str, Path, bool]]): Where compiled definitions are stored. None uses
+          %LOCALAPPDATA%\\WinFormZ\\ui-cache (or the temp directory), False disables the disk cache.
+        - handlers (Optional[Dict[str, Callable]]): Handlers that "on_*" properties can refer to by name.
+    """
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path, bool]] = None,
+        handlers: Optional[Dict[str, Callable]] = None
+    ):
+        if cache_dir is None:
+            cache_dir = _default_cache_dir()
+        self.cache_dir = Path(cache_dir) if cache_dir is not False else None
+        self.handlers = dict(handlers or {})
+        self._compiled: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"parsed": 0, "memory_hits": 0, "disk_hits": 0}
+
+
+    def compile(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Get the compiled definition of a file, from the cache when its content is unchanged.
+        """
+        path = Path(path)
+        content = path.read_bytes()
+        digest = hashlib.sha256(
+            f"{FORMAT_VERSION}:{_schema_key()}:{path.suffix.lower()}:".encode("utf-8") + content
+        ).hexdigest()
+
+        compiled = self._compiled.get(digest)
+        if compiled is not None:
+            self.stats["memory_hits"] += 1
+            return compiled
+
+        cache_file = self.cache_dir / f"{digest}.json" if self.cache_dir is not None else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                compiled = json.loads(cache_file.read_text("utf-8"))
+                self.stats["disk_hits"] += 1
+            except (OSError, ValueError):
+                compiled = None
+
+        if compiled is None:
+            compiled = compile_definition(self._parse(path, content))
+            self.stats["parsed"] += 1
+            if cache_file is not None:
+                self._write_cache(cache_file, compiled)
+
+        self._compiled[digest] = compiled
+        return compiled
+
+
+    @staticmethod
+    def _parse(path: Path, content: bytes) -> Dict[str, Any]:
+        suffix = path.suffix.lower()
+        if suffix == ".json":
+            return json.loads(content.decode("utf-8"))
+        if suffix == ".toml":
+            if tomllib is None:
+                raise ImportError("Reading .toml UI definitions requires Python 3.11 or newer.")
+            return tomllib.loads(content.decode("utf-8"))
+        raise ValueError(f"Unsupported UI definition format: {path.suffix}")
+
+
+    @staticmethod
+    def _write_cache(cache_file: Path, compiled: Dict[str, Any]):
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(compiled, separators=(",", ":")), "utf-8")
+            os.replace(temporary, cache_file)
+        except OSError as e:
+            print(f"Error writing UI cache: {e}")
+
+
+    def load(self, path: Union[str, Path], handlers: Optional[Dict[str, Callable]] = None) -> UI:
+        """
+        Build the widget tree described by a definition file.
+
+        Args:
+            - path (Union[str, Path]): The definition file.
+            - handlers (Optional[Dict[str, Callable]]): Extra handlers for this load, on top of the loader's.
+
+        Returns:
+            UI: The built tree.
+        """
+        definition = self.compile(path)
+        all_handlers = dict(self.handlers, **(handlers or {}))
+        widgets: Dict[str, Forms.Control] = {}
+        path = Path(path)
+        root = build_node(definition, all_handlers, widgets, path.parent)
+        return UI(root, widgets, definition, path)
+
+
+
+def convert_property(kind: str, value: Any, handlers: Dict[str, Callable], base: Optional[Path] = None) -> Any:
+    """
+    Turn a compiled property value into the value passed to the widget.
+    Relative file paths are resolved against `base`, the directory of the definition file.
+    """
+    if kind == "raw" or value is None:
+        return value
+    if kind == "tuple":
+        return tuple(value)
+    if kind == "color":
+        return Color.from_argb(value)
+    if kind == "font":
+        return Font.by_name(value)
+    if kind == "style":
+        return Style.by_name(value)
+    if kind == "path":
+        return base / value if base is not None else Path(value)
+    if kind == "asset":
+        bundle = base / value[0] if base is not None else value[0]
+        return AssetBundle.open(bundle).ref(value[1])
+    if kind == "handler":
+        try:
+            return handlers[value]
+        except KeyError:
+            raise ValueError(f"No handler named '{value}'.") from None
+    raise ValueError(f"Unknown property kind: {kind}")
+
+
+def build_node(
+    node: Dict[str, Any],
+    handlers: Dict[str, Callable],
+    widgets: Dict[str, Forms.Control],
+    base: Optional[Path] = None
+) -> Forms.Control:
+    """
+    Build a compiled node and its children, inserting the children in a single bulk call.
+    """
+    cls = WIDGETS[node["t"]]
+    kwargs = {name: convert_property(kind, value, handlers, base) for name, kind, value in node["p"]}
+    widget = cls(**kwargs)
+    widgets[node["id"]] = widget
+    if node["c"]:
+        widget.insert([build_node(child, handlers, widgets, base) for child in node["c"]])
+    return widget
+
+
+_default_loader: Optional[UILoader] = None
+
+
+def load_ui(path: Union[str, Path], handlers: Optional[Dict[str, Callable]] = None) -> UI:
+    """
+    Build the widget tree of a definition file with the shared default loader.
+    """
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = UILoader()
+    return _default_loader.load(path, handlers)
@@ -4,9 +4,312 @@ clr.AddReference('System.Drawing')
 
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
+from System import Action
+from System.Drawing.Drawing2D import SmoothingMode
+from System.Drawing.Text import TextRenderingHint
 
-from typing import Optional, List, Type
+import ctypes
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, List, Tuple, Type
 from pathlib import Path
+from .icons import IconCache
+from .disposal import own, release
+
+
+class _Alert:
+    __slots__ = ("title", "text", "icon", "count", "updated")
+
+    def __init__(self, title: str, text: str, icon, now: float):
+        self.title = title
+        self.text = text
+        self.icon = icon
+        self.count = 1
+        self.updated = now
+
+
+
+class NotificationQueue:
+    """
+    Rate-limited queue of balloon notifications that merges alerts sharing a key. Safe to use from any thread.
+
+    Args:
+        - min_interval (float): The minimum number of seconds between two balloons.
+        - max_age (float): Alerts not updated for this many seconds are dropped instead of shown.
+        - summary (str): The text of a merged balloon. Can use {count}, {key}, {title} and {text}.
+        - clock (Callable[[], float]): The time source, in seconds.
+    """
+    def __init__(
+        self,
+        min_interval: float = 5.0,
+        max_age: float = 60.0,
+        summary: str = "{count} new {key}",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.min_interval = min_interval
+        self.max_age = max_age
+        self.summary = summary
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._alerts: "OrderedDict[Hashable, _Alert]" = OrderedDict()
+        self._last_shown: Optional[float] = None
+        self._sequence = 0
+        self._pushed = 0
+        self._merged = 0
+        self._shown = 0
+        self._dropped = 0
+
+
+    def push(self, title: str, text: str, key: Optional[Hashable] = None, icon=None):
+        """
+        Queue an alert. Alerts with the same key are merged into one summary balloon.
+
+        Args:
+            - title (str): The balloon title.
+            - text (str): The balloon text.
+            - key (Optional[Hashable]): The merge key. If None, the alert is never merged.
+            - icon: The Forms.ToolTipIcon of the balloon.
+        """
+        now = self._clock()
+        with self._lock:
+            self._pushed += 1
+            if key is None:
+                self._sequence += 1
+                key = (NotificationQueue, self._sequence)
+            alert = self._alerts.get(key)
+            if alert is None:
+                self._alerts[key] = _Alert(title, text, icon, now)
+            else:
+                alert.title = title
+                alert.text = text
+                alert.icon = icon
+                alert.count += 1
+                alert.updated = now
+                self._merged += 1
+
+
+    def pop(self) -> Optional[Tuple[str, str, object]]:
+        """
+        Get the next balloon to show, if the rate limit allows one now.
+
+        Returns:
+            Optional[Tuple[str, str, object]]: (title, text, icon), or None if nothing is due.
+        """
+        now = self._clock()
+        with self._lock:
+            self._drop_stale(now)
+            if not self._alerts or self.next_due() > 0:
+                return None
+            key, alert = self._alerts.popitem(last=False)
+            self._last_shown = now
+            self._shown += 1
+        text = alert.text
+        if alert.count > 1:
+            text = self.summary.format(count=alert.count, key=key, title=alert.title, text=alert.text)
+        return (alert.title, text, alert.icon)
+
+
+    def next_due(self) -> float:
+        """
+        Get the number of seconds until the rate limit allows the next balloon.
+        """
+        with self._lock:
+            if self._last_shown is None:
+                return 0.0
+            return max(0.0, self._last_shown + self.min_interval - self._clock())
+
+
+    def clear(self):
+        """
+        Drop every queued alert.
+        """
+        with self._lock:
+            self._dropped += sum(alert.count for alert in self._alerts.values())
+            self._alerts.clear()
+
+
+    def _drop_stale(self, now: float):
+        stale = [key for key, alert in self._alerts.items() if now - alert.updated > self.max_age]
+        for key in stale:
+            self._dropped += self._alerts.pop(key).count
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._alerts)
+
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get the queue counters: pending balloons, pushed, merged, shown and dropped alerts.
+        """
+        with self._lock:
+            return {
+                "pending": len(self._alerts),
+                "pushed": self._pushed,
+                "merged": self._merged,
+                "shown": self._shown,
+                "dropped": self._dropped,
+            }
+
+
+
+class TrayIconRenderer:
+    """
+    Renders badge, progress and animation frames on top of a base icon and caches them by state.
+
+    Every distinct state is rendered once and the same Drawing.Icon is reused for later updates,
+    so cycling through N badge values allocates N icons in total. Call `dispose` to release them.
+
+    Args:
+        - base_icon (Drawing.Icon): The icon the frames are drawn on.
+        - size (Optional[Tuple[int, int]]): The size of the rendered icons. Defaults to the small system icon size.
+        - badge_color (Drawing.Color): The background color of the badge.
+        - badge_text_color (Drawing.Color): The text color of the badge.
+        - progress_color (Drawing.Color): The color of the progress bar and the animation arc.
+    """
+    def __init__(
+        self,
+        base_icon: Drawing.Icon,
+        size: Optional[Tuple[int, int]] = None,
+        badge_color: Drawing.Color = Drawing.Color.Red,
+        badge_text_color: Drawing.Color = Drawing.Color.White,
+        progress_color: Drawing.Color = Drawing.Color.LimeGreen
+    ):
+        self._base_icon = base_icon
+        if size is None:
+            small = Forms.SystemInformation.SmallIconSize
+            size = (small.Width, small.Height)
+        self._size = size
+        self._badge_color = badge_color
+        self._badge_text_color = badge_text_color
+        self._progress_color = progress_color
+        self._frames: Dict[Tuple, Drawing.Icon] = {}
+        self._font = None
+        self.allocated = 0
+
+
+    def render(
+        self,
+        badge: Optional[object] = None,
+        progress: Optional[float] = None,
+        frame: Optional[int] = None,
+        frames: int = 8
+    ) -> Drawing.Icon:
+        """
+        Get the icon for a state, rendering it on first use.
+
+        Args:
+            - badge (Optional[object]): A count or short text drawn in the top-right corner. Counts above 99 show as "99+".
+            - progress (Optional[float]): A progress bar value between 0 and 1, drawn along the bottom edge.
+            - frame (Optional[int]): The frame of a spinning arc animation.
+            - frames (int): The number of frames in the animation cycle.
+
+        Returns:
+            Drawing.Icon: The cached icon for the state. It stays owned by the renderer.
+        """
+        if isinstance(badge, int) and badge > 99:
+            badge = "99+"
+        if progress is not None:
+            progress = round(max(0.0, min(1.0, progress)) * 100)
+        if frame is not None:
+            frame = frame % frames
+        key = (badge, progress, frame, frames if frame is not None else None)
+
+        icon = self._frames.get(key)
+        if icon is None:
+            icon = self._draw(badge, progress, frame, frames)
+            self._frames[key] = icon
+            self.allocated += 1
+        return icon
+
+
+    def _draw(self, badge, progress, frame, frames) -> Drawing.Icon:
+        width, height = self._size
+        bitmap = Drawing.Bitmap(width, height)
+        graphics = Drawing.Graphics.FromImage(bitmap)
+        try:
+            graphics.SmoothingMode = SmoothingMode.AntiAlias
+            graphics.TextRenderingHint = TextRenderingHint.AntiAliasGridFit
+            graphics.DrawIcon(self._base_icon, Drawing.Rectangle(0, 0, width, height))
+
+            if frame is not None:
+                pen = Drawing.Pen(self._progress_color, max(1, width // 8))
+                try:
+                    inset = max(1, width // 8)
+                    graphics.DrawArc(
+                        pen, inset, inset, width - 2 * inset, height - 2 * inset,
+                        frame * 360.0 / frames, 90.0
+                    )
+                finally:
+                    pen.Dispose()
+
+            if progress is not None:
+                bar_height = max(2, height // 6)
+                top = height - bar_height
+                back = Drawing.SolidBrush(Drawing.Color.FromArgb(160, 0, 0, 0))
+                fill = Drawing.SolidBrush(self._progress_color)
+                try:
+                    graphics.FillRectangle(back, 0, top, width, bar_height)
+                    graphics.FillRectangle(fill, 0, top, int(width * progress / 100), bar_height)
+                finally:
+                    back.Dispose()
+                    fill.Dispose()
+
+            if badge is not None and badge != "":
+                text = str(badge)
+                diameter = max(8, int(height * 0.6))
+                badge_width = max(diameter, int(diameter * (0.45 + 0.35 * len(text))))
+                rect = Drawing.Rectangle(width - badge_width, 0, badge_width, diameter)
+                if self._font is None:
+                    self._font = Drawing.Font(
+                        "Segoe UI", diameter * 0.7, Drawing.FontStyle.Bold, Drawing.GraphicsUnit.Pixel
+                    )
+                back = Drawing.SolidBrush(self._badge_color)
+                fore = Drawing.SolidBrush(self._badge_text_color)
+                layout = Drawing.StringFormat()
+                try:
+                    layout.Alignment = Drawing.StringAlignment.Center
+                    layout.LineAlignment = Drawing.StringAlignment.Center
+                    graphics.FillEllipse(back, rect)
+                    graphics.DrawString(
+                        text, self._font, fore,
+                        Drawing.RectangleF(rect.X, rect.Y, rect.Width, rect.Height), layout
+                    )
+                finally:
+                    back.Dispose()
+                    fore.Dispose()
+                    layout.Dispose()
+        finally:
+            graphics.Dispose()
+
+        handle = bitmap.GetHicon()
+        try:
+            # Clone copies the handle so the icon owns it, then the temporary handle is destroyed.
+            icon = Drawing.Icon.FromHandle(handle).Clone()
+        finally:
+            ctypes.windll.user32.DestroyIcon(ctypes.c_void_p(handle.ToInt64()))
+            bitmap.Dispose()
+        return icon
+
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+    def dispose(self):
+        """
+        Dispose every rendered icon and the badge font.
+        """
+        for icon in self._frames.values():
+            icon.Dispose()
+        self._frames.clear()
+        if self._font is not None:
+            self._font.Dispose()
+            self._font = None
+
 
 
 class NotifyIcon(Forms.NotifyIcon):
@@ -15,32 +318,53 @@ class NotifyIcon(Forms.NotifyIcon):
         - icon (Path): A Path object pointing to the icon file to be displayed in the system tray.
         - commands : Optional. A list of tuples representing context menu commands. If None, no context menu will be set up.
         - popup (Optional[str]): The text to display as a tooltip when hovering over the notify icon.
+        - notifications (Optional[NotificationQueue]): The queue used by `notify`. Defaults to one balloon every 5 seconds.
+        - balloon_timeout (int): How long a balloon stays visible, in milliseconds.
     """
     def __init__(
         self,
         icon: Path = None,
         commands: Optional[List[Type]] = None,
-        popup: Optional[str] = None
+        popup: Optional[str] = None,
+        notifications: Optional[NotificationQueue] = None,
+        balloon_timeout: int = 3000
     ):
         """
         Args:
             - icon: A Path object pointing to the icon file to be displayed in the system tray.
             - commands: Optional. A list of tuples representing context menu commands. If None, no context menu will be set up.
             - popup (Optional[str]): The text to display as a tooltip when hovering over the notify icon.
+            - notifications (Optional[NotificationQueue]): The queue used by `notify`. Defaults to one balloon every 5 seconds.
+            - balloon_timeout (int): How long a balloon stays visible, in milliseconds.
         """
         super().__init__()
         self._icon = icon
         self._commands = commands
         self._popup = popup
+        self._notifications = notifications or NotificationQueue()
+        self._balloon_timeout = balloon_timeout
+        self._balloon_timer = None
+        self._renderer = None
+        self._state = (None, None, None)
+        self._animation_timer = None
+        self._animation_frame = 0
+        self._animation_frames = 8
+        # Lets `notify` start the balloon timer on this thread from any thread.
+        self._invoker = own(self, "invoker", Forms.Control())
+        self._invoker.Handle
 
         if self._icon:
-            self.Icon = Drawing.Icon(str(self._icon))
+            small = Forms.SystemInformation.SmallIconSize
+            self._base_icon = IconCache.get(self._icon, (small.Width, small.Height))
+            self.Icon = self._base_icon
+        else:
+            self._base_icon = None
 
         if self._popup:
             self.Text = self._popup
         
         if self._commands:
-            self.context_menu = Forms.ContextMenuStrip()
+            self.context_menu = own(self, "context_menu", Forms.ContextMenuStrip())
             for command in self._commands:
                 self.context_menu.Items.Add(command)
             self.ContextMenuStrip = self.context_menu
@@ -69,6 +393,141 @@ class NotifyIcon(Forms.NotifyIcon):
 
 
 
+    @property
+    def notifications(self) -> NotificationQueue:
+        """
+        Gets the balloon notification queue, e.g. to read its metrics.
+        """
+        return self._notifications
+
+
+    def notify(
+        self,
+        title: str,
+        text: str,
+        key: Optional[Hashable] = None,
+        icon: Forms.ToolTipIcon = Forms.ToolTipIcon.Info
+    ):
+        """
+        Queue a balloon notification.
+
+        Balloons are rate limited, and alerts with the same key that arrive before their balloon
+        is shown are merged into a single summary (e.g. "12 new errors" for key "errors").
+        Can be called from any thread: the balloon timer always runs on the thread that created the icon.
+
+        Args:
+            - title (str): The balloon title.
+            - text (str): The balloon text.
+            - key (Optional[Hashable]): The merge key. If None, the alert is never merged.
+            - icon (Forms.ToolTipIcon): The icon of the balloon.
+        """
+        self._notifications.push(title, text, key, icon)
+        if self._invoker.InvokeRequired:
+            try:
+                self._invoker.BeginInvoke(Action(self._arm_balloon))
+            except Exception:
+                # The icon was hidden and disposed in between.
+                pass
+        else:
+            self._arm_balloon()
+
+
+    def _arm_balloon(self):
+        if self._invoker.IsDisposed:
+            return
+        if self._balloon_timer is None:
+            self._balloon_timer = Forms.Timer()
+            self._balloon_timer.Tick += self._on_balloon_tick
+        if not self._balloon_timer.Enabled:
+            self._schedule_balloon()
+
+
+    def _schedule_balloon(self):
+        self._balloon_timer.Interval = max(1, int(self._notifications.next_due() * 1000))
+        self._balloon_timer.Start()
+
+
+    def _on_balloon_tick(self, sender, event):
+        """
+        Shows the next due balloon and re-arms the timer while alerts are pending.
+        """
+        self._balloon_timer.Stop()
+        balloon = self._notifications.pop()
+        if balloon is not None:
+            title, text, icon = balloon
+            self.ShowBalloonTip(self._balloon_timeout, title, text, icon)
+        if len(self._notifications):
+            self._schedule_balloon()
+
+
+    @property
+    def renderer(self) -> Optional[TrayIconRenderer]:
+        """
+        Gets the renderer of the dynamic icon frames, created from the base icon on first use.
+        """
+        if self._renderer is None and self._base_icon is not None:
+            self._renderer = TrayIconRenderer(self._base_icon)
+        return self._renderer
+
+
+    def set_state(
+        self,
+        badge: Optional[object] = None,
+        progress: Optional[float] = None
+    ):
+        """
+        Show a badge and/or a progress bar on the tray icon. With no arguments the base icon is restored.
+
+        Rendered states are cached, so switching back to a previous state reuses its icon.
+
+        Args:
+            - badge (Optional[object]): An unread count or short text shown as a badge.
+            - progress (Optional[float]): A progress value between 0 and 1.
+        """
+        self._state = (badge, progress, self._state[2])
+        self._update_icon()
+
+
+    def animate(self, interval: int = 100, frames: int = 8):
+        """
+        Start a spinning animation on the tray icon, on top of the current badge and progress.
+
+        Args:
+            - interval (int): The time between frames, in milliseconds.
+            - frames (int): The number of frames in one turn.
+        """
+        self._animation_frames = frames
+        if self._animation_timer is None:
+            self._animation_timer = Forms.Timer()
+            self._animation_timer.Tick += self._on_animation_tick
+        self._animation_timer.Interval = interval
+        self._animation_timer.Start()
+
+
+    def stop_animation(self):
+        """
+        Stop the spinning animation.
+        """
+        if self._animation_timer is not None:
+            self._animation_timer.Stop()
+        self._state = (self._state[0], self._state[1], None)
+        self._update_icon()
+
+
+    def _on_animation_tick(self, sender, event):
+        self._animation_frame = (self._animation_frame + 1) % self._animation_frames
+        self._state = (self._state[0], self._state[1], self._animation_frame)
+        self._update_icon()
+
+
+    def _update_icon(self):
+        badge, progress, frame = self._state
+        if badge is None and progress is None and frame is None:
+            self.Icon = self._base_icon
+        elif self.renderer is not None:
+            self.Icon = self._renderer.render(badge, progress, frame, self._animation_frames)
+
+
     def show(self):
         """
         Displays the NotifyIcon in the system tray.
@@ -77,7 +536,19 @@ class NotifyIcon(Forms.NotifyIcon):
 
     def hide(self):
         """
-        Hides the NotifyIcon from the system tray and disposes of the icon resources.
+        Hides the NotifyIcon from the system tray and disposes of the icon resources, including rendered frames.
         """
         self.Visible = False
-        self.Dispose()
\ No newline at end of file
+        if self._balloon_timer is not None:
+            self._balloon_timer.Stop()
+            self._balloon_timer.Dispose()
+            self._balloon_timer = None
+        if self._animation_timer is not None:
+            self._animation_timer.Stop()
+            self._animation_timer.Dispose()
+            self._animation_timer = None
+        release(self)
+        self.Dispose()
+        if self._renderer is not None:
+            self._renderer.dispose()
+            self._renderer = None
\ No newline at end of file
@@ -0,0 +1,154 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from .idle import IdleRunner, IdleTask, default_runner
+
+
+class Prebuilder:
+    """
+    Builds windows that are likely to be opened next while the application is idle.
+
+    Queued windows get their content factory built (and optionally their native handles created)
+    one at a time by a task on an `IdleRunner`, so building shares the runner's per-slice time budget
+    with other idle work and input stays responsive. Opening a prebuilt window then only has to show it.
+
+    Args:
+        - create_handles (bool): Also create the native handles of prebuilt windows.
+        - runner (Optional[IdleRunner]): The runner to build on. Defaults to the shared one.
+        - priority (int): The priority of the build task on the runner. Lower values run first.
+    """
+    def __init__(self, create_handles: bool = False, runner: Optional[IdleRunner] = None, priority: int = 10):
+        self._create_handles = create_handles
+        self._runner = runner
+        self._priority = priority
+        self._task: Optional[IdleTask] = None
+        self._queue: List[Tuple[int, int, Any]] = []
+        self._sequence = itertools.count()
+        self._windows: Dict[str, Forms.Form] = {}
+        self.stats = {"built": 0, "failed": 0, "build_time": 0.0}
+
+
+    def add(self, item: Union[Forms.Form, Callable[[], Forms.Form]], key: Optional[str] = None, priority: int = 0):
+        """
+        Queue a window to be built while idle.
+
+        Args:
+            - item (Union[Forms.Form, Callable[[], Forms.Form]]): A window with a pending content factory,
+              or a callable that creates the window.
+            - key (Optional[str]): The name to get the window back with `take`. Required for callables.
+            - priority (int): Lower values are built first.
+        """
+        if not isinstance(item, Forms.Form) and key is None:
+            raise ValueError("A key is required to prebuild a window factory.")
+        heapq.heappush(self._queue, (priority, next(self._sequence), (item, key)))
+        self.schedule()
+
+
+    def schedule(self):
+        """
+        Start building on the UI thread while the application is idle.
+        """
+        if not self._queue or (self._task is not None and not self._task.done):
+            return
+        runner = self._runner or default_runner()
+        self._task = runner.submit(self._build_queued(), priority=self._priority, name="prebuild")
+
+
+    def _build_queued(self):
+        while self._queue:
+            _, _, (item, key) = heapq.heappop(self._queue)
+            self._build(item, key)
+            yield
+
+
+    def cancel(self):
+        """
+        Stop building in the background. Queued windows stay queued, see `run` and `take`.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+    def run(self, budget: Optional[float] = None) -> int:
+        """
+        Build queued windows on the calling thread.
+
+        Args:
+            budget (Optional[float]): Stop starting new items after this many seconds. At least one item is built.
+
+        Returns:
+            int: The number of windows built.
+        """
+        start = time.perf_counter()
+        built = 0
+        while self._queue:
+            if built and budget is not None and time.perf_counter() - start >= budget:
+                break
+            _, _, (item, key) = heapq.heappop(self._queue)
+            self._build(item, key)
+            built += 1
+        return built
+
+
+    def step(self) -> bool:
+        """
+        Build the next queued window. Returns whether more remain.
+        """
+        if self._queue:
+            _, _, (item, key) = heapq.heappop(self._queue)
+            self._build(item, key)
+        return bool(self._queue)
+
+
+    def _build(self, item: Any, key: Optional[str]):
+        start = time.perf_counter()
+        try:
+            window = item if isinstance(item, Forms.Form) else item()
+            build = getattr(window, "build", None)
+            if build is not None:
+                build()
+            if self._create_handles:
+                # CreateControl does nothing while the window is hidden; reading Handle forces it.
+                stack = [window]
+                while stack:
+                    control = stack.pop()
+                    control.Handle
+                    stack.extend(control.Controls)
+            if key is not None:
+                self._windows[key] = window
+            self.stats["built"] += 1
+        except Exception as e:
+            print(f"Error prebuilding window: {e}")
+            self.stats["failed"] += 1
+        self.stats["build_time"] += time.perf_counter() - start
+
+
+    def take(self, key: str, factory: Optional[Callable[[], Forms.Form]] = None) -> Optional[Forms.Form]:
+        """
+        Get a prebuilt window by key, removing it from the prebuilder.
+
+        If it hasn't been built yet it is dropped from the queue and, when `factory` is given, built now.
+        """
+        window = self._windows.pop(key, None)
+        if window is not None:
+            return window
+        for index, (_, _, (item, item_key)) in enumerate(self._queue):
+            if item_key == key:
+                del self._queue[index]
+                heapq.heapify(self._queue)
+                if isinstance(item, Forms.Form):
+                    return item
+                factory = factory or item
+                break
+        return factory() if factory is not None else None
+
+
+    def __len__(self) -> int:
+        return len(self._queue)
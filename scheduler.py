@@ -0,0 +1,273 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import heapq
+import itertools
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ScheduledTask:
+    """
+    A callback registered with a `Scheduler`. Returned by `Scheduler.every` and `Scheduler.once`.
+    """
+    __slots__ = ("id", "callback", "args", "interval", "name", "due", "active", "runs", "skipped", "_scheduler")
+
+    def __init__(self, scheduler: "Scheduler", task_id: int, callback: Callable, args: tuple, interval: Optional[float], name: Optional[str]):
+        self._scheduler = scheduler
+        self.id = task_id
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.name = name or getattr(callback, "__name__", "task")
+        self.due = 0.0
+        self.active = True
+        self.runs = 0
+        self.skipped = 0
+
+
+    def cancel(self):
+        """
+        Stop running the task.
+        """
+        self._scheduler.cancel(self)
+
+
+
+class Scheduler:
+    """
+    Runs periodic and one-off callbacks on the UI thread from a single Forms.Timer.
+
+    Tasks are kept in a priority queue ordered by due time, and the timer is re-armed for the
+    earliest one after every tick, so the message loop wakes once for all tasks instead of once
+    per task. Periodic tasks are aligned to multiples of their interval, so tasks with the same
+    (or a multiple) interval fire in the same tick, and tasks due within `slack` of each other are
+    run together. A task that falls behind skips the periods it missed instead of running in a burst.
+
+    Args:
+        - slack (int): Tasks due within this many milliseconds of a tick run in that tick.
+        - clock (Callable[[], float]): The time source in seconds, for tests.
+    """
+    def __init__(self, slack: int = 10, clock: Callable[[], float] = time.monotonic):
+        self._slack = slack / 1000
+        self._clock = clock
+        self._queue: List[Tuple[float, int, ScheduledTask]] = []
+        self._sequence = itertools.count()
+        self._ids = itertools.count(1)
+        self._active = 0
+        self._paused = False
+        self._armed_for: Optional[float] = None
+        self._timer = Forms.Timer()
+        self._timer.Tick += self._on_tick
+        self._stats = {
+            "ticks": 0, "runs": 0, "late_ticks": 0, "max_lateness": 0.0,
+            "overruns": 0, "skipped_periods": 0, "max_tick_time": 0.0, "tick_time": 0.0,
+        }
+
+
+    def every(
+        self,
+        interval: int,
+        callback: Callable,
+        *args,
+        align: bool = True,
+        name: Optional[str] = None
+    ) -> ScheduledTask:
+        """
+        Run `callback(*args)` every `interval` milliseconds.
+
+        Args:
+            - interval (int): The period, in milliseconds.
+            - callback (Callable): The function to run.
+            - align (bool): Start on the next multiple of `interval`, so tasks with related periods fire together.
+              If False, the first run is one full interval from now.
+            - name (Optional[str]): A name for the task in `stats`.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        task = ScheduledTask(self, next(self._ids), callback, args, interval / 1000, name)
+        now = self._clock()
+        if align:
+            task.due = (math.floor(now / task.interval) + 1) * task.interval
+        else:
+            task.due = now + task.interval
+        self._push(task)
+        return task
+
+
+    def once(self, delay: int, callback: Callable, *args, name: Optional[str] = None) -> ScheduledTask:
+        """
+        Run `callback(*args)` once, `delay` milliseconds from now.
+        """
+        task = ScheduledTask(self, next(self._ids), callback, args, None, name)
+        task.due = self._clock() + max(delay, 0) / 1000
+        self._push(task)
+        return task
+
+
+    def cancel(self, task: ScheduledTask):
+        """
+        Stop running a task. Cancelled entries are dropped from the queue lazily.
+        """
+        if not task.active:
+            return
+        self._deactivate(task)
+        if not self._active:
+            self._queue.clear()
+            self._rearm()
+        elif self._queue and self._queue[0][2] is task:
+            # The timer is armed for this task, aim it at the next one instead.
+            self._rearm()
+
+
+    def _deactivate(self, task: ScheduledTask):
+        task.active = False
+        self._active -= 1
+
+
+    def _push(self, task: ScheduledTask):
+        self._active += 1
+        heapq.heappush(self._queue, (task.due, next(self._sequence), task))
+        if self._armed_for is None or task.due < self._armed_for:
+            self._rearm()
+
+
+    def _rearm(self):
+        while self._queue and not self._queue[0][2].active:
+            heapq.heappop(self._queue)
+        if self._paused or not self._queue:
+            self._timer.Stop()
+            self._armed_for = None
+            return
+        due = self._queue[0][0]
+        self._armed_for = due
+        self._timer.Stop()
+        self._timer.Interval = max(1, int(math.ceil((due - self._clock()) * 1000)))
+        self._timer.Start()
+
+
+    def _on_tick(self, sender, event):
+        start = self._clock()
+        stats = self._stats
+        stats["ticks"] += 1
+        if self._armed_for is not None:
+            lateness = start - self._armed_for
+            if lateness > self._slack:
+                stats["late_ticks"] += 1
+                stats["max_lateness"] = max(stats["max_lateness"], lateness)
+
+        horizon = start + self._slack
+        due: List[ScheduledTask] = []
+        while self._queue and self._queue[0][0] <= horizon:
+            task = heapq.heappop(self._queue)[2]
+            if task.active:
+                due.append(task)
+
+        for task in due:
+            if not task.active or self._paused:
+                if task.active:
+                    heapq.heappush(self._queue, (task.due, next(self._sequence), task))
+                continue
+            try:
+                task.callback(*task.args)
+            except Exception as e:
+                print(f"Error in scheduled task '{task.name}': {e}")
+            task.runs += 1
+            stats["runs"] += 1
+            if task.interval is None:
+                if task.active:
+                    self._deactivate(task)
+            elif task.active:
+                self._advance(task, self._clock())
+                heapq.heappush(self._queue, (task.due, next(self._sequence), task))
+
+        elapsed = self._clock() - start
+        stats["tick_time"] += elapsed
+        stats["max_tick_time"] = max(stats["max_tick_time"], elapsed)
+        self._rearm()
+
+
+    def _advance(self, task: ScheduledTask, now: float):
+        """
+        Move a periodic task to its next period, skipping the ones that already passed.
+        """
+        task.due += task.interval
+        if task.due <= now:
+            missed = math.floor((now - task.due) / task.interval) + 1
+            task.due += missed * task.interval
+            task.skipped += missed
+            self._stats["overruns"] += 1
+            self._stats["skipped_periods"] += missed
+
+
+    def pause(self):
+        """
+        Stop running tasks until `resume` is called. The timer stops waking the message loop.
+        """
+        self._paused = True
+        self._rearm()
+
+
+    def resume(self):
+        """
+        Run tasks again. Periods missed while paused are skipped, not replayed.
+        """
+        if not self._paused:
+            return
+        self._paused = False
+        now = self._clock()
+        tasks = [entry[2] for entry in self._queue if entry[2].active]
+        self._queue.clear()
+        for task in tasks:
+            if task.interval is not None and task.due < now:
+                task.due = now + task.interval - (now - task.due) % task.interval
+            self._queue.append((task.due, next(self._sequence), task))
+        heapq.heapify(self._queue)
+        self._rearm()
+
+
+    @property
+    def paused(self) -> bool:
+        """
+        Whether the scheduler is paused.
+        """
+        return self._paused
+
+
+    def __len__(self) -> int:
+        return self._active
+
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get tick statistics.
+
+        Returns:
+            Dict[str, Any]: The number of "ticks" and task "runs", "late_ticks" (the timer fired more than
+            `slack` after the earliest due task) and the "max_lateness" in seconds, "overruns" (a task was
+            still behind after running) and "skipped_periods", the "max_tick_time" and total "tick_time"
+            in seconds, the number of active "tasks", and in "per_task" the "name", "runs" and "skipped"
+            periods of each active task by task id.
+        """
+        stats = dict(self._stats)
+        tasks = [entry[2] for entry in self._queue if entry[2].active]
+        stats["tasks"] = self._active
+        stats["per_task"] = {
+            task.id: {"name": task.name, "runs": task.runs, "skipped": task.skipped} for task in tasks
+        }
+        return stats
+
+
+    def dispose(self):
+        """
+        Cancel every task and release the timer.
+        """
+        for entry in self._queue:
+            entry[2].active = False
+        self._queue.clear()
+        self._active = 0
+        self._timer.Stop()
+        self._timer.Dispose()
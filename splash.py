@@ -5,18 +5,21 @@ clr.AddReference('System.Drawing')
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 
+import time
 from typing import Optional, Tuple
 from threading import Thread
 from .app import App
 from pathlib import Path
 from .color import Color
+from .bundle import load_image
+from .warmup import Warmup
 
 
 
 class Splash(Forms.Form):
     """
     Args:
-        - image (Optional[Path]): The path to the image file to be displayed on the splash screen.
+        - image (Optional[Path]): The path to the image file to be displayed on the splash screen, or an AssetRef from an asset bundle.
         - size (Tuple[int, int], optional): The desired size of the splash screen. If None, the size will be set to the dimensions of the image.
         - clean_color (Optional[Color]): A color that will be made transparent (if set).
         - location (Tuple[int, int], default (0, 0)): The location on the screen where the splash screen will be displayed if `center_screen` is False.
@@ -34,7 +37,7 @@ class Splash(Forms.Form):
     ):
         """
         Args:
-            - image (Optional[Path]): The path to the image file to be displayed on the splash screen.
+            - image (Optional[Path]): The path to the image file to be displayed on the splash screen, or an AssetRef from an asset bundle.
             - size (Tuple[int, int], optional): The desired size of the splash screen. If None, the size will be set to the dimensions of the image.
             - clean_color (Optional[Color]): A color that will be made transparent (if set).
             - location (Tuple[int, int], default (0, 0)): The location on the screen where the splash screen will be displayed if `center_screen` is False.
@@ -60,7 +63,7 @@ class Splash(Forms.Form):
             self.StartPosition = Forms.FormStartPosition.Manual
             self.Location = Drawing.Point(self._location[0], self._location[1])
 
-        splash_image = Drawing.Image.FromFile(str(self._image))
+        splash_image = load_image(self._image)
 
         if not self._size:
             self._size = (splash_image.Width, splash_image.Height)
@@ -76,7 +79,13 @@ class Splash(Forms.Form):
         self.BackgroundImageLayout = Forms.ImageLayout.Zoom
 
     
-    def show(self):
+    def show(self, warmup: Optional[Warmup] = None):
+        """
+        Display the splash screen.
+
+        Args:
+            - warmup (Optional[Warmup]): Classes to pre-warm on the calling thread while the splash is displayed.
+        """
 
         def show_splash():
             Forms.Application.Run(self)
@@ -84,6 +93,10 @@ class Splash(Forms.Form):
         thread = Thread(target=show_splash)
         thread.start()
 
-        thread.join(4)
+        start = time.perf_counter()
+        if warmup:
+            warmup.run(budget=4)
+
+        thread.join(max(0, 4 - (time.perf_counter() - start)))
 
         self.Close()
\ No newline at end of file
@@ -5,11 +5,14 @@ clr.AddReference('System.Drawing')
 import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 
-from typing import Optional, Tuple, Callable, Type
+from typing import Any, Dict, Optional, Tuple, Callable, Type
 from .color import Color
 from .font import Font, Style
+from .cache import PropertyCache
+from .events import EventRegistry
+from .disposal import Disposable, own
 
-class TextInput(Forms.TextBox):
+class TextInput(Disposable, Forms.TextBox):
     """
     Args:
         - value (str): The initial value to display.
@@ -65,6 +68,7 @@ class TextInput(Forms.TextBox):
             - on_change (Optional[Callable[[Type], None]]): Handler for the text change event.
         """
         super().__init__()
+        self._cache = PropertyCache()
 
         self._value = value
         self._placeholder = placeholder
@@ -78,7 +82,7 @@ class TextInput(Forms.TextBox):
         self._width = width
         self._multiline = multiline
 
-        self._font_object = Drawing.Font(self._font, self._text_size, self._style)
+        self._font_object = own(self, "font", Drawing.Font(self._font, self._text_size, self._style))
 
         self.Text = self._value
         self.ForeColor = self._text_color
@@ -91,23 +95,21 @@ class TextInput(Forms.TextBox):
             self.Width = self._width
 
         self._placeholder_color = placeholder_color
-        self._on_enter_handler = on_enter
-        self._on_leave_handler = on_leave
-        self._on_confirm_handler = on_confirm
-        self._on_change_handler = on_change
         self._update_placeholder()
 
         if not self._width:
             self._adjust_text_size()
 
-        if self._on_enter_handler:
-            self.Enter += self._on_enter_handler
-        if self._on_leave_handler:
-            self.Leave += self._on_leave_handler
-        if self._on_confirm_handler:
-            self.KeyDown += self._on_key_down
-        if self._on_change_handler:
-            self.TextChanged += self._on_text_changed
+        # Enter and Leave are always routed, they show and hide the placeholder.
+        self._events = EventRegistry(self)
+        self._events.connect("Enter", self._on_enter)
+        self._events.connect("Leave", self._on_leave)
+        self.on_enter = on_enter
+        self.on_leave = on_leave
+        self.on_confirm = on_confirm
+        self.on_change = on_change
+
+        self.Move += self._handle_move
 
 
 
@@ -267,7 +269,7 @@ class TextInput(Forms.TextBox):
         """
         Gets or sets the (x, y) location of the text input control within its parent container.
         """
-        return (self.Location.X, self.Location.Y)
+        return self._cache.get("location", self._read_location)
     
 
 
@@ -277,7 +279,22 @@ class TextInput(Forms.TextBox):
         Sets the (x, y) location of the text input control within its parent container.
         """
         self._location = value
-        self.Location = Drawing.Point(value[0], value[1])
+        self._cache.set("location", (value[0], value[1]), self._write_location, self._read_location)
+
+
+    def _read_location(self) -> Tuple[int, int]:
+        location = self.Location
+        return (location.X, location.Y)
+
+    def _write_location(self, location: Tuple[int, int]):
+        self.Location = Drawing.Point(location[0], location[1])
+
+
+    def _handle_move(self, sender, event):
+        """
+        Mark the cached location as dirty when the native control moves.
+        """
+        self._cache.invalidate("location")
 
 
 
@@ -291,9 +308,9 @@ class TextInput(Forms.TextBox):
 
 
     @text_size.setter
-    def size(self, value: int):
+    def text_size(self, value: int):
         """
-        Sets the font size of the text and updates the label.
+        Sets the font size of the text and updates the text input control.
         """
         if value <= 0:
             raise ValueError("Font size must be a positive integer.")
@@ -326,7 +343,7 @@ class TextInput(Forms.TextBox):
         """
         Gets or sets the handler for the Enter event.
         """
-        return self._on_enter_handler
+        return self._events.handler("on_enter")
     
 
 
@@ -336,9 +353,7 @@ class TextInput(Forms.TextBox):
         """
         Sets the handler for the Enter event.
         """
-        if self._on_enter_handler:
-            self.Enter -= self._on_enter_handler
-        self._on_enter_handler = handler
+        self._events.set_handler("on_enter", handler)
 
 
 
@@ -348,7 +363,7 @@ class TextInput(Forms.TextBox):
         """
         Gets or sets the handler for the Leave event.
         """
-        return self._on_leave_handler
+        return self._events.handler("on_leave")
     
 
 
@@ -358,9 +373,7 @@ class TextInput(Forms.TextBox):
         """
         Sets the handler for the Leave event.
         """
-        if self._on_leave_handler:
-            self.Leave -= self._on_leave_handler
-        self._on_leave_handler = handler
+        self._events.set_handler("on_leave", handler)
 
 
 
@@ -370,7 +383,7 @@ class TextInput(Forms.TextBox):
         """
         Gets or sets the handler for the Enter key press event.
         """
-        return self._on_confirm_handler
+        return self._events.handler("on_confirm")
     
     
 
@@ -380,9 +393,11 @@ class TextInput(Forms.TextBox):
         """
         Sets the handler for the Enter key press event.
         """
-        if self._on_confirm_handler:
-            self.KeyDown -= self._on_key_down
-        self._on_confirm_handler = handler
+        self._events.set_handler("on_confirm", handler)
+        if handler:
+            self._events.connect("KeyDown", self._on_key_down)
+        else:
+            self._events.disconnect("KeyDown", self._on_key_down)
 
 
 
@@ -392,7 +407,7 @@ class TextInput(Forms.TextBox):
         """
         Gets or sets the handler for the text change event.
         """
-        return self._on_change_handler
+        return self._events.handler("on_change")
     
 
 
@@ -402,9 +417,11 @@ class TextInput(Forms.TextBox):
         """
         Sets the handler for the text change event.
         """
-        if self._on_change_handler:
-            self.TextChanged -= self._on_text_changed
-        self._on_change_handler = handler
+        self._events.set_handler("on_change", handler)
+        if handler:
+            self._events.connect("TextChanged", self._on_text_changed)
+        else:
+            self._events.disconnect("TextChanged", self._on_text_changed)
 
 
     
@@ -420,11 +437,25 @@ class TextInput(Forms.TextBox):
         """
         Updates the font of the text input control based on the current font settings.
         """
-        self._font_object = Drawing.Font(self._font, self._text_size, self._style)
-        self.Font = self._font_object
+        font = Drawing.Font(self._font, self._text_size, self._style)
+        self.Font = font
+        self._font_object = own(self, "font", font)
         self._adjust_text_size()
 
 
+    def _apply_theme_font(self, values: Dict[str, Any]):
+        """
+        Set the "font", "style" and "text_size" properties found in `values` and rebuild the font once.
+        """
+        size = values.get("text_size", self._text_size)
+        if size <= 0:
+            raise ValueError("Font size must be a positive integer.")
+        self._font = values.get("font", self._font)
+        self._style = values.get("style", self._style)
+        self._text_size = size
+        self._update_font()
+
+
 
 
     def _adjust_text_size(self):
@@ -461,8 +492,9 @@ class TextInput(Forms.TextBox):
         """
         Event handler for when the text input control receives focus. Clears the placeholder text if it is currently displayed.
         """
-        if self._on_enter_handler:
-            self._on_enter_handler(sender, event)
+        handler = self._events.handler("on_enter")
+        if handler:
+            handler(sender, event)
         if self.Text == self._placeholder:
             self.Text = ""
             self.ForeColor = self._text_color
@@ -473,8 +505,9 @@ class TextInput(Forms.TextBox):
         """
         Event handler for when the text input control loses focus. Re-displays the placeholder text if the input is empty.
         """
-        if self._on_leave_handler:
-            self._on_leave_handler(sender, event)
+        handler = self._events.handler("on_leave")
+        if handler:
+            handler(sender, event)
         if not self.Text:
             self._update_placeholder()
 
@@ -486,8 +519,9 @@ class TextInput(Forms.TextBox):
         the current text. The event is marked as handled to prevent further processing.
         """
         if event.KeyCode == Forms.Keys.Enter:
-            if self._on_confirm_handler:
-                self._on_confirm_handler(sender, self.Text)
+            handler = self._events.handler("on_confirm")
+            if handler:
+                handler(sender, self.Text)
             event.Handled = True
 
 
@@ -497,5 +531,6 @@ class TextInput(Forms.TextBox):
         The on_change handler (if defined) is called with the current text whenever the
         text in the input control changes.
         """
-        if self._on_change_handler:
-            self._on_change_handler(sender, self.Text)
+        handler = self._events.handler("on_change")
+        if handler:
+            handler(sender, self.Text)
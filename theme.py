@@ -0,0 +1,186 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+from typing import Any, Dict, List, Optional, Tuple
+from .batch import containers, suspended
+from .color import Color
+from .font import Font, Style
+
+
+# Widget class name -> default theme role. Subclasses resolve through their MRO.
+_TYPE_ROLES = {
+    "MainWindow": "window",
+    "Window": "window",
+    "Box": "box",
+    "Label": "label",
+    "Button": "button",
+    "TextInput": "input",
+    "ImageBox": "image",
+    "Divider": "divider",
+}
+
+# Per widget class, the theme keys that map to a differently named widget property.
+_TYPE_ALIASES = {
+    "Label": {"text_size": "size"},
+    "Button": {"font": "text_font", "style": "text_style"},
+}
+
+_FONT_KEYS = {"font", "style", "text_size"}
+_COLOR_KEYS = {"background_color", "text_color", "color", "placeholder_color"}
+
+
+def _same(current, value, key: str) -> bool:
+    if current is value:
+        return True
+    if current is None or value is None:
+        return False
+    if key in _COLOR_KEYS:
+        return Color.to_argb(current) == Color.to_argb(value)
+    return current == value
+
+
+class Theme:
+    """
+    Args:
+        - name (str): The name of the theme.
+        - roles (Dict[str, Dict[str, Any]]): Maps a role ("window", "box", "label", "button",
+          "input", "image", "divider" or a custom one) to the properties applied to widgets with that role.
+          Supported keys are background_color, text_color, placeholder_color, color, font, style and text_size.
+          Colors accept anything `Color.parse` does, fonts and styles accept their names ("serif", "bold").
+
+    A widget can opt into a custom role by setting a `theme_role` attribute.
+    """
+    def __init__(
+        self,
+        name: str = "theme",
+        roles: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Args:
+            - name (str): The name of the theme.
+            - roles (Dict[str, Dict[str, Any]]): Maps a role to the properties applied to widgets with that role.
+        """
+        self.name = name
+        self._roles = {role: dict(values) for role, values in (roles or {}).items()}
+        self._resolved: Dict[str, Dict[str, Any]] = {}
+        self._plans: Dict[Tuple[type, Optional[str]], Tuple[List[Tuple[str, str, Any]], bool]] = {}
+
+
+    def role(self, name: str) -> Dict[str, Any]:
+        """
+        Get the resolved properties of a role, with colors, fonts and styles converted to .NET values.
+        """
+        resolved = self._resolved.get(name)
+        if resolved is None:
+            resolved = {key: self._resolve(key, value) for key, value in self._roles.get(name, {}).items()}
+            self._resolved[name] = resolved
+        return resolved
+
+
+    def _resolve(self, key: str, value: Any) -> Any:
+        if key in _COLOR_KEYS:
+            return Color.parse(value) if value is not None else None
+        if key == "font" and isinstance(value, str):
+            return Font.by_name(value)
+        if key == "style" and isinstance(value, str):
+            return Style.by_name(value)
+        return value
+
+
+    def _plan(self, widget_type: type, role: Optional[str]) -> Tuple[List[Tuple[str, str, Any]], bool]:
+        """
+        Get the (key, widget attribute, value) writes for a widget type and role, cached per pair.
+        """
+        cache_key = (widget_type, role)
+        plan = self._plans.get(cache_key)
+        if plan is None:
+            aliases = {}
+            if role is None:
+                for cls in widget_type.__mro__:
+                    if cls.__name__ in _TYPE_ROLES:
+                        role = _TYPE_ROLES[cls.__name__]
+                        aliases = _TYPE_ALIASES.get(cls.__name__, {})
+                        break
+            else:
+                for cls in widget_type.__mro__:
+                    if cls.__name__ in _TYPE_ALIASES:
+                        aliases = _TYPE_ALIASES[cls.__name__]
+                        break
+            writes = []
+            has_font = False
+            if role is not None:
+                for key, value in self.role(role).items():
+                    attr = aliases.get(key, key)
+                    if not isinstance(getattr(widget_type, attr, None), property):
+                        continue
+                    writes.append((key, attr, value))
+                    has_font = has_font or key in _FONT_KEYS
+            plan = (writes, has_font)
+            self._plans[cache_key] = plan
+        return plan
+
+
+    def apply(self, root: Forms.Control) -> int:
+        """
+        Apply the theme to `root` and all of its descendants.
+
+        Only properties whose value differs are written, through the widgets' public properties.
+        All writes happen in a single batch with layout and painting suspended, and widgets with an
+        `_apply_theme_font` hook rebuild their font once for all the font properties that changed.
+
+        Args:
+            root (Forms.Control): The top of the control tree, usually a window.
+
+        Returns:
+            int: The number of properties that were written.
+        """
+        layout_containers = containers(root)
+        written = 0
+        with suspended(root, layout_containers):
+            stack = [root]
+            while stack:
+                widget = stack.pop()
+                stack.extend(widget.Controls)
+
+                writes, has_font = self._plan(type(widget), getattr(widget, "theme_role", None))
+                fonts: Dict[str, Any] = {}
+                for key, attr, value in writes:
+                    if _same(getattr(widget, attr), value, key):
+                        continue
+                    if key in _FONT_KEYS:
+                        # Collected so the font is rebuilt once below.
+                        fonts[attr] = value
+                    else:
+                        setattr(widget, attr, value)
+                    written += 1
+
+                if has_font and fonts:
+                    apply_font = getattr(widget, "_apply_theme_font", None)
+                    if apply_font is not None:
+                        apply_font(fonts)
+                    else:
+                        for attr, value in fonts.items():
+                            setattr(widget, attr, value)
+        return written
+
+
+
+Theme.LIGHT = Theme("light", {
+    "window": {"background_color": "#F3F3F3"},
+    "box": {"background_color": "#FFFFFF"},
+    "label": {"text_color": "#1E1E1E"},
+    "button": {"background_color": "#E1E1E1", "text_color": "#1E1E1E"},
+    "input": {"background_color": "#FFFFFF", "text_color": "#1E1E1E", "placeholder_color": "#8A8A8A"},
+    "divider": {"color": "#D0D0D0"},
+})
+
+Theme.DARK = Theme("dark", {
+    "window": {"background_color": "#1E1E1E"},
+    "box": {"background_color": "#252526"},
+    "label": {"text_color": "#F0F0F0"},
+    "button": {"background_color": "#3C3C3C", "text_color": "#F0F0F0"},
+    "input": {"background_color": "#2D2D30", "text_color": "#F0F0F0", "placeholder_color": "#9A9A9A"},
+    "divider": {"color": "#3F3F46"},
+})
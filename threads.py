@@ -0,0 +1,315 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+from System import Action
+from System.Threading import ApartmentState, SynchronizationContext, Thread, ThreadStart
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Set
+
+
+class UIThread:
+    """
+    Runs a top-level window on its own STA thread with its own message loop.
+
+    A slow window then only blocks its own thread: the primary window and the other UI threads
+    keep painting and handling input. Controls must only be touched from the thread that created
+    them, so other threads talk to the window through `post`, `invoke` and `send`, which marshal
+    the call onto its thread with BeginInvoke.
+
+    Args:
+        - factory (Callable[[], Forms.Form]): Builds the window. Called on the new thread, so every
+          control of the window is created there.
+        - name (Optional[str]): A unique name to find the thread with `UIThread.get`. Defaults to the window title.
+        - on_message (Optional[Callable[[Any, Optional[str]], None]]): Called on the window's thread with
+          each message passed to `send` and the name of the sender.
+    """
+    _threads: Dict[str, "UIThread"] = {}
+    _lock = threading.RLock()
+
+    def __init__(
+        self,
+        factory: Callable[[], Forms.Form],
+        name: Optional[str] = None,
+        on_message: Optional[Callable[[Any, Optional[str]], None]] = None
+    ):
+        self._factory = factory
+        self.name = name
+        self.on_message = on_message
+        self.window: Optional[Forms.Form] = None
+        self._thread: Optional[Thread] = None
+        self._ready = threading.Event()
+        self._finished = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._owner: Optional[int] = None
+        self._pending: Set[Future] = set()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "posted": 0, "handled": 0, "failed": 0, "messages": 0,
+            "busy_time": 0.0, "max_call_time": 0.0, "total_delay": 0.0, "max_delay": 0.0,
+        }
+
+
+    @classmethod
+    def launch(
+        cls,
+        factory: Callable[[], Forms.Form],
+        name: Optional[str] = None,
+        on_message: Optional[Callable[[Any, Optional[str]], None]] = None
+    ) -> "UIThread":
+        """
+        Create a UI thread and start it. See the class arguments.
+        """
+        return cls(factory, name, on_message).start()
+
+
+    @classmethod
+    def get(cls, name: str) -> Optional["UIThread"]:
+        """
+        Get a running UI thread by name.
+        """
+        with cls._lock:
+            return cls._threads.get(name)
+
+
+    @classmethod
+    def all(cls) -> Dict[str, "UIThread"]:
+        """
+        Get every running UI thread by name.
+        """
+        with cls._lock:
+            return dict(cls._threads)
+
+
+    def start(self, timeout: Optional[float] = 10.0) -> "UIThread":
+        """
+        Start the thread and wait until the window exists and can receive calls.
+
+        Raises:
+            RuntimeError: If the window could not be created.
+        """
+        self._thread = Thread(ThreadStart(self._run))
+        self._thread.SetApartmentState(ApartmentState.STA)
+        self._thread.IsBackground = True
+        if self.name:
+            self._thread.Name = self.name
+        self._thread.Start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("The window did not start in time.")
+        if self._error is not None:
+            raise RuntimeError(f"Error creating the window: {self._error}") from self._error
+        return self
+
+
+    def _run(self):
+        self._owner = threading.get_ident()
+        window = None
+        try:
+            SynchronizationContext.SetSynchronizationContext(Forms.WindowsFormsSynchronizationContext())
+            if self.name:
+                # Claim the name first, so a duplicate doesn't build a window only to throw it away.
+                self._register()
+            window = self._factory()
+            # Create the handle now, so calls can be posted before the window is shown.
+            window.Handle
+            self.window = window
+            if not self.name:
+                self.name = window.Text or f"ui-{self._thread.ManagedThreadId}"
+                self._register()
+        except Exception as e:
+            self._error = e
+            self._unregister()
+            if window is not None and not window.IsDisposed:
+                window.Dispose()
+            self._ready.set()
+            self._finished.set()
+            return
+
+        self._ready.set()
+        try:
+            Forms.Application.Run(window)
+        finally:
+            self._unregister()
+            if not window.IsDisposed:
+                window.Dispose()
+            with self._stats_lock:
+                self._finished.set()
+                pending = list(self._pending)
+                self._pending.clear()
+            # Calls queued after the loop ended will never run, so don't leave their callers waiting.
+            for future in pending:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RuntimeError(f"The window '{self.name}' closed before the call ran."))
+
+
+    def _register(self):
+        with UIThread._lock:
+            if self.name in UIThread._threads:
+                raise ValueError(f"A UI thread named '{self.name}' is already running.")
+            UIThread._threads[self.name] = self
+
+
+    def _unregister(self):
+        with UIThread._lock:
+            if self.name and UIThread._threads.get(self.name) is self:
+                del UIThread._threads[self.name]
+
+
+    def _on_own_thread(self) -> bool:
+        return self._owner is not None and threading.get_ident() == self._owner
+
+
+    @property
+    def alive(self) -> bool:
+        """
+        Whether the window's message loop is still running.
+        """
+        return self._ready.is_set() and not self._finished.is_set() and self._error is None
+
+
+    def post(self, callback: Callable, *args) -> Future:
+        """
+        Run `callback(*args)` on the window's thread and return immediately.
+
+        Returns:
+            Future: Resolves with the callback's result or exception.
+
+        Raises:
+            RuntimeError: If the window is closed.
+        """
+        if not self.alive:
+            raise RuntimeError(f"The window '{self.name}' is not running.")
+        future = Future()
+        posted = time.perf_counter()
+
+        def run():
+            with self._stats_lock:
+                self._pending.discard(future)
+            if not future.set_running_or_notify_cancel():
+                return
+            start = time.perf_counter()
+            try:
+                future.set_result(callback(*args))
+                failed = False
+            except BaseException as e:
+                future.set_exception(e)
+                failed = True
+            self._record(start - posted, time.perf_counter() - start, failed)
+
+        with self._stats_lock:
+            if self._finished.is_set():
+                raise RuntimeError(f"The window '{self.name}' is not running.")
+            self._stats["posted"] += 1
+            self._pending.add(future)
+        try:
+            self.window.BeginInvoke(Action(run))
+        except Exception:
+            with self._stats_lock:
+                self._pending.discard(future)
+            raise
+        return future
+
+
+    def invoke(self, callback: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run `callback(*args)` on the window's thread and wait for its result.
+        Called from the window's own thread, the callback runs directly.
+        """
+        if self._on_own_thread():
+            return callback(*args)
+        return self.post(callback, *args).result(timeout)
+
+
+    def send(self, message: Any, sender: Optional[str] = None) -> Future:
+        """
+        Deliver a message to the window's `on_message` handler on its own thread.
+
+        Args:
+            - message (Any): The message. Prefer immutable values, the receiver runs concurrently with the sender.
+            - sender (Optional[str]): The name of the sending window, passed to the handler.
+        """
+        def deliver():
+            with self._stats_lock:
+                self._stats["messages"] += 1
+            if self.on_message is not None:
+                self.on_message(message, sender)
+        return self.post(deliver)
+
+
+    @classmethod
+    def broadcast(cls, message: Any, sender: Optional[str] = None):
+        """
+        Send a message to every running UI thread except the sender.
+        """
+        for name, ui_thread in cls.all().items():
+            if name != sender and ui_thread.alive:
+                ui_thread.send(message, sender)
+
+
+    def close(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Close the window from any thread, ending its message loop.
+
+        Called from the window's own thread, the window is closed directly and `wait` is ignored:
+        the loop can only finish after the caller returns to it.
+
+        Returns:
+            bool: Whether the thread has finished.
+        """
+        if self._on_own_thread():
+            if self.alive:
+                self.window.Close()
+            return self._finished.is_set()
+        if self.alive:
+            self.post(self.window.Close)
+        if wait:
+            return self._finished.wait(timeout)
+        return self._finished.is_set()
+
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the window is closed. Returns whether it closed within `timeout` seconds.
+        """
+        return self._finished.wait(timeout)
+
+
+    def _record(self, delay: float, elapsed: float, failed: bool):
+        with self._stats_lock:
+            stats = self._stats
+            stats["handled"] += 1
+            if failed:
+                stats["failed"] += 1
+            stats["busy_time"] += elapsed
+            stats["max_call_time"] = max(stats["max_call_time"], elapsed)
+            stats["total_delay"] += delay
+            stats["max_delay"] = max(stats["max_delay"], delay)
+
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the call metrics of this thread.
+
+        Returns:
+            Dict[str, Any]: The number of "posted", "handled" and "failed" calls and of delivered "messages",
+            the total "busy_time" and "max_call_time" spent in calls, the "mean_delay" and "max_delay"
+            between posting a call and its start (a growing delay means the window's loop is stalled),
+            all in seconds, and whether the thread is "alive".
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total_delay = stats.pop("total_delay")
+        stats["mean_delay"] = total_delay / stats["handled"] if stats["handled"] else 0.0
+        stats["alive"] = self.alive
+        return stats
+
+
+    @classmethod
+    def all_metrics(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics of every running UI thread by name.
+        """
+        return {name: ui_thread.metrics() for name, ui_thread in cls.all().items()}
@@ -0,0 +1,158 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+from threading import RLock
+from typing import Dict, Optional
+
+
+class ToolTipManager:
+    """
+    Shares one Forms.ToolTip per top-level window between all the controls that set a popup.
+
+    The native ToolTip is only created the first time a control of that window sets a popup,
+    and it is disposed together with the window. Controls that are not attached to a window yet
+    get their popup once their handle is created or their parent changes. The window is resolved
+    again whenever the mouse enters the control, so a popup also follows a control whose container
+    was moved to another window.
+    """
+    _tooltips: Dict[Forms.Form, Forms.ToolTip] = {}
+    # Popup text of every control that has one, and the window whose ToolTip shows it.
+    _texts: Dict[Forms.Control, str] = {}
+    _owners: Dict[Forms.Control, Forms.Form] = {}
+    _lock = RLock()
+
+    @classmethod
+    def set(cls, control: Forms.Control, text: Optional[str]):
+        """
+        Set or remove the popup text of a control.
+
+        Args:
+            control (Forms.Control): The control that shows the popup.
+            text (Optional[str]): The popup text. If empty or None, the popup is removed.
+        """
+        if not text:
+            cls.remove(control)
+            return
+        with cls._lock:
+            if control not in cls._texts:
+                control.HandleCreated += cls._handle_control_changed
+                control.ParentChanged += cls._handle_control_changed
+                control.MouseEnter += cls._handle_control_entered
+                control.Disposed += cls._handle_control_disposed
+            cls._texts[control] = text
+        cls._attach(control)
+
+
+    @classmethod
+    def remove(cls, control: Forms.Control):
+        """
+        Remove the popup of a control.
+        """
+        with cls._lock:
+            owner = cls._forget(control)
+            tooltip = cls._tooltips.get(owner) if owner is not None else None
+        if tooltip is not None:
+            tooltip.SetToolTip(control, None)
+
+
+    @classmethod
+    def get(cls, form: Forms.Form) -> Optional[Forms.ToolTip]:
+        """
+        Get the shared ToolTip of a window, if one has been created.
+        """
+        with cls._lock:
+            return cls._tooltips.get(form)
+
+
+    @classmethod
+    def count(cls) -> int:
+        """
+        Get the number of native ToolTip objects currently alive.
+        """
+        with cls._lock:
+            return len(cls._tooltips)
+
+
+    @classmethod
+    def _tooltip_for(cls, form: Forms.Form) -> Forms.ToolTip:
+        tooltip = cls._tooltips.get(form)
+        if tooltip is None:
+            tooltip = Forms.ToolTip()
+            cls._tooltips[form] = tooltip
+            form.Disposed += cls._handle_form_disposed
+        return tooltip
+
+
+    @classmethod
+    def _attach(cls, control: Forms.Control):
+        """
+        Register the popup of a control with the ToolTip of its current window, moving it from its previous one.
+        """
+        form = control.FindForm()
+        with cls._lock:
+            text = cls._texts.get(control)
+            if text is None:
+                return
+            previous = cls._owners.get(control)
+            moved = previous is not None and previous != form
+            old_tooltip = cls._tooltips.get(previous) if moved else None
+            if form is None:
+                cls._owners.pop(control, None)
+                tooltip = None
+            else:
+                cls._owners[control] = form
+                tooltip = cls._tooltip_for(form)
+        if old_tooltip is not None:
+            old_tooltip.SetToolTip(control, None)
+        if tooltip is not None:
+            tooltip.SetToolTip(control, text)
+
+
+    @classmethod
+    def _forget(cls, control: Forms.Control) -> Optional[Forms.Form]:
+        """
+        Stop tracking a control. Returns the window whose ToolTip had its popup.
+        """
+        if cls._texts.pop(control, None) is not None:
+            control.HandleCreated -= cls._handle_control_changed
+            control.ParentChanged -= cls._handle_control_changed
+            control.MouseEnter -= cls._handle_control_entered
+            control.Disposed -= cls._handle_control_disposed
+        return cls._owners.pop(control, None)
+
+
+    @classmethod
+    def _handle_control_changed(cls, sender, event):
+        """
+        Follow the control when it is attached to a window or moved to another one.
+        """
+        cls._attach(sender)
+
+
+    @classmethod
+    def _handle_control_entered(cls, sender, event):
+        """
+        Check the window before the popup is shown, in case an ancestor of the control was moved.
+        """
+        with cls._lock:
+            current = cls._owners.get(sender)
+        if current is None or current != sender.FindForm():
+            cls._attach(sender)
+
+
+    @classmethod
+    def _handle_control_disposed(cls, sender, event):
+        with cls._lock:
+            cls._forget(sender)
+
+
+    @classmethod
+    def _handle_form_disposed(cls, sender, event):
+        with cls._lock:
+            tooltip = cls._tooltips.pop(sender, None)
+            for control in [control for control, owner in cls._owners.items() if owner == sender]:
+                del cls._owners[control]
+        if tooltip is not None:
+            tooltip.Dispose()
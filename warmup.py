@@ -0,0 +1,128 @@
+import clr
+clr.AddReference('System.Windows.Forms')
+
+import System.Windows.Forms as Forms
+
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+from . import dispatch
+from .disposal import dispose_tree
+
+
+class Warmup:
+    """
+    Pre-warms the pythonnet bindings of widget classes by creating and disposing throwaway instances.
+
+    The first construction of a wrapper class pays for type binding and JIT compilation.
+    Warming the classes an app will use, behind the splash screen or while the app is idle,
+    moves that cost out of the first paint of real windows.
+
+    Args:
+        - classes (Iterable[type]): The widget classes to warm, e.g. [Label, TextInput, Button, ImageBox].
+        - factories (Optional[Dict[type, Callable[[], object]]]): Callables that build an instance for classes
+          that can't be created without arguments. Other classes are created with no arguments.
+        - measure_warm (bool): Also time a second construction, to report the gain per class.
+    """
+    def __init__(
+        self,
+        classes: Iterable[type],
+        factories: Optional[Dict[type, Callable[[], object]]] = None,
+        measure_warm: bool = True
+    ):
+        self._pending = deque(classes)
+        self._factories = factories or {}
+        self._measure_warm = measure_warm
+        self._scheduled = False
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every class has been warmed.
+        """
+        return not self._pending
+
+
+    def run(self, budget: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Warm the pending classes on the calling thread.
+
+        Args:
+            budget (Optional[float]): Stop after this many seconds, leaving the remaining classes pending.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The timings so far, see `report`.
+        """
+        start = time.perf_counter()
+        while self._pending:
+            if budget is not None and time.perf_counter() - start >= budget:
+                break
+            self._warm(self._pending.popleft())
+        return self.report()
+
+
+    def schedule(self):
+        """
+        Warm the pending classes on the UI thread, one class each time the application goes idle.
+        """
+        if self._scheduled or not self._pending:
+            return
+        self._scheduled = True
+        Forms.Application.Idle += self._on_idle
+
+
+    def _on_idle(self, sender, event):
+        try:
+            if self._pending:
+                self._warm(self._pending.popleft())
+        finally:
+            self._continue()
+
+
+    def _continue(self):
+        if self._pending:
+            # Idle only fires again after a message arrives, so queue one to keep going.
+            dispatch.post(lambda: None)
+        else:
+            Forms.Application.Idle -= self._on_idle
+            self._scheduled = False
+
+
+    def _warm(self, cls: type):
+        factory = self._factories.get(cls, cls)
+        try:
+            timing = {"cold": self._time_instance(factory)}
+            if self._measure_warm:
+                timing["warm"] = self._time_instance(factory)
+        except Exception as e:
+            print(f"Error warming up {cls.__name__}: {e}")
+            return
+        self.timings[cls.__name__] = timing
+
+
+    @staticmethod
+    def _time_instance(factory: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        instance = factory()
+        elapsed = time.perf_counter() - start
+        if isinstance(instance, Forms.Control):
+            # Also releases the fonts, images and event delegates the widget owns.
+            dispose_tree(instance)
+        else:
+            dispose = getattr(instance, "Dispose", None)
+            if dispose is not None:
+                dispose()
+        return elapsed
+
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the warm-up cost per class.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Maps each class name to its "cold" construction time in seconds
+            and, when measured, the "warm" time of a second construction.
+        """
+        return {name: dict(timing) for name, timing in self.timings.items()}
@@ -7,17 +7,20 @@ import System.Drawing as Drawing
 import System.Windows.Forms as Forms
 import System as Sys
 
-from typing import Callable, Optional, Tuple, Type
+from typing import Callable, Dict, Optional, Tuple, Type
 from .color import Color
+from .theme import Theme
+from .cache import PropertyCache
+from .disposal import Disposable, dispose_tree, release_tree
 from .app import App
 
 
-class Window(Forms.Form):
+class Window(Disposable, Forms.Form):
     """
     Args:
         - title (str): The title of the window.
         - size (Tuple[int, int]): The size of the window.
-        - content (Optional[type], None): set the window's content.
+        - content (Optional[type], None): set the window's content, or a callable that builds it on first show.
         - location (Tuple[int, int]): The location of the window.
         - center_screen (bool): Whether to center the window on the screen.
         - background_color (Color): The background color of the window.
@@ -56,7 +59,7 @@ class Window(Forms.Form):
         Args:
             - title (str): The title of the window.
             - size (Tuple[int, int]): The size of the window.
-            - content (Optional[type], None): set the window's content.
+            - content (Optional[type], None): set the window's content, or a callable that builds it on first show.
             - location (Tuple[int, int]): The location of the window.
             - center_screen (bool): Whether to center the window on the screen.
             - background_color (Color): The background color of the window.
@@ -74,7 +77,8 @@ class Window(Forms.Form):
         super().__init__()
         self._title = title
         self._size = Drawing.Size(size[0], size[1])
-        self._content = content
+        self._content = None
+        self._content_factory = None
         self._location = location
         self._center_screen = center_screen
         self._background_color = background_color
@@ -90,6 +94,9 @@ class Window(Forms.Form):
 
         self._dragging = False
         self._drag_start = Drawing.Point(0, 0)
+        self._theme = None
+        self._cache = PropertyCache()
+        self._disposal_report = None
 
         self.Text = self._title
         self.Size = self._size
@@ -105,8 +112,10 @@ class Window(Forms.Form):
         self.MaximizeBox = self._maxmizable
         self.ControlBox = self._closable
 
-        if content:
-            self.Controls.Add(self._content_panel)
+        if isinstance(content, Forms.Control):
+            self.content = content
+        elif callable(content):
+            self._content_factory = content
 
         if center_screen:
             self.StartPosition = Forms.FormStartPosition.CenterScreen
@@ -123,7 +132,11 @@ class Window(Forms.Form):
             self._update_draggable()
 
         self.FormClosing += self._handle_form_closing
+        self.FormClosed += self._handle_form_closed
+        self.Load += self._handle_load
         self.Resize += self._handle_minimize_window
+        self.Resize += self._handle_resize
+        self.Move += self._handle_move
 
     
     @property
@@ -151,7 +164,7 @@ class Window(Forms.Form):
         """
         Get the window's size as a Tuple.
         """
-        return (self.Size.Width, self.Size.Height)
+        return self._cache.get("size", self._read_size)
     
 
     @size.setter
@@ -162,12 +175,14 @@ class Window(Forms.Form):
         Args:
             new_size (Tuple[int, int]): The new size of the window (width, height).
         """
-        self._size = Drawing.Size(new_size[0], new_size[1])
-        self.Size = self._size
+        self._cache.set("size", (new_size[0], new_size[1]), self._write_size, self._read_size)
 
 
     @property
     def content(self) -> Optional[Type]:
+        """
+        Get the window's content. None while a content factory has not been built yet, see `build`.
+        """
         return self._content
     
 
@@ -176,11 +191,40 @@ class Window(Forms.Form):
         # Remove old content if any
         if self._content and self._content in self.Controls:
             self.Controls.Remove(self._content)
+        self._content_factory = None
         # Add new content if provided
         self._content = new_content
         if new_content:
             self.Controls.Add(new_content)
 
+
+    @property
+    def built(self) -> bool:
+        """
+        Whether the content factory, if any, has been built.
+        """
+        return self._content_factory is None
+
+
+    def build(self) -> Optional[Type]:
+        """
+        Build the content from the content factory if that hasn't happened yet.
+
+        Called by `show`. Call it earlier, or queue the window on a `Prebuilder`,
+        to move the cost out of the first show.
+
+        Returns:
+            Optional[Type]: The content.
+        """
+        factory = self._content_factory
+        if factory is not None:
+            self.SuspendLayout()
+            try:
+                self.content = factory()
+            finally:
+                self.ResumeLayout(True)
+        return self._content
+
     
     @property
     def location(self) -> Tuple[int, int]:
@@ -190,7 +234,7 @@ class Window(Forms.Form):
         Returns:
             Tuple[int, int]: The location of the window (x, y).
         """
-        return (self.Location.X, self.Location.Y)
+        return self._cache.get("location", self._read_location)
 
     @location.setter
     def location(self, new_location: Tuple[int, int]):
@@ -211,7 +255,22 @@ class Window(Forms.Form):
         """
         self._location = location  # Update internal location state
         if not self._center_screen:
-            self.Location = Drawing.Point(location[0], location[1])
+            self._cache.set("location", (location[0], location[1]), self._write_location, self._read_location)
+
+
+    def _read_size(self) -> Tuple[int, int]:
+        size = self.Size
+        return (size.Width, size.Height)
+
+    def _write_size(self, size: Tuple[int, int]):
+        self.Size = Drawing.Size(size[0], size[1])
+
+    def _read_location(self) -> Tuple[int, int]:
+        location = self.Location
+        return (location.X, location.Y)
+
+    def _write_location(self, location: Tuple[int, int]):
+        self.Location = Drawing.Point(location[0], location[1])
 
 
     @property
@@ -354,7 +413,7 @@ class Window(Forms.Form):
         """
         Get the callback function to run when the window is closing.
         """
-        return self._on_exit
+        return self._on_close
 
     @on_close.setter
     def on_close(self, handler: Optional[Callable[[Type], bool]]):
@@ -435,6 +494,40 @@ class Window(Forms.Form):
                 e.Cancel = True 
 
 
+    def _handle_load(self, sender, e: Sys.EventArgs):
+        """
+        Build the content when the window is shown through Show() or ShowDialog() directly.
+        """
+        self.build()
+
+
+    def _handle_form_closed(self, sender, e: Forms.FormClosedEventArgs):
+        """
+        Release the resources owned by the window's controls as soon as it is closed,
+        instead of leaving them to the finalizers. WinForms disposes the native controls right after.
+
+        Dialogs are left alone: WinForms doesn't dispose forms shown with ShowDialog, so their fields
+        can be read and they can be shown again. `show_dialog` or the context manager disposes them.
+        """
+        if self.Modal:
+            return
+        self._disposal_report = release_tree(self)
+
+
+    def _handle_resize(self, sender, e: Sys.EventArgs):
+        """
+        Mark the cached size as dirty when the native window is resized.
+        """
+        self._cache.invalidate("size")
+
+
+    def _handle_move(self, sender, e: Sys.EventArgs):
+        """
+        Mark the cached location as dirty when the native window moves.
+        """
+        self._cache.invalidate("location")
+
+
     def _handle_minimize_window(self, sender, e: Sys.EventArgs):
         """
         Handle the Resize event to check if the window is minimized.
@@ -444,6 +537,28 @@ class Window(Forms.Form):
                 self._on_minimize()
 
 
+    def apply_theme(self, theme: Theme) -> int:
+        """
+        Restyle the window and all of its controls with a theme in a single batch.
+
+        Args:
+            theme (Theme): The theme to apply.
+
+        Returns:
+            int: The number of properties that changed.
+        """
+        self._theme = theme
+        return theme.apply(self)
+
+
+    @property
+    def theme(self) -> Optional[Theme]:
+        """
+        Get the theme last applied to the window.
+        """
+        return self._theme
+
+
     def activate(self):
         """
         Set as current window
@@ -459,13 +574,62 @@ class Window(Forms.Form):
 
     def show(self):
         """
-        Show the window.
+        Show the window, building its content first if needed.
         """
+        self.build()
         self.Show()
 
 
-    def close(self):
+    def show_dialog(self, owner: Optional[Forms.IWin32Window] = None, dispose: bool = False) -> Forms.DialogResult:
+        """
+        Show the window as a modal dialog, building its content first if needed.
+
+            with Window(title="Settings", content=settings_panel) as dialog:
+                if dialog.show_dialog() == Forms.DialogResult.OK:
+                    save(settings_panel)
+
+        Args:
+            - owner (Optional[Forms.IWin32Window]): The window that owns the dialog.
+            - dispose (bool): Dispose the dialog once it closes. Leave it False to read its fields or show it again.
+
+        Returns:
+            Forms.DialogResult: The result of the dialog.
+        """
+        self.build()
+        try:
+            return self.ShowDialog(owner) if owner is not None else self.ShowDialog()
+        finally:
+            if dispose:
+                self.dispose()
+
+
+    def close(self) -> Optional[Dict[str, int]]:
+        """
+        Close the window and release its controls and the resources they own.
+        A dialog keeps them until it is disposed, see `show_dialog`.
+
+        Returns:
+            Optional[Dict[str, int]]: What was released (see `disposal_report`), or None if closing was cancelled
+            or the window is a dialog.
+        """
+        self.Close()
+        return self._disposal_report
+
+
+    @property
+    def disposal_report(self) -> Optional[Dict[str, int]]:
+        """
+        Get what was released when the window closed: the number of "controls", detached "delegates"
+        and released resources by type name (Font, Bitmap, SolidBrush, ...). None while the window is open.
+        """
+        return self._disposal_report
+
+
+    def dispose(self) -> Dict[str, int]:
         """
-        Close the window.
+        Dispose the window, its controls and the resources they own without closing it first.
         """
-        self.Close()
\ No newline at end of file
+        report = dispose_tree(self)
+        if self._disposal_report is None:
+            self._disposal_report = report
+        return self._disposal_report